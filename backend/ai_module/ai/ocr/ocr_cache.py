@@ -0,0 +1,136 @@
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512MB
+_HASH_CHUNK = 1024 * 1024
+
+
+# ======================================================
+# 해시 키
+# ======================================================
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def page_cache_key(image_path):
+    """렌더링된 페이지 이미지 바이트 기준 키"""
+    return "page-" + file_sha256(image_path)
+
+
+def pdf_cache_key(pdf_path, dpi):
+    """PDF 전체 + DPI 기준 키 (DPI가 다르면 OCR 결과도 다름)"""
+    return f"pdf-{file_sha256(pdf_path)}-{dpi}"
+
+
+# ======================================================
+# OCR 결과 캐시 (디스크, 크기 기반 LRU)
+# ======================================================
+class OCRCache:
+    """
+    OCR 원본 응답(images 리스트)을 디스크에 JSON으로 저장하는 캐시
+
+    - 키: page_cache_key / pdf_cache_key (내용 해시라 재업로드도 그대로 적중)
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴(mtime) 항목부터 삭제
+    - 적중 시 mtime을 갱신해서 LRU 순서 유지
+    - 여러 OCR 스레드에서 동시에 써도 됨
+    - 적중/미스는 페이지 키(hits / misses)와 PDF 키(pdf_hits / pdf_misses)를 따로 셈
+      (PDF 미스 후 페이지 조회가 이어지므로 합치면 문서마다 미스가 1번 더 잡힘)
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.pdf_hits = 0
+        self.pdf_misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._total_bytes = sum(size for _, _, size in self._entries())
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, st.st_mtime, st.st_size
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                images = json.load(f)
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            self._count(key, hit=False)
+            return None
+
+        self._count(key, hit=True)
+        return images
+
+    def _count(self, key, hit):
+        attr = "hits" if hit else "misses"
+        if key.startswith("pdf-"):
+            attr = "pdf_" + attr
+
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+    def put(self, key, images):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # 임시 파일에 쓰고 교체 → 읽는 쪽이 반쯤 쓰인 파일을 보지 않음
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(images, f, ensure_ascii=False)
+
+        with self._lock:
+            try:
+                self._total_bytes -= os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, path)
+            self._total_bytes += os.path.getsize(path)
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        for path, _, size in sorted(self._entries(), key=lambda e: e[1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            self._total_bytes -= size
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "pdf_hits": self.pdf_hits,
+                "pdf_misses": self.pdf_misses,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -1,40 +1,156 @@
 import time
 import json
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from ai.ocr.ocr_cache import page_cache_key
+
+
+# (connect, read) 초 단위 — 페이지 1장 OCR 기준
+DEFAULT_TIMEOUT = (5, 60)
+DEFAULT_MAX_WORKERS = 4
 
 
 # ======================================================
-# OCR API 호출
+# HTTP 세션 (keep-alive 커넥션 풀)
 # ======================================================
-def process_multiple_images(image_paths, api_url, secret_key):
-    all_images = []
+def create_ocr_session(pool_size=DEFAULT_MAX_WORKERS):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
+def build_ocr_request_json(page_idx):
+    return {
+        "version": "V2",
+        # 동시 요청끼리 requestId가 겹치지 않도록 uuid 사용
+        "requestId": uuid.uuid4().hex,
+        "timestamp": int(time.time() * 1000),
+        "enableTableDetection": True,
+        "images": [
+            {
+                "format": "jpg",
+                "name": f"page_{page_idx+1}"
+            }
+        ]
+    }
+
+
+def request_page_ocr(session, image_path, page_idx, api_url, secret_key, timeout=DEFAULT_TIMEOUT):
     headers = {"X-OCR-SECRET": secret_key}
+    request_json = build_ocr_request_json(page_idx)
+
+    with open(image_path, "rb") as f:
+        response = session.post(
+            api_url,
+            headers=headers,
+            data={"message": json.dumps(request_json)},
+            files={"file": f},
+            timeout=timeout
+        )
+
+    response.raise_for_status()
+    return response.json().get("images", [])
+
+
+def request_page_ocr_cached(cache, session, image_path, page_idx, api_url, secret_key, timeout=DEFAULT_TIMEOUT):
+    """페이지 이미지 해시로 캐시를 먼저 조회하고, 없을 때만 OCR API 호출"""
+    if cache is None:
+        return request_page_ocr(session, image_path, page_idx, api_url, secret_key, timeout)
+
+    key = page_cache_key(image_path)
+    images = cache.get(key)
+    if images is None:
+        images = request_page_ocr(session, image_path, page_idx, api_url, secret_key, timeout)
+        cache.put(key, images)
+        return images
 
-    for idx, image_path in enumerate(image_paths):
-        request_json = {
-            "version": "V2",
-            "requestId": str(time.time()),
-            "timestamp": int(time.time() * 1000),
-            "enableTableDetection": True,
-            "images": [
-                {
-                    "format": "jpg",
-                    "name": f"page_{idx+1}"
-                }
-            ]
-        }
-
-        with open(image_path, "rb") as f:
-            response = requests.post(
-                api_url,
-                headers=headers,
-                data={"message": json.dumps(request_json)},
-                files={"file": f}
-            )
-
-        response.raise_for_status()
-        result = response.json()
-        all_images.extend(result.get("images", []))
+    # 같은 페이지가 다른 문서/위치에서 올라온 경우 이름만 현재 위치로 맞춤
+    for image in images:
+        image["name"] = f"page_{page_idx+1}"
+    return images
+
+
+# ======================================================
+# OCR API 호출
+# ======================================================
+def iter_ocr_pages(
+    image_paths,
+    api_url,
+    secret_key,
+    max_workers=1,
+    timeout=DEFAULT_TIMEOUT,
+    session=None,
+    cache=None,
+):
+    """
+    페이지 이미지를 하나씩 OCR 요청하고, 페이지 순서대로 결과(images 리스트)를 yield
+
+    - image_paths는 제너레이터여도 됨: 대기 중인 요청이 max_workers + 1개를
+      넘지 않도록 다음 경로를 필요할 때만 꺼내므로, 앞 페이지가 OCR 중일 때
+      다음 페이지가 렌더링되고 렌더링이 OCR보다 크게 앞서가지 않음
+    - cache(OCRCache)가 주어지면 캐시에 없는 페이지만 OCR API 호출
+    """
+    owns_session = session is None
+    if owns_session:
+        session = create_ocr_session(pool_size=max(1, max_workers))
+
+    try:
+        if max_workers <= 1:
+            for idx, image_path in enumerate(image_paths):
+                yield request_page_ocr_cached(
+                    cache, session, image_path, idx, api_url, secret_key, timeout=timeout
+                )
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for idx, image_path in enumerate(image_paths):
+                pending.append(executor.submit(
+                    request_page_ocr_cached,
+                    cache, session, image_path, idx, api_url, secret_key, timeout
+                ))
+                if len(pending) > max_workers:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+    finally:
+        if owns_session:
+            session.close()
+
+
+def process_multiple_images(
+    image_paths,
+    api_url,
+    secret_key,
+    max_workers=1,
+    timeout=DEFAULT_TIMEOUT,
+    session=None,
+    cache=None,
+):
+    """
+    페이지 이미지들을 OCR API로 전송
+
+    - max_workers > 1 이면 페이지를 동시에 요청 (커넥션 풀 재사용)
+    - 결과는 항상 원래 페이지 순서대로 합쳐짐 (page_index 보존)
+    """
+    all_images = []
+    for images in iter_ocr_pages(
+        image_paths,
+        api_url,
+        secret_key,
+        max_workers=max_workers,
+        timeout=timeout,
+        session=session,
+        cache=cache,
+    ):
+        all_images.extend(images)
 
     return {"images": all_images}
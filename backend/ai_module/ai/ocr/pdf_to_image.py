@@ -1,20 +1,56 @@
 
 import os
-from pdf2image import convert_from_path
+import tempfile
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+
+DEFAULT_DPI = 300
+DEFAULT_WINDOW = 1
+
+
+def make_job_dir(prefix="life_record_"):
+    """작업(job)별 임시 디렉토리 — 동시 작업끼리 page 파일이 섞이지 않도록"""
+    return tempfile.mkdtemp(prefix=prefix)
 
 
 # ======================================================
-# PDF → Image
+# PDF → Image (스트리밍)
 # ======================================================
-def pdf_to_images(pdf_path, output_dir="pages", dpi=300):
+def iter_pdf_pages(pdf_path, output_dir, dpi=DEFAULT_DPI, window=DEFAULT_WINDOW):
+    """
+    PDF를 window 페이지씩 렌더링해서 이미지 경로를 순서대로 yield
+
+    - pdftoppm이 output_dir에 바로 JPEG를 쓰고 경로만 돌려받으므로
+      PIL 이미지를 메모리에 올리지 않음
+    - 다음 window는 소비자가 다음 페이지를 요청할 때 렌더링됨
+    """
     os.makedirs(output_dir, exist_ok=True)
 
-    images = convert_from_path(pdf_path, dpi=dpi)
+    page_count = pdfinfo_from_path(pdf_path)["Pages"]
+    window = max(1, window)
+
+    for first_page in range(1, page_count + 1, window):
+        last_page = min(first_page + window - 1, page_count)
+
+        # window마다 접두어를 달리해야 이전 window 파일이 다시 잡히지 않음
+        paths = convert_from_path(
+            pdf_path,
+            dpi=dpi,
+            first_page=first_page,
+            last_page=last_page,
+            output_folder=output_dir,
+            output_file=f"page_{first_page:04d}",
+            fmt="jpeg",
+            paths_only=True,
+        )
+        for path in paths:
+            yield path
+
 
-    image_paths = []
-    for i, img in enumerate(images):
-        path = os.path.join(output_dir, f"page_{i+1}.jpg")
-        img.save(path, "JPEG")
-        image_paths.append(path)
+def pdf_to_images(pdf_path, output_dir, dpi=DEFAULT_DPI, window=DEFAULT_WINDOW):
+    """
+    PDF 전체 → 이미지 경로 리스트
 
-    return image_paths
+    - output_dir는 호출자가 만들고 지움 (예: make_job_dir() 후 shutil.rmtree)
+    """
+    return list(iter_pdf_pages(pdf_path, output_dir, dpi=dpi, window=window))
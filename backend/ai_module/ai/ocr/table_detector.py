@@ -1,100 +1,105 @@
 
-from ai.ocr.text_extractor import extract_page_texts_with_position, extract_table_text, get_table_top_y
 from ai.parsing.table_classifier import is_sebuneung_table, is_overall_opinion_table
+from ai.utils.columnar_page import ColumnarPage
+from ai.utils.constants import TABLE_TITLE_CANDIDATES
+from ai.utils.keyword_matcher import compile_keyword_pattern
+from ai.utils.table_utils import IndexedTable
 
 
-TABLE_TITLE_CANDIDATES = [
-    "출결상황",
-    "창의적체험활동상황",
-    "봉사활동실적"
-]
+# 표 위에서 확인할 가장 가까운 필드 수
+TITLE_LOOKUP_FIELDS = 3
+
+# 후보 여러 개가 함께 나오면 TABLE_TITLE_CANDIDATES 순서가 앞선 제목 우선
+_TITLE_PRIORITY = {key: i for i, key in enumerate(TABLE_TITLE_CANDIDATES)}
+
 
 def match_table_title(text):
     if not text:
         return ""
-    for key in TABLE_TITLE_CANDIDATES:
-        if key in text:
-            return key
-    return ""
-
-def extract_tables_with_fixed_title(ocr_results):
-    output = {"pages": []}
-
-    for page_idx, image in enumerate(ocr_results.get("images", [])):
-        page_texts = extract_page_texts_with_position(image)
-        tables = image.get("tables", [])
-
-        page_info = {
-            "page_index": page_idx + 1,
-            "tables": []
-        }
-
-        for idx, table in enumerate(tables):
-
-            # ======================================================
-            # 🔥 1️⃣ 세부능력특기사항 전용 탐지 (여기!!)
-            # ======================================================
-            if is_sebuneung_table(table):
-                page_info["tables"].append({
-                    "table_index": idx + 1,
-                    "table_title": "세부능력특기사항",
-                    "table_text": extract_table_text(table),
-                    "raw_table": table
-                })
-                continue   
-            # ======================================================
-            # 🔥 1️⃣-2 행동특성종합의견 전용 탐지
-            # ======================================================
-            if is_overall_opinion_table(table):
-                page_info["tables"].append({
-                    "table_index": idx + 1,
-                    "table_title": "행동특성및종합의견",
-                    "table_text": extract_table_text(table),
-                    "raw_table": table
-                })
-                continue   
-
-            # ======================================================
-            # 2️⃣ 일반 표 제목 탐지 로직
-            # ======================================================    
-            table_top_y = get_table_top_y(table)
-
-            texts = []
-            for cell in table.get("cells", []):
-                for line in cell.get("cellTextLines", []):
-                    for w in line.get("cellWords", []):
-                        t = w.get("inferText", "").strip()
-                        if t:
-                            texts.append(t)
-
-            table_text = " ".join(texts)
-
-            table_title = determine_table_title(
-                page_texts,
-                table_top_y,
-                table_text
-            )
-
+    found = compile_keyword_pattern(frozenset(TABLE_TITLE_CANDIDATES)).findall(text)
+    if not found:
+        return ""
+    return min(found, key=_TITLE_PRIORITY.__getitem__)
+
+def extract_page_tables(image, page_index):
+    """
+    OCR 결과 한 페이지(image)의 표 제목 탐지/분류
+    - 페이지 OCR 결과가 도착하는 즉시 처리할 수 있도록 페이지 단위로 분리
+    - 페이지를 ColumnarPage로 한 번만 순회 → 표 인덱스/제목 후보 y 모두 열 배열에서 계산
+    - 표마다 IndexedTable을 한 번 만들어 "indexed"에 담음 → 이후 파서는 재순회 없이 사용
+    """
+    page = ColumnarPage(image)
+    tables = image.get("tables", [])
+
+    page_info = {
+        "page_index": page_index,
+        "tables": []
+    }
+
+    for idx, table in enumerate(tables):
+        indexed = IndexedTable.from_page(page, idx, table)
+
+        # ======================================================
+        # 🔥 1️⃣ 세부능력특기사항 전용 탐지 (여기!!)
+        # ======================================================
+        if is_sebuneung_table(indexed):
+            page_info["tables"].append({
+                "table_index": idx + 1,
+                "table_title": "세부능력특기사항",
+                "table_text": indexed.text,
+                "raw_table": table,
+                "indexed": indexed
+            })
+            continue   
+        # ======================================================
+        # 🔥 1️⃣-2 행동특성종합의견 전용 탐지
+        # ======================================================
+        if is_overall_opinion_table(indexed):
             page_info["tables"].append({
                 "table_index": idx + 1,
-                "table_title": table_title,
-                "table_text": table_text,
-                "raw_table": table
+                "table_title": "행동특성및종합의견",
+                "table_text": indexed.text,
+                "raw_table": table,
+                "indexed": indexed
             })
+            continue   
 
+        # ======================================================
+        # 2️⃣ 일반 표 제목 탐지 로직
+        # ======================================================    
+        table_top_y = indexed.min_y
+        table_text = indexed.text
 
-        output["pages"].append(page_info)
+        table_title = determine_table_title(
+            page,
+            table_top_y,
+            table_text
+        )
 
-    return output
+        page_info["tables"].append({
+            "table_index": idx + 1,
+            "table_title": table_title,
+            "table_text": table_text,
+            "raw_table": table,
+            "indexed": indexed
+        })
 
+    return page_info
+
+
+def extract_tables_with_fixed_title(ocr_results):
+    output = {"pages": []}
+
+    for page_idx, image in enumerate(ocr_results.get("images", [])):
+        output["pages"].append(extract_page_tables(image, page_idx + 1))
+
+    return output
 
-def determine_table_title(page_texts, table_top_y, table_text):
-    # 1️⃣ 표 위 텍스트
-    candidates = [t for t in page_texts if t["y"] < table_top_y]
-    candidates.sort(key=lambda x: table_top_y - x["y"])
 
-    for c in candidates[:3]:
-        title = match_table_title(c["text"])
+def determine_table_title(page, table_top_y, table_text):
+    # 1️⃣ 표 위 텍스트 (y 정렬 필드에서 이분 탐색 → 가장 가까운 것부터)
+    for i in page.fields_above(table_top_y, TITLE_LOOKUP_FIELDS):
+        title = match_table_title(page.field_text(i))
         if title:
             return title
 
@@ -1,5 +1,8 @@
 
 
+from ai.utils.table_utils import index_table
+
+
 # ======================================================
 # 표 제목 판별 로직 
 # ======================================================
@@ -18,18 +21,7 @@ def extract_page_texts_with_position(image):
 
 
 def get_table_top_y(table):
-    ys = []
-    for cell in table.get("cells", []):
-        for v in cell["boundingPoly"]["vertices"]:
-            ys.append(v["y"])
-    return min(ys) if ys else None
+    return index_table(table).min_y
 
 def extract_table_text(table):
-    texts = []
-    for cell in table.get("cells", []):
-        for line in cell.get("cellTextLines", []):
-            for w in line.get("cellWords", []):
-                t = w.get("inferText", "").strip()
-                if t:
-                    texts.append(t)
-    return " ".join(texts)
+    return index_table(table).text
@@ -1,16 +1,129 @@
-import pandas as pd
 from ai.parsing.table_classifier import is_attendance_table
+from ai.utils.table_utils import IndexedTable, table_entry_index
 
 
-def make_attendance_summary_json(numeric_df):
+# 합계에서 제외하는 열 (숫자가 아니거나 횟수가 아님)
+NON_COUNT_COLUMNS = ["학년", "수업일수", "특기사항"]
+
+
+def to_int(text):
+    try:
+        return int(text.strip())
+    except (TypeError, ValueError):
+        return 0
+
+
+def build_attendance_grid(indexed):
+    """
+    출결표 셀 → 2차원 격자 (전체 표 기준 행/열 정렬, 빈 칸은 "")
+    - 행/열 번호는 표에 실제로 나온 값만 사용 (빠진 열은 만들지 않음)
+    """
+    row_ids = sorted(set(indexed.cell_rows))
+    col_ids = sorted(set(indexed.cell_cols))
+    row_pos = {r: i for i, r in enumerate(row_ids)}
+    col_pos = {c: i for i, c in enumerate(col_ids)}
+
+    grid = [[""] * len(col_ids) for _ in row_ids]
+    seen = set()
+    for r, c, text in zip(indexed.cell_rows, indexed.cell_cols, indexed.cell_texts):
+        if (r, c) in seen:
+            raise ValueError(f"출결표 셀 중복: row={r}, col={c}")
+        seen.add((r, c))
+        grid[row_pos[r]][col_pos[c]] = text.strip() if text else ""
+
+    return grid
+
+
+def merge_attendance_headers(header1, header2):
+    """
+    2단 병합 헤더 → 열 이름
+    - 1행의 빈 칸은 왼쪽 값으로 채움 (결석일수 | | → 결석일수 | 결석일수 | 결석일수)
+    - "결석일수_질병" 처럼 1행_2행, 한쪽만 있으면 그 값
+    """
+    header1 = list(header1)
+
+    last = ""
+    for i in range(len(header1)):
+        if header1[i] == "":
+            header1[i] = last
+        else:
+            last = header1[i]
+
+    return [
+        f"{h1}_{h2}" if h1 and h2 else h1 or h2
+        for h1, h2 in zip(header1, header2)
+    ]
+
+
+def parse_attendance_table(indexed):
+    """
+    Returns:
+        (headers, rows) — rows는 헤더 2줄을 뺀 데이터 행(문자열)
+    """
+    grid = build_attendance_grid(indexed)
+    headers = merge_attendance_headers(grid[0], grid[1])
+    return headers, grid[2:]
+
+
+def summarize_attendance(headers, rows):
+    """횟수 열별 전체 학년 합계 (같은 이름의 열은 합산)"""
     summary = {}
-    for col in numeric_df.columns:
-        if col in ["학년", "수업일수", "특기사항"]:
+    for c, col in enumerate(headers):
+        if col in NON_COUNT_COLUMNS:
             continue
-        summary[col] = int(numeric_df[col].sum())
+        summary[col] = summary.get(col, 0) + sum(to_int(row[c]) for row in rows)
     return summary
 
 
+def attendance_rows_by_grade(headers, rows):
+    """
+    학년별 출결 행
+    - 학년/특기사항은 원문, 나머지는 정수
+    """
+    results = []
+    for row in rows:
+        record = {}
+        for col, value in zip(headers, row):
+            if col in ("학년", "특기사항"):
+                record[col] = value
+            else:
+                record[col] = record.get(col, 0) + to_int(value)
+        results.append(record)
+    return results
+
+
+def summarize_attendance_table(indexed):
+    return summarize_attendance(*parse_attendance_table(indexed))
+
+
+def find_attendance_table(tables_with_title):
+    for page in tables_with_title.get("pages", []):
+        for t in page.get("tables", []):
+            indexed = table_entry_index(t)
+            if is_attendance_table(indexed):
+                return indexed
+    return None
+
+
+def extract_attendance_from_tables(tables_with_title):
+    """
+    표 제목 분류 결과(IndexedTable 포함)에서 출결표 탐색
+
+    Returns:
+        (요약 JSON, 학년별 행 리스트) — 출결표가 없으면 ({}, [])
+    """
+    indexed = find_attendance_table(tables_with_title)
+    if indexed is None:
+        return {}, []  # 출결표 없음
+
+    headers, rows = parse_attendance_table(indexed)
+    return summarize_attendance(headers, rows), attendance_rows_by_grade(headers, rows)
+
+
+def extract_attendance_summary_from_tables(tables_with_title):
+    return extract_attendance_from_tables(tables_with_title)[0]
+
+
 def extract_attendance_summary_from_ocr(ocr_result):
     """
     OCR 원본에서 출결표 자동 탐색 → 요약 JSON 반환
@@ -18,51 +131,8 @@ def extract_attendance_summary_from_ocr(ocr_result):
     for image in ocr_result.get("images", []):
         tables = image.get("tables", [])
         for table in tables:
-            if not is_attendance_table(table):
-                continue
-
-            # 셀 파싱
-            data = []
-            for cell in table["cells"]:
-                row = cell.get("rowIndex")
-                col = cell.get("columnIndex")
-                texts = []
-                for line in cell.get("cellTextLines", []):
-                    words = [w.get("inferText", "") for w in line.get("cellWords", [])]
-                    texts.append(" ".join(words))
-                text = " ".join(texts).strip()
-                data.append((row, col, text))
-
-            df = pd.DataFrame(data, columns=["row", "col", "text"])
-            pivot = df.pivot(index="row", columns="col", values="text").fillna("")
-            pivot.reset_index(drop=True, inplace=True)
-
-            # 헤더 병합
-            header1 = pivot.iloc[0].tolist()
-            header2 = pivot.iloc[1].tolist()
-
-            last = ""
-            for i in range(len(header1)):
-                if header1[i] == "":
-                    header1[i] = last
-                else:
-                    last = header1[i]
-
-            headers = []
-            for h1, h2 in zip(header1, header2):
-                headers.append(f"{h1}_{h2}" if h1 and h2 else h1 or h2)
-
-            data_df = pivot.iloc[2:].copy()
-            data_df.columns = headers
-            data_df.reset_index(drop=True, inplace=True)
-
-            def to_int(x):
-                try:
-                    return int(str(x).strip())
-                except:
-                    return 0
-
-            numeric_df = data_df.applymap(to_int)
-            return make_attendance_summary_json(numeric_df)
+            indexed = IndexedTable(table)
+            if is_attendance_table(indexed):
+                return summarize_attendance_table(indexed)
 
     return {}  # 출결표 없음
@@ -2,12 +2,11 @@ import re
 from collections import defaultdict
 
 from ai.parsing.table_classifier import is_grade_table
-from ai.utils.table_utils import raw_table_to_matrix
+from ai.utils.table_utils import index_table, table_entry_index
 
 
 def classify_grade_table(raw_table):
-    table = raw_table_to_matrix(raw_table)
-    header = " ".join(table[0])
+    header = index_table(raw_table).header
 
     if "석차" in header:
         return "교과학습발달상황"
@@ -35,13 +34,13 @@ def extract_grade_records_from_tables(tables_with_title):
 
     for page in tables_with_title["pages"]:
         for t in page["tables"]:
-            raw_table = t["raw_table"]
+            indexed = table_entry_index(t)
 
-            if not is_grade_table(raw_table):
+            if not is_grade_table(indexed):
                 continue
 
-            table_type = classify_grade_table(raw_table)
-            table = raw_table_to_matrix(raw_table)
+            table_type = classify_grade_table(indexed)
+            table = indexed.matrix
 
             for row in table[1:]:
                 if len(row) < 4:
@@ -1,21 +1,15 @@
-def extract_overall_opinion_text_from_table(table):
-    rows = {}
+from ai.utils.table_utils import index_table, table_entry_index
 
-    for cell in table.get("cells", []):
-        row = cell.get("rowIndex")
-        col = cell.get("columnIndex")
 
-        texts = []
-        for line in cell.get("cellTextLines", []):
-            for w in line.get("cellWords", []):
-                t = w.get("inferText", "").strip()
-                if t:
-                    texts.append(t)
+def extract_overall_opinion_text_from_table(table):
+    indexed = index_table(table)
+    rows = {}
 
-        if not texts:
+    for row, col, text in zip(indexed.cell_rows, indexed.cell_cols, indexed.cell_clean):
+        if not text:
             continue
 
-        rows.setdefault(row, []).append((col, " ".join(texts)))
+        rows.setdefault(row, []).append((col, text))
 
     sorted_rows = sorted(rows.items(), key=lambda x: x[0])
 
@@ -44,7 +38,7 @@ def merge_all_overall_opinion_text(tables_with_title):
         for t in page["tables"]:
             if t["table_title"] == "행동특성및종합의견":
                 contents.append(
-                    extract_overall_opinion_text_from_table(t["raw_table"])
+                    extract_overall_opinion_text_from_table(table_entry_index(t))
                 )
 
     return " ".join(contents)
@@ -55,8 +49,7 @@ def parse_overall_opinion(tables_with_title):
     for page in tables_with_title["pages"]:
         for t in page["tables"]:
             if t["table_title"] == "행동특성및종합의견":
-                table = t["raw_table"]
-                text = extract_overall_opinion_text_from_table(table)
+                text = extract_overall_opinion_text_from_table(table_entry_index(t))
                 if text:
                     texts.append(text)
 
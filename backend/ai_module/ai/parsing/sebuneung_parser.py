@@ -1,20 +1,23 @@
 
 import re
+from bisect import bisect_left
+
+from ai.utils.keyword_matcher import compile_keyword_pattern
+from ai.utils.table_utils import index_table, table_entry_index
 
 
 def extract_sebuneung_text_from_table(table):
     """
     세특 표에서 1행(header)을 제거하고 본문만 텍스트로 반환
     """
+    indexed = index_table(table)
     texts = []
 
-    for cell in table.get("cells", []):
-        if cell.get("rowIndex") == 0:
+    for row, text in zip(indexed.cell_rows, indexed.cell_texts):
+        if row == 0 or text is None:
             continue  # 🔥 헤더 제거
 
-        for line in cell.get("cellTextLines", []):
-            words = [w.get("inferText", "") for w in line.get("cellWords", [])]
-            texts.append(" ".join(words))
+        texts.append(text)
 
     return " ".join(texts).strip()
 
@@ -26,7 +29,7 @@ def merge_all_sebuneung_text(tables_with_title):
         for t in page["tables"]:
             if t["table_title"] == "세부능력특기사항":
                 contents.append(
-                    extract_sebuneung_text_from_table(t["raw_table"])
+                    extract_sebuneung_text_from_table(table_entry_index(t))
                 )
 
     return " ".join(contents)
@@ -41,38 +44,59 @@ def normalize_subject(text):
     return text
 
 
+# '과목명 :' 경계 — 과목 목록(트라이) 중 가장 긴 과목, 없으면 '자율적 교육과정'
+# 위치마다 한 번씩만 검사하는 lookahead라 겹치는 경계도 모두 찾음
+SUBJECT_BOUNDARY_TEMPLATE = (
+    r"(?=(?P<subject>{keywords}|자율적\s*교육과정)\s*[:：]\s*(?P<content>))"
+)
+
+
+def find_subject_boundaries(text, subject_list):
+    """
+    Returns:
+        [(경계 시작 위치, 과목 원문, 내용 시작 위치), ...] — 위치 오름차순
+    """
+    pattern = compile_keyword_pattern(
+        frozenset(subject_list), SUBJECT_BOUNDARY_TEMPLATE
+    )
+    return [
+        (m.start(), m.group("subject"), m.start("content"))
+        for m in pattern.finditer(text)
+    ]
+
+
 def split_sebuneung_by_subject(text, subject_list):
     """
     '과목명 :' 기준으로 세특 내용 분리
+
+    - 경계를 한 번에 찾은 뒤, 각 과목 내용은 내용 시작 이후 첫 경계(또는 텍스트 끝)까지
+    - 30자 미만 내용은 제외
     """
     results = []
 
-    subjects = sorted(subject_list, key=len, reverse=True)
-    subjects_escaped = [re.escape(s) for s in subjects]
-    subjects_escaped.append("자율적\\s*교육과정")
-
-    subject_pattern = "|".join(subjects_escaped)
+    boundaries = find_subject_boundaries(text, subject_list)
+    starts = [b[0] for b in boundaries]
 
-    pattern = re.compile(
-        rf"(?P<subject>{subject_pattern})\s*[:：]\s*(?P<content>.*?)(?=(?:{subject_pattern})\s*[:：]|$)",
-        re.DOTALL
-    )
+    k = 0
+    while k < len(boundaries):
+        _, subject, content_start = boundaries[k]
 
-    for m in pattern.finditer(text):
-        subject = m.group("subject")
-        content = m.group("content").strip()
+        k = bisect_left(starts, content_start, k + 1)
+        content_end = starts[k] if k < len(starts) else len(text)
+        content = text[content_start:content_end].strip()
 
         if len(content) < 30:
             continue
 
-        subject = normalize_subject(m.group("subject"))
+        subject = normalize_subject(subject)
 
         if subject.replace(" ", "") == "자율적교육과정":
             subject = "자율적 교육과정"
 
         results.append({
             "과목": subject,
-            "내용": content
+            "내용": content,
+            "학기": extract_term(content)
         })
 
     return results
@@ -106,7 +130,8 @@ def parse_sebuneung(tables_with_title, subject_list):
     return [
         {
             "과목": r["과목"],
-            "내용": r["내용"]
+            "내용": r["내용"],
+            "학기": r["학기"]
         }
         for r in records
     ]
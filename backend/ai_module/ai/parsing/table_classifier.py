@@ -1,18 +1,15 @@
-from ai.utils.table_utils import raw_table_to_matrix
+from ai.utils.table_utils import index_table
 from ai.utils.constants import (
     ATTENDANCE_KEYWORDS,
     COMMON_GRADE_HEADER,
     VOLUNTEER_TABLE_TITLE
 )
 
-def is_attendance_table(table):
-    texts = []
-    for cell in table.get("cells", []):
-        for line in cell.get("cellTextLines", []):
-            for w in line.get("cellWords", []):
-                texts.append(w.get("inferText", ""))
+# 분류기는 raw_table(dict) / IndexedTable 둘 다 받음
+# (IndexedTable을 넘기면 표를 다시 순회하지 않음)
 
-    joined = " ".join(texts)
+def is_attendance_table(table):
+    joined = index_table(table).text
     hit = sum(k in joined for k in ATTENDANCE_KEYWORDS)
 
     return hit >= 2
@@ -21,42 +18,23 @@ def is_volunteer_table(table_title):
     return table_title == VOLUNTEER_TABLE_TITLE
 
 def is_grade_table(raw_table):
-    table = raw_table_to_matrix(raw_table)
-    if not table:
+    table = index_table(raw_table)
+    if not table.matrix:
         return False
 
-    header = " ".join(table[0])
+    header = table.header
     return all(k in header for k in COMMON_GRADE_HEADER)
 
 def is_sebuneung_table(table):
     """
     1행에 '과목' + '세부능력 및 특기사항' 이 동시에 존재하는지로 판별
     """
-    first_row_texts = []
-
-    for cell in table.get("cells", []):
-        if cell.get("rowIndex") != 0:
-            continue
-
-        for line in cell.get("cellTextLines", []):
-            for w in line.get("cellWords", []):
-                first_row_texts.append(w.get("inferText", ""))
-
-    header = "".join(first_row_texts).replace(" ", "")
+    header = index_table(table).header_nospace
 
     return "과목" in header and "세부능력및특기사항" in header
 
 def is_overall_opinion_table(table):
-    texts = []
-
-    for cell in table.get("cells", []):
-        for line in cell.get("cellTextLines", []):
-            for w in line.get("cellWords", []):
-                t = w.get("inferText", "").replace(" ", "")
-                if t:
-                    texts.append(t)
-
-    joined = "".join(texts)
+    joined = index_table(table).text_nospace
 
     return (
         "행동특성및종합의견" in joined
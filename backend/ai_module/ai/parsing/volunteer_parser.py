@@ -1,8 +1,8 @@
 import re
-from ai.utils.table_utils import raw_table_to_matrix
+from ai.utils.table_utils import index_table, table_entry_index
 
 def extract_volunteer_hours_from_table(raw_table):
-    table = raw_table_to_matrix(raw_table)
+    table = index_table(raw_table).matrix
 
     # 1️⃣ '시간' 컬럼 위치 찾기
     time_col = None
@@ -47,7 +47,7 @@ def extract_volunteer_summary_from_tables(tables_with_title):
             if table.get("table_title") != "봉사활동실적":
                 continue
 
-            hours = extract_volunteer_hours_from_table(table["raw_table"])
+            hours = extract_volunteer_hours_from_table(table_entry_index(table))
             total_hours += hours
 
     return {"total_hours": total_hours}
@@ -1,19 +1,184 @@
 # ai/pipeline/full_pipeline.py
 
+import queue
+import shutil
+import threading
+
+from ai.ocr.ocr_clients import iter_ocr_pages, DEFAULT_MAX_WORKERS
+from ai.ocr.ocr_cache import pdf_cache_key
+from ai.ocr.pdf_to_image import iter_pdf_pages, make_job_dir, DEFAULT_DPI, DEFAULT_WINDOW
+from ai.ocr.table_detector import extract_page_tables
 from ai.pipeline.ocr_pipeline import run_ocr_pipeline
 from ai.pipeline.parsing_pipeline import run_parsing_pipeline
 
 
+def _iter_in_background(iterable, maxsize=1):
+    """
+    iterable을 별도 스레드에서 미리 꺼내 두는 제너레이터
+    - PDF 렌더링이 OCR 대기/페이지 파싱과 겹쳐서 진행되도록 사용
+    - maxsize개 이상 앞서가지 않음 (렌더링된 페이지 수 제한)
+    - close() 시 생산 스레드를 멈추고 종료까지 기다림
+      (생산 스레드가 쓰던 디렉토리를 그 뒤에 지워도 안전)
+    """
+    buffer = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((None, item)):
+                    return
+        except BaseException as e:
+            put((e, None))
+            return
+        put((None, done))
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            error, item = buffer.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _notify_first(iterable, callback):
+    """첫 항목이 나올 때 callback 1회 호출"""
+    notified = False
+    for item in iterable:
+        if not notified:
+            callback()
+            notified = True
+        yield item
+
+
+def _report(on_stage, stage):
+    if on_stage is not None:
+        on_stage(stage)
+
+
+def run_pipelined_ocr_and_tables(
+    pdf_path,
+    ocr_api_url,
+    ocr_secret_key,
+    max_workers=DEFAULT_MAX_WORKERS,
+    dpi=DEFAULT_DPI,
+    window=DEFAULT_WINDOW,
+    cache=None,
+    on_stage=None,
+):
+    """
+    렌더링 → OCR → 페이지별 표 분류를 겹쳐서 실행
+
+    - 렌더링: 백그라운드 스레드 (N+1 페이지를 N 페이지 OCR 중에 렌더링)
+    - OCR: 스레드 풀 (iter_ocr_pages)
+    - 표 제목 탐지/분류: 각 페이지 OCR 결과가 도착하는 즉시 현재 스레드에서
+    - cache가 있으면 PDF 전체 키 → 페이지 키 순으로 재사용, 없는 페이지만 OCR
+    - on_stage(stage): 진행 단계 알림 ("RASTERIZE" → 첫 페이지 렌더링 후 "OCR")
+
+    Returns:
+        (ocr_result, tables_with_title)
+    """
+    _report(on_stage, "RASTERIZE")
+
+    pdf_key = None
+    if cache is not None:
+        pdf_key = pdf_cache_key(pdf_path, dpi)
+        cached_images = cache.get(pdf_key)
+        if cached_images is not None:
+            _report(on_stage, "OCR")
+            pages = [
+                extract_page_tables(image, page_idx + 1)
+                for page_idx, image in enumerate(cached_images)
+            ]
+            return {"images": cached_images}, {"pages": pages}
+
+    job_dir = make_job_dir()
+    images = []
+    pages = []
+
+    rendered_paths = _iter_in_background(
+        iter_pdf_pages(pdf_path, job_dir, dpi=dpi, window=window),
+        maxsize=max(1, max_workers)
+    )
+    ocr_pages = iter_ocr_pages(
+        _notify_first(rendered_paths, lambda: _report(on_stage, "OCR")),
+        ocr_api_url,
+        ocr_secret_key,
+        max_workers=max_workers,
+        cache=cache,
+    )
+
+    try:
+        for page_images in ocr_pages:
+            for image in page_images:
+                images.append(image)
+                pages.append(extract_page_tables(image, len(pages) + 1))
+    finally:
+        # 실패해도 OCR 요청 스레드 → 렌더링 스레드가 모두 끝난 뒤 job_dir 삭제
+        ocr_pages.close()
+        rendered_paths.close()
+        shutil.rmtree(job_dir, ignore_errors=True)
+
+    if cache is not None:
+        cache.put(pdf_key, images)
+
+    return {"images": images}, {"pages": pages}
+
+
 def run_full_pipeline(
     pdf_path,
     ocr_api_url,
     ocr_secret_key,
+    max_workers=DEFAULT_MAX_WORKERS,
+    pipelined=True,
+    cache=None,
+    on_stage=None,
 ):
-    ocr_result = run_ocr_pipeline(
+    """
+    cache: OCRCache — 재업로드/재파싱 시 OCR API 재호출을 피함
+           (페이지 / PDF 단위 적중·미스 수는 cache.stats()로 확인)
+    on_stage: 진행 단계 알림 콜백 ("RASTERIZE" / "OCR" / "PARSE")
+    """
+    if not pipelined:
+        _report(on_stage, "RASTERIZE")
+        ocr_result = run_ocr_pipeline(
+            pdf_path=pdf_path,
+            ocr_api_url=ocr_api_url,
+            ocr_secret_key=ocr_secret_key,
+            max_workers=max_workers,
+            cache=cache,
+        )
+        _report(on_stage, "PARSE")
+        return run_parsing_pipeline(ocr_result)
+
+    ocr_result, tables_with_title = run_pipelined_ocr_and_tables(
         pdf_path=pdf_path,
         ocr_api_url=ocr_api_url,
         ocr_secret_key=ocr_secret_key,
+        max_workers=max_workers,
+        cache=cache,
+        on_stage=on_stage,
     )
 
-    parsed_result = run_parsing_pipeline(ocr_result)
+    # 페이지를 넘나드는 병합(세특/행동특성/성적 등)은 마지막에 한 번
+    _report(on_stage, "PARSE")
+    parsed_result = run_parsing_pipeline(ocr_result, tables_with_title=tables_with_title)
     return parsed_result
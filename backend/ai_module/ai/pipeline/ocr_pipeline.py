@@ -1,14 +1,43 @@
 # ai/pipeline/ocr_pipeline.py
 
-from ai.ocr.pdf_to_image import pdf_to_images
-from ai.ocr.ocr_clients import process_multiple_images
+import shutil
 
+from ai.ocr.pdf_to_image import iter_pdf_pages, make_job_dir, DEFAULT_DPI, DEFAULT_WINDOW
+from ai.ocr.ocr_clients import process_multiple_images, DEFAULT_MAX_WORKERS
+from ai.ocr.ocr_cache import pdf_cache_key
+
+
+def run_ocr_pipeline(
+    pdf_path,
+    ocr_api_url,
+    ocr_secret_key,
+    max_workers=DEFAULT_MAX_WORKERS,
+    dpi=DEFAULT_DPI,
+    window=DEFAULT_WINDOW,
+    cache=None,
+):
+    # 같은 PDF(+DPI)를 이미 OCR 했다면 렌더링부터 생략
+    pdf_key = None
+    if cache is not None:
+        pdf_key = pdf_cache_key(pdf_path, dpi)
+        images = cache.get(pdf_key)
+        if images is not None:
+            return {"images": images}
+
+    # 페이지 이미지는 작업별 임시 디렉토리에 렌더링 후 OCR이 끝나면 삭제
+    job_dir = make_job_dir()
+    try:
+        ocr_result = process_multiple_images(
+            image_paths=iter_pdf_pages(pdf_path, job_dir, dpi=dpi, window=window),
+            api_url=ocr_api_url,
+            secret_key=ocr_secret_key,
+            max_workers=max_workers,
+            cache=cache,
+        )
+    finally:
+        shutil.rmtree(job_dir, ignore_errors=True)
+
+    if cache is not None:
+        cache.put(pdf_key, ocr_result["images"])
 
-def run_ocr_pipeline(pdf_path, ocr_api_url, ocr_secret_key):
-    image_paths = pdf_to_images(pdf_path)
-    ocr_result = process_multiple_images(
-        image_paths=image_paths,
-        api_url=ocr_api_url,
-        secret_key=ocr_secret_key
-    )
     return ocr_result
@@ -2,7 +2,7 @@
 
 from ai.ocr.table_detector import extract_tables_with_fixed_title
 
-from ai.parsing.attendance_parser import extract_attendance_summary_from_ocr
+from ai.parsing.attendance_parser import extract_attendance_from_tables
 from ai.parsing.volunteer_parser import extract_volunteer_summary_from_tables
 from ai.parsing.grade_parser import (
     extract_grade_records_from_tables,
@@ -17,12 +17,17 @@ from ai.parsing.common_parser import (
 from ai.parsing.sebuneung_parser import normalize_subject
 
 
-def run_parsing_pipeline(ocr_result):
-    # 출결
-    attendance_summary = extract_attendance_summary_from_ocr(ocr_result)
+def run_parsing_pipeline(ocr_result, tables_with_title=None):
+    """
+    tables_with_title: 페이지 단위로 미리 표 제목 분류를 끝낸 결과
+                       (파이프라인 모드에서 OCR 도착 즉시 계산해 전달)
+    """
+    # 표 제목 분류 (표마다 IndexedTable 1회 생성)
+    if tables_with_title is None:
+        tables_with_title = extract_tables_with_fixed_title(ocr_result)
 
-    # 표 제목 분류
-    tables_with_title = extract_tables_with_fixed_title(ocr_result)
+    # 출결 (전체 합계 + 학년별)
+    attendance_summary, attendance_by_grade = extract_attendance_from_tables(tables_with_title)
 
     # 봉사
     volunteer_summary = extract_volunteer_summary_from_tables(tables_with_title)
@@ -53,6 +58,7 @@ def run_parsing_pipeline(ocr_result):
 
     return {
         "attendance_summary": attendance_summary,
+        "attendance_by_grade": attendance_by_grade,
         "volunteer_summary": volunteer_summary,
         "grade_records": nested_grade_json,
         "life_record_tables": merged_tables,
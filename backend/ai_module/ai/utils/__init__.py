@@ -1,5 +1,7 @@
-from ai.utils.table_utils import raw_table_to_matrix
+from ai.utils.columnar_page import ColumnarPage, load_columnar_pages
+from ai.utils.table_utils import IndexedTable, index_table, raw_table_to_matrix
 from ai.utils.text_utils import normalize_subject
+from ai.utils.keyword_matcher import keyword_trie_pattern, compile_keyword_pattern
 from ai.utils.constants import (
     TABLE_TITLE_CANDIDATES,
     ATTENDANCE_KEYWORDS,
@@ -7,8 +9,14 @@ from ai.utils.constants import (
 )
 
 __all__ = [
+    "ColumnarPage",
+    "load_columnar_pages",
+    "IndexedTable",
+    "index_table",
     "raw_table_to_matrix",
     "normalize_subject",
+    "keyword_trie_pattern",
+    "compile_keyword_pattern",
     "TABLE_TITLE_CANDIDATES",
     "ATTENDANCE_KEYWORDS",
     "COMMON_GRADE_HEADER",
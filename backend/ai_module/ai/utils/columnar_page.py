@@ -0,0 +1,160 @@
+# ai/utils/columnar_page.py
+
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+
+
+# 좌표가 있는 셀이 없는 표의 bbox 자리 값
+NO_MIN = float("inf")
+NO_MAX = float("-inf")
+
+
+# ======================================================
+# OCR 페이지 열(column) 단위 표현
+# ======================================================
+class ColumnarPage:
+    """
+    OCR 결과 한 페이지(image)를 한 번 순회해서 열 단위 배열로 변환
+
+    dict 트리(cells → cellTextLines → cellWords → inferText / boundingPoly)를
+    셀/필드 단위 병렬 배열로 펼쳐 둔다. 표 탐지/제목 매칭/행렬 생성은
+    이 배열만 사용하므로 원본 dict를 다시 순회하지 않는다.
+
+    - text: 페이지의 모든 문자열을 이어 붙인 문자열 1개 (나머지는 오프셋)
+    - 셀 (표 순서대로 이어짐, 표 t의 셀은 table_start[t] ~ table_start[t + 1])
+      · cell_row / cell_col: rowIndex / columnIndex
+      · cell_has_lines: cellTextLines 유무 (없으면 IndexedTable.cell_texts가 None)
+      · text[cell_text_start:cell_clean_start]: 줄 단위 원문을 " "로 이은 텍스트
+      · text[cell_clean_start:cell_clean_end]: 공백 정리 후 빈 단어를 뺀 텍스트
+    - 표 (table_x0 / table_y0 / table_x1 / table_y1): 셀 꼭짓점 전체의 min/max
+      (CLOVA 좌표는 실수일 수 있어 float 열, 좌표 있는 셀이 없는 표는 ±inf)
+    - 필드 (표 밖 텍스트, 공백 제거 후 빈 값 제외)
+      · text[field_start:field_end], field_y: 첫 꼭짓점 y
+      · field_order / field_y_sorted: y 오름차순 필드 인덱스와 그 y (표 제목 탐색용)
+    """
+
+    __slots__ = (
+        "name", "text", "table_start",
+        "cell_row", "cell_col", "cell_has_lines",
+        "cell_text_start", "cell_clean_start", "cell_clean_end",
+        "table_x0", "table_y0", "table_x1", "table_y1",
+        "field_start", "field_end", "field_y", "field_order", "field_y_sorted",
+    )
+
+    def __init__(self, image):
+        self.name = image.get("name")
+
+        # 순회 중에는 리스트에 모았다가 마지막에 한 번에 배열로 변환
+        table_start = [0]
+        rows = []
+        cols = []
+        has_lines = []
+        raw_texts = []
+        clean_texts = []
+        bboxes = []
+
+        for table in image.get("tables", []):
+            xs = []
+            ys = []
+            for cell in table.get("cells", []):
+                lines = []
+                clean = []
+                for line in cell.get("cellTextLines", []):
+                    words = [w.get("inferText", "") for w in line.get("cellWords", [])]
+                    joined = " ".join(words)
+                    lines.append(joined)
+
+                    # 대부분의 줄은 이미 공백 정리가 된 상태 → 단어별 strip 생략
+                    if " ".join(joined.split()) == joined:
+                        if joined:
+                            clean.append(joined)
+                    else:
+                        clean += [t for t in map(str.strip, words) if t]
+
+                rows.append(cell.get("rowIndex"))
+                cols.append(cell.get("columnIndex"))
+                has_lines.append(1 if lines else 0)
+                raw_texts.append(" ".join(lines))
+                clean_texts.append(" ".join(clean))
+
+                vertices = cell.get("boundingPoly", {}).get("vertices", ())
+                xs += [v.get("x", 0) for v in vertices]
+                ys += [v["y"] for v in vertices]
+
+            table_start.append(len(rows))
+            if ys:
+                bboxes.append((min(xs), min(ys), max(xs), max(ys)))
+            else:
+                bboxes.append((NO_MIN, NO_MIN, NO_MAX, NO_MAX))
+
+        field_texts = []
+        field_y = []
+
+        for field in image.get("fields", []):
+            text = field.get("inferText", "").strip()
+            if not text:
+                continue
+
+            field_texts.append(text)
+            field_y.append(field["boundingPoly"]["vertices"][0]["y"])
+
+        # text = 셀마다 (원문, 정리본) 순서 + 필드 텍스트 → 오프셋은 길이 누적합
+        pieces = [t for pair in zip(raw_texts, clean_texts) for t in pair] + field_texts
+        offsets = array("l", accumulate(map(len, pieces), initial=0))
+        n_cells = len(rows)
+
+        self.text = "".join(pieces)
+        self.table_start = array("l", table_start)
+        self.cell_row = array("l", rows)
+        self.cell_col = array("l", cols)
+        self.cell_has_lines = array("b", has_lines)
+        self.cell_text_start = offsets[0:2 * n_cells:2]
+        self.cell_clean_start = offsets[1:2 * n_cells:2]
+        self.cell_clean_end = offsets[2:2 * n_cells + 1:2]
+        self.table_x0 = array("d", [b[0] for b in bboxes])
+        self.table_y0 = array("d", [b[1] for b in bboxes])
+        self.table_x1 = array("d", [b[2] for b in bboxes])
+        self.table_y1 = array("d", [b[3] for b in bboxes])
+        self.field_start = offsets[2 * n_cells:-1]
+        self.field_end = offsets[2 * n_cells + 1:]
+        self.field_y = array("d", field_y)
+
+        # 같은 y는 뒤에서부터 읽을 때 원래 순서가 되도록 인덱스 역순으로 정렬
+        order = sorted(range(len(field_y)), key=lambda i: (field_y[i], -i))
+        self.field_order = array("l", order)
+        self.field_y_sorted = array("d", [field_y[i] for i in order])
+
+    @property
+    def table_count(self):
+        return len(self.table_start) - 1
+
+    def table_cells(self, table_idx):
+        """표 table_idx의 셀 범위 (start, end)"""
+        return self.table_start[table_idx], self.table_start[table_idx + 1]
+
+    def field_text(self, i):
+        return self.text[self.field_start[i]:self.field_end[i]]
+
+    def fields_above(self, y, limit):
+        """y보다 위(작은 y)에 있는 필드 인덱스를 가까운 순으로 최대 limit개"""
+        end = bisect_left(self.field_y_sorted, y)
+        return self.field_order[max(end - limit, 0):end][::-1]
+
+    def table_bbox(self, table_idx):
+        """표 셀 좌표의 (min_x, min_y, max_x, max_y), 좌표가 있는 셀이 없으면 None"""
+        min_y = self.table_y0[table_idx]
+        if min_y == NO_MIN:
+            return None
+
+        return (
+            self.table_x0[table_idx],
+            min_y,
+            self.table_x1[table_idx],
+            self.table_y1[table_idx],
+        )
+
+
+def load_columnar_pages(ocr_result):
+    """OCR 결과(images[]) → 페이지별 ColumnarPage 리스트"""
+    return [ColumnarPage(image) for image in ocr_result.get("images", [])]
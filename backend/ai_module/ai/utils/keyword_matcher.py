@@ -0,0 +1,69 @@
+# ai/utils/keyword_matcher.py
+
+import re
+from functools import lru_cache
+
+
+# ======================================================
+# 다중 키워드 매칭 (트라이 → 정규식)
+# ======================================================
+def build_keyword_trie(keywords):
+    """키워드 목록 → 중첩 dict 트라이 (단어 끝은 "" 키)"""
+    trie = {}
+    for keyword in keywords:
+        if not keyword:
+            continue
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    return trie
+
+
+def _trie_to_pattern(node):
+    branches = [
+        re.escape(ch) + _trie_to_pattern(child)
+        for ch, child in sorted(node.items())
+        if ch
+    ]
+    is_end = "" in node
+
+    if not branches:
+        return ""
+
+    if len(branches) == 1:
+        body = branches[0]
+        # 한 글자씩 이어지는 구간은 그룹 없이 그대로
+        if not is_end:
+            return body
+        return f"(?:{body})?"
+
+    body = "(?:" + "|".join(branches) + ")"
+    return body + "?" if is_end else body
+
+
+def keyword_trie_pattern(keywords):
+    """
+    키워드 목록 → 접두어를 공유하는 정규식 패턴
+
+    - 같은 위치에서는 긴 키워드부터 시도 (수학II > 수학I > 수학)
+    - 뒤 패턴이 실패하면 짧은 키워드로 되돌아감 (alternation과 같은 결과)
+    - 위치마다 키워드 수와 무관하게 트라이 깊이만큼만 비교
+    """
+    trie = build_keyword_trie(keywords)
+    if not trie:
+        return "(?!)"  # 아무것도 매칭하지 않음
+    return _trie_to_pattern(trie)
+
+
+@lru_cache(maxsize=64)
+def compile_keyword_pattern(keywords, template="{keywords}", flags=0):
+    """
+    키워드 집합(frozenset)별 컴파일 결과 캐시
+    - template의 {keywords} 자리에 트라이 패턴을 넣어 컴파일
+    - 같은 과목 목록으로 여러 문서를 파싱할 때 다시 만들지 않음
+    """
+    return re.compile(
+        template.replace("{keywords}", keyword_trie_pattern(sorted(keywords))),
+        flags
+    )
@@ -2,25 +2,104 @@
 
 from collections import defaultdict
 
+from ai.utils.columnar_page import ColumnarPage
 
-def raw_table_to_matrix(raw_table):
-    rows = defaultdict(dict)
 
-    for cell in raw_table.get("cells", []):
-        r = cell["rowIndex"]
-        c = cell["columnIndex"]
+# ======================================================
+# 표 인덱스 (OCR 표 1개를 한 번만 순회)
+# ======================================================
+class IndexedTable:
+    """
+    OCR 표(raw_table)를 한 번 순회해서 분류기/파서가 쓰는 값을 미리 계산
+    (셀 순회는 ColumnarPage가 담당, 페이지 단위로 만든 경우 from_page로 재사용)
+
+    - 셀 정보는 원본 셀 순서의 병렬 리스트로 보관 (셀마다 객체를 만들지 않음)
+      · cell_rows / cell_cols: rowIndex / columnIndex
+      · cell_texts: 줄 단위 단어를 " "로 잇고 줄끼리 다시 " "로 이은 원본 텍스트
+                    (cellTextLines가 없는 셀은 None)
+      · cell_clean: strip 후 빈 단어를 제외하고 " "로 이은 텍스트
+    - matrix: raw_table_to_matrix 결과
+    - text: 표 전체 정리된 텍스트 (extract_table_text)
+    - text_nospace: 표 전체 단어를 공백 없이 이은 텍스트
+    - header: matrix 첫 행을 " "로 이은 텍스트
+    - header_nospace: rowIndex 0 셀 단어를 공백 없이 이은 텍스트
+    - bbox: (min_x, min_y, max_x, max_y) / min_y: 표 상단 y (셀이 없으면 None)
+    """
+
+    __slots__ = (
+        "raw", "cell_rows", "cell_cols", "cell_texts", "cell_clean",
+        "matrix", "text", "text_nospace", "header", "header_nospace",
+        "bbox", "min_y",
+    )
+
+    def __init__(self, raw_table):
+        self._load(ColumnarPage({"tables": [raw_table]}), 0, raw_table)
+
+    @classmethod
+    def from_page(cls, page, table_idx, raw_table=None):
+        """ColumnarPage의 표 table_idx → IndexedTable (셀 dict를 다시 순회하지 않음)"""
+        indexed = cls.__new__(cls)
+        indexed._load(page, table_idx, raw_table)
+        return indexed
+
+    def _load(self, page, table_idx, raw_table):
+        self.raw = raw_table
+
+        start, end = page.table_cells(table_idx)
+        text = page.text
+        text_start = page.cell_text_start
+        clean_start = page.cell_clean_start
+        clean_end = page.cell_clean_end
+        has_lines = page.cell_has_lines
+
+        cell_rows = page.cell_row[start:end].tolist()
+        cell_cols = page.cell_col[start:end].tolist()
+        cell_texts = [
+            text[text_start[i]:clean_start[i]] if has_lines[i] else None
+            for i in range(start, end)
+        ]
+        cell_clean = [text[clean_start[i]:clean_end[i]] for i in range(start, end)]
 
-        texts = []
-        for line in cell.get("cellTextLines", []):
-            words = [w.get("inferText", "") for w in line.get("cellWords", [])]
-            texts.append(" ".join(words))
+        rows = defaultdict(dict)
+        for r, c, t in zip(cell_rows, cell_cols, cell_texts):
+            rows[r][c] = t.strip() if t else ""
 
-        rows[r][c] = " ".join(texts).strip()
+        matrix = []
+        for r in sorted(rows):
+            row = rows[r]
+            matrix.append([row.get(c, "") for c in range(max(row) + 1)])
 
-    matrix = []
-    for r in sorted(rows.keys()):
-        row = rows[r]
-        max_c = max(row.keys())
-        matrix.append([row.get(c, "") for c in range(max_c + 1)])
+        texts = [t for t in cell_texts if t is not None]
+        header_texts = [t for r, t in zip(cell_rows, cell_texts) if r == 0 and t is not None]
 
-    return matrix
+        self.cell_rows = cell_rows
+        self.cell_cols = cell_cols
+        self.cell_texts = cell_texts
+        self.cell_clean = cell_clean
+        self.matrix = matrix
+        self.text = " ".join([t for t in cell_clean if t])
+        # 공백을 모두 지우므로 단어 단위로 잇든 줄/셀 텍스트로 잇든 결과가 같음
+        self.text_nospace = "".join(texts).replace(" ", "")
+        self.header = " ".join(matrix[0]) if matrix else ""
+        self.header_nospace = "".join(header_texts).replace(" ", "")
+        self.bbox = page.table_bbox(table_idx)
+        self.min_y = self.bbox[1] if self.bbox else None
+
+
+def index_table(table):
+    """raw_table(dict) 또는 IndexedTable → IndexedTable"""
+    if isinstance(table, IndexedTable):
+        return table
+    return IndexedTable(table)
+
+
+def table_entry_index(entry):
+    """extract_tables_with_fixed_title 결과의 표 항목 → IndexedTable"""
+    indexed = entry.get("indexed")
+    if indexed is None:
+        indexed = IndexedTable(entry["raw_table"])
+    return indexed
+
+
+def raw_table_to_matrix(raw_table):
+    return index_table(raw_table).matrix
@@ -0,0 +1,128 @@
+"""
+출결 파서 비교: pandas pivot 방식(이전 구현) vs 격자 방식(attendance_parser)
+
+합성 출결표로 두 방식의 요약 결과가 같은지와 소요 시간을 비교한다.
+pandas가 설치되어 있지 않으면 격자 방식만 측정한다.
+
+    python -m scripts.bench_attendance --tables 2000
+"""
+import time
+import random
+import argparse
+
+from ai.utils.table_utils import IndexedTable
+from ai.parsing.attendance_parser import summarize_attendance_table
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+HEADER_1 = ["학년", "수업일수", "결석일수", "", "", "지각", "", "", "조퇴", "", "", "결과", "", "", "특기사항"]
+HEADER_2 = ["", "", "질병", "미인정", "기타", "질병", "미인정", "기타",
+            "질병", "미인정", "기타", "질병", "미인정", "기타", ""]
+
+
+def make_cell(row, col, text):
+    return {
+        "rowIndex": row,
+        "columnIndex": col,
+        "cellTextLines": [{"cellWords": [{"inferText": w} for w in text.split()]}],
+        "boundingPoly": {"vertices": [{"x": col * 50, "y": row * 20}]},
+    }
+
+
+def make_attendance_table(rnd):
+    rows = [HEADER_1, HEADER_2]
+    for grade in (1, 2, 3):
+        counts = [rnd.choice([".", "", "0", "1", "2", "3"]) for _ in range(12)]
+        rows.append([str(grade), "190"] + counts + ["개근" if grade == 1 else ""])
+
+    return {"cells": [
+        make_cell(r, c, text)
+        for r, row in enumerate(rows)
+        for c, text in enumerate(row)
+    ]}
+
+
+# ======================================================
+# 이전 구현 (pandas pivot + applymap)
+# ======================================================
+def legacy_summarize_attendance_table(table):
+    data = []
+    for cell in table["cells"]:
+        texts = []
+        for line in cell.get("cellTextLines", []):
+            words = [w.get("inferText", "") for w in line.get("cellWords", [])]
+            texts.append(" ".join(words))
+        data.append((cell.get("rowIndex"), cell.get("columnIndex"), " ".join(texts).strip()))
+
+    df = pd.DataFrame(data, columns=["row", "col", "text"])
+    pivot = df.pivot(index="row", columns="col", values="text").fillna("")
+    pivot.reset_index(drop=True, inplace=True)
+
+    header1 = pivot.iloc[0].tolist()
+    header2 = pivot.iloc[1].tolist()
+
+    last = ""
+    for i in range(len(header1)):
+        if header1[i] == "":
+            header1[i] = last
+        else:
+            last = header1[i]
+
+    headers = []
+    for h1, h2 in zip(header1, header2):
+        headers.append(f"{h1}_{h2}" if h1 and h2 else h1 or h2)
+
+    data_df = pivot.iloc[2:].copy()
+    data_df.columns = headers
+    data_df.reset_index(drop=True, inplace=True)
+
+    def to_int(x):
+        try:
+            return int(str(x).strip())
+        except ValueError:
+            return 0
+
+    # pandas 2.1+ 에서 applymap → map
+    if hasattr(data_df, "map"):
+        numeric_df = data_df.map(to_int)
+    else:
+        numeric_df = data_df.applymap(to_int)
+
+    summary = {}
+    for col in numeric_df.columns:
+        if col in ["학년", "수업일수", "특기사항"]:
+            continue
+        summary[col] = int(numeric_df[col].sum())
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tables", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    tables = [make_attendance_table(rnd) for _ in range(args.tables)]
+
+    start = time.perf_counter()
+    results = [summarize_attendance_table(IndexedTable(t)) for t in tables]
+    elapsed = time.perf_counter() - start
+    print(f"grid   tables={args.tables} elapsed={elapsed:.3f}s")
+
+    if pd is None:
+        print("pandas 미설치 — 이전 구현 비교 생략")
+        return
+
+    start = time.perf_counter()
+    legacy = [legacy_summarize_attendance_table(t) for t in tables]
+    elapsed = time.perf_counter() - start
+    print(f"pandas tables={args.tables} elapsed={elapsed:.3f}s same={results == legacy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+OCR 페이지 메모리 비교: dict 트리(JSON 그대로) vs ColumnarPage(열 배열)
+
+합성 OCR 페이지(표 + 필드)로 페이지당 메모리와 표 탐지 소요 시간을 측정하고
+IndexedTable.from_page 결과가 표 dict에서 바로 만든 IndexedTable과 같은지 확인한다.
+
+    python -m scripts.bench_columnar --pages 200
+"""
+import gc
+import json
+import time
+import random
+import argparse
+import tracemalloc
+
+from ai.ocr.table_detector import extract_page_tables
+from ai.utils.columnar_page import ColumnarPage
+from ai.utils.table_utils import IndexedTable
+
+
+WORDS = ["탐구", "능력이", "뛰어나며", "실험을", "주도적으로", "수행함.", "발표에서", "논리적인", "1", "2", "."]
+TITLES = ["출결상황", "창의적체험활동상황", "봉사활동실적", "교과학습발달상황"]
+
+
+def poly(x, y, w=50, h=20):
+    return {"vertices": [
+        {"x": x, "y": y}, {"x": x + w, "y": y},
+        {"x": x + w, "y": y + h}, {"x": x, "y": y + h},
+    ]}
+
+
+def make_table(rnd, top, rows, cols):
+    cells = []
+    for r in range(rows):
+        for c in range(cols):
+            lines = [
+                {"cellWords": [
+                    {"inferText": rnd.choice(WORDS), "boundingPoly": poly(c * 50, top + r * 20)}
+                    for _ in range(rnd.randint(1, 4))
+                ]}
+                for _ in range(rnd.randint(0, 2))
+            ]
+            cells.append({
+                "rowIndex": r,
+                "columnIndex": c,
+                "cellTextLines": lines,
+                "boundingPoly": poly(c * 50, top + r * 20),
+            })
+    return {"cells": cells}
+
+
+def make_page(rnd, index):
+    tables = []
+    fields = []
+    top = 40
+    for _ in range(rnd.randint(1, 4)):
+        fields.append({"inferText": rnd.choice(TITLES), "boundingPoly": poly(0, top - 30)})
+        rows = rnd.randint(3, 12)
+        tables.append(make_table(rnd, top, rows, rnd.randint(4, 12)))
+        top += rows * 20 + 60
+
+    fields += [
+        {"inferText": rnd.choice(WORDS), "boundingPoly": poly(0, rnd.randint(0, top))}
+        for _ in range(30)
+    ]
+    return {"name": f"page_{index + 1}", "fields": fields, "tables": tables}
+
+
+def traced_bytes(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    payload = json.dumps([make_page(rnd, i) for i in range(args.pages)], ensure_ascii=False)
+
+    # JSON에서 막 읽은 dict 트리 vs 같은 페이지의 ColumnarPage
+    pages, tree_bytes = traced_bytes(lambda: json.loads(payload))
+    columnar, columnar_bytes = traced_bytes(lambda: [ColumnarPage(p) for p in pages])
+
+    print(f"dict tree  {tree_bytes / args.pages / 1024:8.1f}KB/page")
+    print(f"columnar   {columnar_bytes / args.pages / 1024:8.1f}KB/page "
+          f"({tree_bytes / columnar_bytes:.1f}x)")
+
+    same = all(
+        getattr(IndexedTable.from_page(page, i, table), name) == getattr(IndexedTable(table), name)
+        for page, image in zip(columnar, pages)
+        for i, table in enumerate(image["tables"])
+        for name in ("matrix", "text", "text_nospace", "header", "header_nospace", "cell_texts", "min_y")
+    )
+
+    start = time.perf_counter()
+    for i, image in enumerate(pages):
+        extract_page_tables(image, i + 1)
+    elapsed = time.perf_counter() - start
+    print(f"detect     pages={args.pages} elapsed={elapsed:.3f}s same={same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+로컬 스텁 OCR 서버로 OCR 클라이언트 순차/동시 모드 비교
+
+실제 CLOVA API 없이 페이지당 지연(latency)만 흉내내는 서버를 띄우고
+process_multiple_images 의 순차(max_workers=1) / 동시 모드 소요 시간과
+페이지 순서 보존 여부를 확인한다.
+
+    python -m scripts.bench_ocr_client --pages 20 --latency 0.3 --workers 4
+"""
+import re
+import time
+import json
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ai.ocr.ocr_clients import process_multiple_images
+
+
+PAGE_NAME_RE = re.compile(rb'"name":\s*"(page_\d+)"')
+
+
+def make_stub_handler(latency):
+    class StubOCRHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive 허용
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            m = PAGE_NAME_RE.search(body)
+            name = m.group(1).decode() if m else ""
+
+            time.sleep(latency)
+
+            payload = json.dumps({
+                "images": [{"name": name, "fields": [], "tables": []}]
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return StubOCRHandler
+
+
+def run_stub_server(latency):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_stub_handler(latency))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    server = run_stub_server(args.latency)
+    api_url = f"http://127.0.0.1:{server.server_address[1]}/ocr"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        image_paths = []
+        for i in range(args.pages):
+            path = Path(tmp_dir) / f"page_{i+1}.jpg"
+            path.write_bytes(b"\xff\xd8stub\xff\xd9")
+            image_paths.append(str(path))
+
+        expected = [f"page_{i+1}" for i in range(args.pages)]
+
+        for workers in (1, args.workers):
+            start = time.perf_counter()
+            result = process_multiple_images(
+                image_paths, api_url, "stub-secret", max_workers=workers
+            )
+            elapsed = time.perf_counter() - start
+
+            names = [img["name"] for img in result["images"]]
+            print(
+                f"workers={workers:<3} pages={args.pages} "
+                f"elapsed={elapsed:.2f}s order_ok={names == expected}"
+            )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 import os
+import sys
 import json
 from dotenv import load_dotenv
 
 from ai.pipeline import run_full_pipeline
+from ai.ocr.ocr_cache import OCRCache
 
 
 def main():
@@ -16,14 +18,23 @@ def main():
     if not ocr_api_url or not ocr_secret_key:
         raise RuntimeError("OCR_API_URL 또는 OCR_SECRET_KEY가 설정되지 않았습니다.")
 
+    # OCR_CACHE_DIR 지정 시 같은 PDF/페이지는 OCR API를 다시 호출하지 않음
+    cache_dir = os.getenv("OCR_CACHE_DIR")
+    cache = OCRCache(cache_dir) if cache_dir else None
+
     result = run_full_pipeline(
         pdf_path=pdf_path,
         ocr_api_url=ocr_api_url,
         ocr_secret_key=ocr_secret_key,
+        cache=cache,
     )
 
     print(json.dumps(result, indent=2, ensure_ascii=False))
 
+    # stdout은 JSON 결과만 (파이프로 넘길 수 있게) → 캐시 통계는 stderr
+    if cache is not None:
+        print(cache.stats(), file=sys.stderr)
+
 
 if __name__ == "__main__":
     main()
@@ -5,8 +5,8 @@ from .models import Document, DocumentAnalysis
 class DocumentAnalysisInline(admin.TabularInline):
     model = DocumentAnalysis
     extra = 0
-    readonly_fields = ['analysis_version', 'status', 'started_at', 'completed_at', 'created_at']
-    fields = ['analysis_version', 'status', 'started_at', 'completed_at']
+    readonly_fields = ['analysis_version', 'status', 'progress_stage', 'started_at', 'completed_at', 'created_at']
+    fields = ['analysis_version', 'status', 'progress_stage', 'started_at', 'completed_at']
     can_delete = False
 
 
@@ -22,17 +22,17 @@ class DocumentAdmin(admin.ModelAdmin):
 
 @admin.register(DocumentAnalysis)
 class DocumentAnalysisAdmin(admin.ModelAdmin):
-    list_display = ['document', 'student', 'analysis_version', 'status', 'started_at', 'completed_at']
+    list_display = ['document', 'student', 'analysis_version', 'status', 'progress_stage', 'started_at', 'completed_at']
     list_filter = ['status', 'created_at']
     search_fields = ['document__title', 'student__name']
     ordering = ['-created_at']
-    readonly_fields = ['analysis_version', 'started_at', 'completed_at', 'created_at', 'updated_at']
+    readonly_fields = ['analysis_version', 'ocr_sha256', 'ocr_size', 'started_at', 'completed_at', 'created_at', 'updated_at']
     fieldsets = (
         ('기본 정보', {
-            'fields': ('document', 'student', 'analysis_version', 'status')
+            'fields': ('document', 'student', 'analysis_version', 'status', 'progress_stage')
         }),
         ('분석 결과', {
-            'fields': ('ocr_result', 'analysis_result')
+            'fields': ('ocr_sha256', 'ocr_size', 'ocr_result', 'parsed_result', 'analysis_result')
         }),
         ('에러 정보', {
             'fields': ('error_message',)
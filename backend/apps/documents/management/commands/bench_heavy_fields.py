@@ -0,0 +1,96 @@
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.students.models import Student
+from apps.documents.models import Document, DocumentAnalysis
+from apps.documents.serializers import DocumentAnalysisSerializer
+
+
+def make_ocr_page(rnd, page_index, cells=300):
+    """CLOVA OCR 페이지 1장 크기의 합성 결과 (표 셀 + 좌표 + 단어)"""
+    def poly(x, y):
+        return {'vertices': [
+            {'x': x, 'y': y}, {'x': x + 50, 'y': y},
+            {'x': x + 50, 'y': y + 20}, {'x': x, 'y': y + 20},
+        ]}
+
+    words = ['탐구', '능력이', '뛰어나며', '실험을', '주도적으로', '수행함.', '발표에서', '논리적인']
+    table_cells = []
+    for i in range(cells):
+        row, col = divmod(i, 10)
+        table_cells.append({
+            'rowIndex': row,
+            'columnIndex': col,
+            'boundingPoly': poly(col * 50, row * 20),
+            'cellTextLines': [{
+                'boundingPoly': poly(col * 50, row * 20),
+                'cellWords': [
+                    {'inferText': rnd.choice(words), 'inferConfidence': 0.99,
+                     'boundingPoly': poly(col * 50, row * 20)}
+                    for _ in range(rnd.randint(1, 6))
+                ],
+            }],
+            'inferConfidence': 0.99,
+        })
+
+    return {
+        'name': f'page_{page_index + 1}',
+        'fields': [
+            {'inferText': rnd.choice(words), 'boundingPoly': poly(0, i * 20)}
+            for i in range(50)
+        ],
+        'tables': [{'cells': table_cells, 'boundingPoly': poly(0, 0)}],
+    }
+
+
+class Command(BaseCommand):
+    help = '대용량 JSON 컬럼 defer 효과 측정 (합성 OCR 결과로 분석 행 생성 후 롤백)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=50, help='생성할 분석 수')
+        parser.add_argument('--pages', type=int, default=5, help='분석당 OCR 페이지 수')
+        parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수 (최솟값 사용)')
+
+    def measure(self, queryset, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            data = DocumentAnalysisSerializer(
+                queryset.all(), many=True, context={'include_heavy': ()}
+            ).data
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, len(data)
+
+    def handle(self, *args, **options):
+        rnd = random.Random(0)
+        ocr_result = {'images': [make_ocr_page(rnd, i) for i in range(options['pages'])]}
+        ocr_bytes = len(json.dumps(ocr_result, ensure_ascii=False).encode())
+
+        with transaction.atomic():
+            student = Student.objects.create(name='벤치마크', student_code='BENCH-HEAVY', grade='3')
+            DocumentAnalysis.objects.bulk_create([
+                DocumentAnalysis(
+                    document=Document.objects.create(student=student, title=f'생기부 {i}'),
+                    student=student,
+                    status='COMPLETED',
+                    ocr_result=ocr_result,
+                )
+                for i in range(options['rows'])
+            ])
+
+            queryset = DocumentAnalysis.objects.select_related('document', 'student').filter(student=student)
+            full, rows = self.measure(queryset, options['repeat'])
+            deferred, _ = self.measure(queryset.defer_heavy(), options['repeat'])
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"rows={rows} ocr_result={ocr_bytes / 1024:.0f}KB/row\n"
+            f"전체 컬럼: {full * 1000:.1f}ms\n"
+            f"defer_heavy: {deferred * 1000:.1f}ms ({full / deferred:.1f}x)"
+        )
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from apps.documents.models import DocumentAnalysis
+
+
+class Command(BaseCommand):
+    help = 'DB의 ocr_result 컬럼에 남아 있는 OCR 결과를 스토리지(gzip)로 옮기고 해시만 남김'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=100,
+            help='한 번에 읽어서 옮길 분석 수'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        moved = 0
+        total_bytes = 0
+
+        queryset = DocumentAnalysis.objects.filter(
+            ocr_sha256='', ocr_result__has_key='images'
+        ).only('id', 'ocr_result', 'ocr_sha256', 'ocr_size')
+
+        # 옮긴 행은 조건에서 빠지므로 매번 앞에서부터 chunk_size개씩
+        while True:
+            chunk = list(queryset.order_by('id')[:chunk_size])
+            if not chunk:
+                break
+
+            for analysis in chunk:
+                analysis.set_ocr_result(analysis.ocr_result)
+                total_bytes += analysis.ocr_size
+
+            DocumentAnalysis.objects.bulk_update(chunk, ['ocr_sha256', 'ocr_size', 'ocr_result'])
+            moved += len(chunk)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'OCR 결과 이동 완료: {moved}건, {total_bytes / (1024 * 1024):.1f}MB'
+        ))
@@ -0,0 +1,36 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from apps.documents.reparse import reparse_documents
+
+
+class Command(BaseCommand):
+    help = '저장된 OCR 결과(ocr_result)를 다시 파싱해서 새 분석 버전 생성 (OCR API 호출 없음)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--document', action='append', dest='document_ids', default=None,
+            help='대상 문서 ID (여러 번 지정 가능, 생략 시 전체)'
+        )
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help='파싱 프로세스 수'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=None,
+            help='한 번에 읽고 저장할 분석 수 (기본: settings.REPARSE_CHUNK_SIZE)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('재파싱을 시작합니다...')
+
+        counts = reparse_documents(
+            document_ids=options['document_ids'],
+            workers=options['workers'],
+            chunk_size=options['chunk_size'],
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"재파싱 완료: 성공 {counts['completed']}건, 실패 {counts['failed']}건"
+        ))
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.1 on 2026-10-18 03:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0004_alter_document_file_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="documentanalysis",
+            name="parsed_result",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="출결/봉사/성적/세특/행동특성 등 구조화된 생기부 데이터",
+                verbose_name="파싱 결과",
+            ),
+        ),
+    ]
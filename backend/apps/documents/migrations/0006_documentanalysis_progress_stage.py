@@ -0,0 +1,30 @@
+# Generated by Django 5.0.1 on 2026-10-18 03:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0005_documentanalysis_parsed_result"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="documentanalysis",
+            name="progress_stage",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("QUEUED", "대기열"),
+                    ("RASTERIZE", "PDF 이미지 변환"),
+                    ("OCR", "OCR"),
+                    ("PARSE", "파싱"),
+                    ("ANALYZE", "AI 분석"),
+                    ("DONE", "완료"),
+                ],
+                help_text="비동기 분석 태스크의 현재 단계",
+                max_length=20,
+                verbose_name="진행 단계",
+            ),
+        ),
+    ]
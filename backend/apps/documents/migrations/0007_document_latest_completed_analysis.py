@@ -0,0 +1,33 @@
+# Generated by Django 5.0.1 on 2026-10-18 03:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0006_documentanalysis_progress_stage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="document",
+            name="latest_completed_analysis",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="documents.documentanalysis",
+                verbose_name="최신 완료 분석",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="documentanalysis",
+            index=models.Index(
+                fields=["document", "status", "analysis_version"],
+                name="document_an_documen_a390ec_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+def backfill_latest_completed_analysis(apps, schema_editor):
+    Document = apps.get_model('documents', 'Document')
+    DocumentAnalysis = apps.get_model('documents', 'DocumentAnalysis')
+
+    latest = DocumentAnalysis.objects.filter(
+        document=models.OuterRef('pk'),
+        status='COMPLETED'
+    ).order_by('-analysis_version').values('pk')[:1]
+    Document.objects.update(latest_completed_analysis=models.Subquery(latest))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0007_document_latest_completed_analysis"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_latest_completed_analysis, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0008_backfill_latest_completed_analysis"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="documentanalysis",
+            name="ocr_sha256",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="스토리지 경로: ocr/{해시 앞 2자리}/{해시}.json.gz",
+                max_length=64,
+                verbose_name="OCR 결과 해시",
+            ),
+        ),
+        migrations.AddField(
+            model_name="documentanalysis",
+            name="ocr_size",
+            field=models.BigIntegerField(
+                default=0, help_text="압축 전 JSON 크기", verbose_name="OCR 결과 크기 (bytes)"
+            ),
+        ),
+    ]
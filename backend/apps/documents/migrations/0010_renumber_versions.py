@@ -0,0 +1,50 @@
+from itertools import groupby
+
+from django.db import migrations
+
+
+def renumber_versions(apps, schema_editor):
+    """
+    유니크 제약 추가 전 버전 번호 정리
+    - 문서: 학생/문서 타입별로 업로드 순서대로 1, 2, ... 마지막 문서만 최신
+    - 분석: 같은 문서에 버전이 겹치는 경우만 (버전, 생성 시각) 순서로 다시 매김
+    """
+    Document = apps.get_model('documents', 'Document')
+    DocumentAnalysis = apps.get_model('documents', 'DocumentAnalysis')
+
+    documents = Document.objects.order_by('student_id', 'document_type', 'created_at').only(
+        'id', 'student_id', 'document_type', 'version', 'is_latest'
+    )
+    changed = []
+    for _, group in groupby(documents.iterator(), key=lambda d: (d.student_id, d.document_type)):
+        group = list(group)
+        for version, document in enumerate(group, start=1):
+            is_latest = version == len(group)
+            if (document.version, document.is_latest) != (version, is_latest):
+                document.version, document.is_latest = version, is_latest
+                changed.append(document)
+    Document.objects.bulk_update(changed, ['version', 'is_latest'], batch_size=500)
+
+    analyses = DocumentAnalysis.objects.order_by('document_id', 'analysis_version', 'created_at').only(
+        'id', 'document_id', 'analysis_version'
+    )
+    changed = []
+    for _, group in groupby(analyses.iterator(), key=lambda a: a.document_id):
+        group = list(group)
+        if len({a.analysis_version for a in group}) == len(group):
+            continue
+        for version, analysis in enumerate(group, start=1):
+            if analysis.analysis_version != version:
+                analysis.analysis_version = version
+                changed.append(analysis)
+    DocumentAnalysis.objects.bulk_update(changed, ['analysis_version'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0009_documentanalysis_ocr_artifact"),
+    ]
+
+    operations = [
+        migrations.RunPython(renumber_versions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0010_renumber_versions"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="document",
+            constraint=models.UniqueConstraint(
+                fields=("student", "document_type", "version"),
+                name="documents_unique_version",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="documentanalysis",
+            constraint=models.UniqueConstraint(
+                fields=("document", "analysis_version"),
+                name="document_analysis_unique_version",
+            ),
+        ),
+    ]
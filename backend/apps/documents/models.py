@@ -2,9 +2,39 @@ import uuid
 from django.db import models
 from django.conf import settings
 
+from core.managers import HeavyFieldQuerySet, VersionedQuerySet, VersionedModelMixin
+from .ocr_store import save_ocr_result, load_ocr_result
 
-class Document(models.Model):
-    """서류 관리"""
+
+class DocumentQuerySet(VersionedQuerySet):
+
+    def with_latest_completed_analysis(self, include_results=False):
+        """
+        문서별 최신 완료 분석을 같은 쿼리에서 함께 로드
+        - latest_completed_analysis 포인터 JOIN (문서 수와 무관하게 쿼리 1회)
+        - include_results=False면 대용량 JSON 컬럼은 읽지 않음
+        """
+        if include_results:
+            return self.select_related('latest_completed_analysis__student')
+
+        return self.select_related('latest_completed_analysis').defer(*[
+            f'latest_completed_analysis__{name}' for name in DocumentAnalysis.HEAVY_FIELDS
+        ])
+
+    def refresh_latest_completed_analysis(self):
+        """
+        latest_completed_analysis 포인터 재계산 (UPDATE 1회)
+        - 분석이 완료되거나 버전이 추가될 때 호출
+        """
+        latest = DocumentAnalysis.objects.filter(
+            document=models.OuterRef('pk'),
+            status='COMPLETED'
+        ).order_by('-analysis_version').values('pk')[:1]
+        return self.update(latest_completed_analysis=models.Subquery(latest))
+
+
+class Document(VersionedModelMixin, models.Model):
+    """서류 관리 (학생/문서 타입별 버전 관리)"""
     DOCUMENT_TYPE_CHOICES = (
         ('생기부', '생활기록부'),
         ('모의고사', '모의고사 성적표'),
@@ -48,6 +78,17 @@ class Document(models.Model):
     version = models.IntegerField(default=1, verbose_name='버전')
     is_latest = models.BooleanField(default=True, verbose_name='최신 버전 여부')
 
+    # 최신 완료 분석 (비정규화 포인터 - refresh_latest_completed_analysis로 갱신, 분석 저장/삭제 시 자동)
+    latest_completed_analysis = models.ForeignKey(
+        'DocumentAnalysis',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+',
+        verbose_name='최신 완료 분석'
+    )
+
     # OCR 및 AI 분석 결과
     # ocr_text = models.TextField(blank=True, verbose_name='OCR 추출 텍스트')
     # ai_analysis = models.JSONField(
@@ -69,6 +110,12 @@ class Document(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = DocumentQuerySet.as_manager()
+
+    VERSION_GROUP = ('student', 'document_type')
+    VERSION_FIELD = 'version'
+    LATEST_FIELD = 'is_latest'
+
     class Meta:
         db_table = 'documents'
         verbose_name = '서류'
@@ -78,10 +125,27 @@ class Document(models.Model):
             models.Index(fields=['student', 'is_latest']),
             models.Index(fields=['student', 'version']),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['student', 'document_type', 'version'],
+                name='documents_unique_version'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.student.name} - {self.get_document_type_display()} - {self.title}"
 
+    def get_latest_completed_analysis(self):
+        """
+        최신 완료 분석 (포인터 PK 조회)
+        - with_latest_completed_analysis로 로드했으면 추가 쿼리 없음
+        """
+        latest = self.latest_completed_analysis
+        if latest is not None:
+            # 포인터가 가리키는 분석의 문서는 자기 자신 (analysis.document 재조회 방지)
+            DocumentAnalysis.document.field.set_cached_value(latest, self)
+        return latest
+
 
 # class DocumentVersion(models.Model):
 #     """서류 버전 관리"""
@@ -117,7 +181,11 @@ class Document(models.Model):
 #         return f"{self.document.title} - v{self.version_number}"
 
 
-class DocumentAnalysis(models.Model):
+class DocumentAnalysisQuerySet(HeavyFieldQuerySet, VersionedQuerySet):
+    """대용량 컬럼 지연 로딩 + 문서별 분석 버전 관리"""
+
+
+class DocumentAnalysis(VersionedModelMixin, models.Model):
     """
     생기부 분석 이력 추적
     - 하나의 Document에 여러 번 분석 가능
@@ -130,6 +198,18 @@ class DocumentAnalysis(models.Model):
         ('FAILED', '실패'),
     )
 
+    PROGRESS_STAGE_CHOICES = (
+        ('QUEUED', '대기열'),
+        ('RASTERIZE', 'PDF 이미지 변환'),
+        ('OCR', 'OCR'),
+        ('PARSE', '파싱'),
+        ('ANALYZE', 'AI 분석'),
+        ('DONE', '완료'),
+    )
+
+    # 목록/요약 응답에서는 읽지 않는 대용량 JSON 컬럼
+    HEAVY_FIELDS = ('ocr_result', 'parsed_result', 'analysis_result')
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
     # 연관 관계
@@ -160,6 +240,13 @@ class DocumentAnalysis(models.Model):
         default='PENDING',
         verbose_name='분석 상태'
     )
+    progress_stage = models.CharField(
+        max_length=20,
+        choices=PROGRESS_STAGE_CHOICES,
+        blank=True,
+        verbose_name='진행 단계',
+        help_text='비동기 분석 태스크의 현재 단계'
+    )
 
     # OCR 결과
     ocr_result = models.JSONField(
@@ -180,6 +267,30 @@ class DocumentAnalysis(models.Model):
         '''
     )
 
+    # OCR 결과 파일 (ocr_store) - 새 분석은 ocr_result 컬럼 대신 스토리지에 gzip으로 저장
+    # 같은 OCR 결과(재파싱/재분석)는 같은 해시 → 파일 1개를 공유
+    ocr_sha256 = models.CharField(
+        max_length=64,
+        blank=True,
+        db_index=True,
+        verbose_name='OCR 결과 해시',
+        help_text='스토리지 경로: ocr/{해시 앞 2자리}/{해시}.json.gz'
+    )
+    ocr_size = models.BigIntegerField(
+        default=0,
+        verbose_name='OCR 결과 크기 (bytes)',
+        help_text='압축 전 JSON 크기'
+    )
+
+    # 파싱 결과 - ocr_result(images[])에서 run_parsing_pipeline으로 생성
+    # 파서가 개선되면 OCR 재호출 없이 reparse_documents로 새 버전 생성
+    parsed_result = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='파싱 결과',
+        help_text='출결/봉사/성적/세특/행동특성 등 구조화된 생기부 데이터'
+    )
+
     # AI 분석 결과 - 생기부 분석
     analysis_result = models.JSONField(
         default=dict,
@@ -209,6 +320,12 @@ class DocumentAnalysis(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = DocumentAnalysisQuerySet.as_manager()
+
+    VERSION_GROUP = ('document',)
+    VERSION_FIELD = 'analysis_version'
+    LATEST_FIELD = None
+
     class Meta:
         db_table = 'document_analysis'
         verbose_name = '문서 분석'
@@ -218,7 +335,37 @@ class DocumentAnalysis(models.Model):
             models.Index(fields=['document']),
             models.Index(fields=['student']),
             models.Index(fields=['status']),
+            # 문서별 상태/버전 조회 (최신 완료 분석 재계산, 다음 버전 계산)
+            models.Index(fields=['document', 'status', 'analysis_version']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['document', 'analysis_version'],
+                name='document_analysis_unique_version'
+            ),
         ]
 
     def __str__(self):
         return f"{self.document} - 분석 v{self.analysis_version}"
+
+    def get_ocr_result(self):
+        """
+        OCR 결과 (images[])
+        - 스토리지에 있으면 그때 읽어서 압축 해제, 이전 행은 ocr_result 컬럼
+        """
+        if self.ocr_sha256:
+            return load_ocr_result(self.ocr_sha256)
+        return self.ocr_result
+
+    def set_ocr_result(self, ocr_result):
+        """OCR 결과를 스토리지에 저장하고 해시/크기만 기록 (save는 호출하는 쪽에서)"""
+        self.ocr_sha256, self.ocr_size = save_ocr_result(ocr_result)
+        self.ocr_result = {}
+
+    @classmethod
+    def next_version(cls, document):
+        """문서의 다음 분석 버전 번호 (조회용 - 새 분석의 번호는 save()에서 잠금 후 매김)"""
+        last = cls.objects.filter(document=document).aggregate(
+            last=models.Max('analysis_version')
+        )['last']
+        return (last or 0) + 1
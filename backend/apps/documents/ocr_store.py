@@ -0,0 +1,69 @@
+"""
+OCR 결과 저장소
+
+CLOVA OCR images[] JSON을 gzip으로 압축해서 파일 스토리지(로컬 / S3)에 저장하고
+DocumentAnalysis에는 내용 해시(ocr_sha256)와 크기(ocr_size)만 남긴다.
+
+- 경로: ocr/{sha[:2]}/{sha}.json.gz (내용 주소 방식 → 같은 OCR 결과는 한 번만 저장)
+- 읽기: 파서가 필요할 때 스토리지에서 스트리밍으로 압축 해제
+"""
+import gzip
+import hashlib
+import io
+import json
+from contextlib import contextmanager
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+
+OCR_ARTIFACT_PREFIX = 'ocr'
+COMPRESS_LEVEL = 6
+
+
+def encode_ocr_result(ocr_result):
+    """키 정렬 + 공백 없는 JSON (같은 내용이면 같은 바이트 → 같은 해시)"""
+    return json.dumps(
+        ocr_result, ensure_ascii=False, sort_keys=True, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def ocr_artifact_name(sha256):
+    return f'{OCR_ARTIFACT_PREFIX}/{sha256[:2]}/{sha256}.json.gz'
+
+
+def save_ocr_result(ocr_result, storage=None):
+    """
+    OCR 결과 저장 (이미 같은 해시가 있으면 쓰지 않음)
+
+    Returns:
+        (sha256, size) — size는 압축 전 JSON 바이트 수
+    """
+    storage = storage or default_storage
+    payload = encode_ocr_result(ocr_result)
+    sha256 = hashlib.sha256(payload).hexdigest()
+
+    name = ocr_artifact_name(sha256)
+    if not storage.exists(name):
+        compressed = gzip.compress(payload, compresslevel=COMPRESS_LEVEL, mtime=0)
+        saved_name = storage.save(name, ContentFile(compressed))
+        if saved_name != name:
+            # 동시에 같은 내용이 저장된 경우 (스토리지가 이름을 바꿔 저장) → 중복본 삭제
+            storage.delete(saved_name)
+
+    return sha256, len(payload)
+
+
+@contextmanager
+def open_ocr_result(sha256, storage=None):
+    """압축 해제 스트림 (텍스트) — 전체를 메모리에 풀지 않고 읽을 수 있음"""
+    storage = storage or default_storage
+    with storage.open(ocr_artifact_name(sha256), 'rb') as raw:
+        with gzip.GzipFile(fileobj=raw) as decompressed:
+            yield io.TextIOWrapper(decompressed, encoding='utf-8')
+
+
+def load_ocr_result(sha256, storage=None):
+    with open_ocr_result(sha256, storage) as stream:
+        return json.load(stream)
+
@@ -0,0 +1,153 @@
+"""
+저장된 OCR 결과 재파싱
+
+DocumentAnalysis의 OCR 결과(CLOVA images[] JSON)를 run_parsing_pipeline으로
+다시 파싱해서 새 analysis_version을 만든다.
+OCR API / PDF는 사용하지 않는다.
+
+- OCR 결과는 ocr_store(스토리지) 또는 이전 행의 ocr_result 컬럼에서 읽음
+- 새 버전은 같은 OCR 파일(해시)을 참조 (결과를 복사하지 않음)
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
+
+from .models import Document, DocumentAnalysis
+from .ocr_store import save_ocr_result, load_ocr_result
+
+
+def parse_ocr_result(ocr_source):
+    """
+    OCR 결과 1건 파싱 (프로세스 풀 워커에서 실행 — DB 접근 금지)
+
+    ocr_source: OCR 결과 해시(str, 워커에서 스토리지로부터 압축 해제) 또는 images[] dict
+
+    Returns:
+        (parsed_result, error_message)
+    """
+    from ai.pipeline.parsing_pipeline import run_parsing_pipeline
+
+    try:
+        ocr_result = load_ocr_result(ocr_source) if isinstance(ocr_source, str) else ocr_source
+        return run_parsing_pipeline(ocr_result), ''
+    except Exception as e:
+        return None, f'{type(e).__name__}: {e}'
+
+
+# OCR 결과가 저장된 분석 (스토리지 해시 또는 이전 방식의 ocr_result 컬럼)
+HAS_OCR_RESULT = ~Q(ocr_sha256='') | Q(ocr_result__has_key='images')
+
+
+def source_analysis_ids(document_ids=None):
+    """
+    재파싱 대상 분석 ID: 문서별로 OCR 결과가 저장된 가장 최근 분석
+    - 문서당 최신 분석은 서브쿼리로 DB에서 고름 (이전 버전의 대용량 컬럼은 읽지 않음)
+    """
+    latest = DocumentAnalysis.objects.filter(
+        HAS_OCR_RESULT, document_id=OuterRef('pk')
+    ).order_by('-analysis_version').values('pk')[:1]
+
+    documents = Document.objects.all()
+    if document_ids:
+        documents = documents.filter(pk__in=document_ids)
+
+    return documents.annotate(
+        source_id=Subquery(latest)
+    ).exclude(source_id=None).order_by('pk').values_list('source_id', flat=True)
+
+
+def load_source_analyses(analysis_ids):
+    """재파싱에 필요한 컬럼(OCR 결과 / AI 분석 결과 포함)을 묶음 단위로 로드"""
+    return list(DocumentAnalysis.objects.filter(id__in=analysis_ids).only(
+        'id', 'document_id', 'student_id', 'ocr_sha256', 'ocr_size', 'ocr_result', 'analysis_result'
+    ))
+
+
+def iter_id_chunks(ids, chunk_size):
+    """ID 스트림 → chunk_size 단위 리스트"""
+    chunk = []
+    for analysis_id in ids.iterator(chunk_size=chunk_size):
+        chunk.append(analysis_id)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def reparse_chunk(sources, parse_map=map):
+    """
+    분석 묶음을 재파싱해서 새 버전으로 한 번에 저장
+
+    parse_map: map 또는 ProcessPoolExecutor.map (병렬 파싱)
+    """
+    # 이전 행(ocr_result 컬럼)은 새 버전을 만들면서 스토리지로 옮김
+    ocr_refs = [
+        (s.ocr_sha256, s.ocr_size) if s.ocr_sha256 else save_ocr_result(s.ocr_result)
+        for s in sources
+    ]
+    results = list(parse_map(parse_ocr_result, [sha256 for sha256, _ in ocr_refs]))
+
+    now = timezone.now()
+    new_analyses = []
+    for source, (sha256, size), (parsed_result, error_message) in zip(sources, ocr_refs, results):
+        new_analyses.append(DocumentAnalysis(
+            document_id=source.document_id,
+            student_id=source.student_id,
+            status='FAILED' if error_message else 'COMPLETED',
+            ocr_sha256=sha256,
+            ocr_size=size,
+            parsed_result=parsed_result or {},
+            # AI 분석은 다시 돌리지 않으므로 기존 결과 유지
+            analysis_result=source.analysis_result,
+            error_message=error_message,
+            started_at=now,
+            completed_at=now,
+        ))
+
+    with transaction.atomic():
+        # 문서별 다음 버전을 잠금 후 한 번에 확보 (동시에 분석이 추가돼도 번호가 겹치지 않음)
+        versions = DocumentAnalysis.objects.claim_versions(
+            [(analysis.document_id,) for analysis in new_analyses]
+        )
+        for analysis in new_analyses:
+            group = (analysis.document_id,)
+            analysis.analysis_version = versions[group]
+            versions[group] += 1
+
+        DocumentAnalysis.objects.bulk_create(new_analyses)
+        Document.objects.filter(
+            pk__in={analysis.document_id for analysis in new_analyses}
+        ).refresh_latest_completed_analysis()
+    return new_analyses
+
+
+def reparse_documents(document_ids=None, workers=1, chunk_size=None):
+    """
+    저장된 OCR 결과 일괄 재파싱
+
+    - 대상 분석 ID만 스트리밍하고, OCR / AI 결과 컬럼은 chunk_size 묶음마다 로드
+    - workers > 1 이면 파싱만 프로세스 풀에서 병렬 실행, 저장은 현재 프로세스
+
+    Returns:
+        {'completed': n, 'failed': n}
+    """
+    chunk_size = chunk_size or settings.REPARSE_CHUNK_SIZE
+    counts = {'completed': 0, 'failed': 0}
+
+    def run(parse_map):
+        for chunk in iter_id_chunks(source_analysis_ids(document_ids), chunk_size):
+            for analysis in reparse_chunk(load_source_analyses(chunk), parse_map=parse_map):
+                counts['completed' if analysis.status == 'COMPLETED' else 'failed'] += 1
+
+    if workers <= 1:
+        run(map)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            run(lambda fn, items: pool.map(fn, items, chunksize=max(1, len(items) // workers)))
+
+    return counts
@@ -1,25 +1,44 @@
 from rest_framework import serializers
+from core.mixins import HeavyFieldsSerializerMixin
 from .models import Document, DocumentAnalysis
 from apps.students.serializers import StudentListSerializer
 
 
-class DocumentAnalysisSerializer(serializers.ModelSerializer):
+class DocumentAnalysisSerializer(HeavyFieldsSerializerMixin, serializers.ModelSerializer):
     """문서 분석 결과 시리얼라이저"""
     document_version = serializers.IntegerField(source='document.version', read_only=True)
     student_name = serializers.CharField(source='student.name', read_only=True)
+    # 스토리지(ocr_store)에 있으면 요청 시에만 읽어서 압축 해제
+    ocr_result = serializers.SerializerMethodField()
 
     class Meta:
         model = DocumentAnalysis
         fields = [
             'id', 'document', 'document_version', 'student', 'student_name',
-            'analysis_version', 'status',
-            'ocr_result', 'analysis_result', 'error_message',
+            'analysis_version', 'status', 'progress_stage',
+            'ocr_sha256', 'ocr_size',
+            'ocr_result', 'parsed_result', 'analysis_result', 'error_message',
             'started_at', 'completed_at', 'created_at', 'updated_at'
         ]
         read_only_fields = [
-            'id', 'analysis_version', 'started_at',
-            'completed_at', 'created_at', 'updated_at'
+            'id', 'analysis_version', 'progress_stage', 'ocr_sha256', 'ocr_size',
+            'started_at', 'completed_at', 'created_at', 'updated_at'
+        ]
+
+    def get_ocr_result(self, obj):
+        return obj.get_ocr_result()
+
+
+class DocumentAnalysisSummarySerializer(serializers.ModelSerializer):
+    """문서 분석 요약 시리얼라이저 (대용량 JSON 컬럼 제외)"""
+
+    class Meta:
+        model = DocumentAnalysis
+        fields = [
+            'id', 'analysis_version', 'status', 'progress_stage', 'error_message',
+            'started_at', 'completed_at', 'created_at', 'updated_at'
         ]
+        read_only_fields = fields
 
 
 class DocumentSerializer(serializers.ModelSerializer):
@@ -46,11 +65,16 @@ class DocumentSerializer(serializers.ModelSerializer):
         ]
 
     def get_latest_analysis(self, obj):
-        """최신 분석 결과 가져오기"""
-        latest = obj.analyses.filter(status='COMPLETED').order_by('-analysis_version').first()
-        if latest:
+        """
+        최신 분석 결과 가져오기
+        - 기본은 요약만, context['include_analysis_results']가 있으면 OCR/분석 결과 포함
+        """
+        latest = obj.get_latest_completed_analysis()
+        if latest is None:
+            return None
+        if self.context.get('include_analysis_results'):
             return DocumentAnalysisSerializer(latest).data
-        return None
+        return DocumentAnalysisSummarySerializer(latest).data
 
 
 class DocumentListSerializer(serializers.ModelSerializer):
@@ -0,0 +1,23 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Document, DocumentAnalysis
+
+
+@receiver([post_save, post_delete], sender=DocumentAnalysis)
+def refresh_latest_completed_analysis(sender, instance, **kwargs):
+    """
+    분석 저장 / 삭제 → 문서의 latest_completed_analysis 포인터 재계산
+    - admin / ORM으로 상태를 바꾸거나 최신 완료 분석을 지워도 포인터가 어긋나지 않도록
+    - status와 무관한 필드만 저장한 경우는 건너뜀
+    - 커밋 후에 재계산 (같은 트랜잭션의 다른 변경까지 반영)
+    """
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and 'status' not in update_fields:
+        return
+
+    document_id = instance.document_id
+    transaction.on_commit(
+        lambda: Document.objects.filter(pk=document_id).refresh_latest_completed_analysis()
+    )
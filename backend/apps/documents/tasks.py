@@ -0,0 +1,221 @@
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.grades.ingest import ingest_grade_records
+from apps.reports.models import ConsultationReport
+from apps.reports.ai_module import (
+    analyze_saenggibu_with_ai,
+    analyze_grades_with_ai,
+    generate_comprehensive_analysis_with_ai,
+)
+from .models import Document, DocumentAnalysis
+from .ocr_store import save_ocr_result
+from .reparse import source_analysis_ids, iter_id_chunks, load_source_analyses, reparse_chunk
+
+
+# ======================================================
+# 문서 분석 (OCR → 파싱 → AI 분석)
+# ======================================================
+def set_analysis_stage(analysis_id, stage):
+    """진행 단계만 갱신 (다른 필드를 덮어쓰지 않도록 update 사용)"""
+    DocumentAnalysis.objects.filter(pk=analysis_id).update(
+        progress_stage=stage,
+        updated_at=timezone.now()
+    )
+
+
+@contextmanager
+def local_file_path(field_file):
+    """
+    FileField → 로컬 파일 경로
+    - 로컬 스토리지는 저장된 경로를 그대로 사용
+    - S3 등 원격 스토리지는 임시 파일로 내려받고 종료 시 삭제
+    """
+    try:
+        path = field_file.path
+    except NotImplementedError:
+        path = None
+
+    if path is not None:
+        yield path
+        return
+
+    suffix = os.path.splitext(field_file.name)[1]
+    with tempfile.NamedTemporaryFile(suffix=suffix) as tmp:
+        with field_file.open('rb') as src:
+            shutil.copyfileobj(src, tmp)
+        tmp.flush()
+        yield tmp.name
+
+
+def run_ocr_and_parse(pdf_path, on_stage):
+    """
+    PDF → (ocr_result, parsed_result)
+    - 렌더링/OCR/표 분류를 겹쳐 실행하는 파이프라인 사용
+    """
+    from ai.ocr.ocr_cache import OCRCache
+    from ai.pipeline.full_pipeline import run_pipelined_ocr_and_tables
+    from ai.pipeline.parsing_pipeline import run_parsing_pipeline
+
+    cache = OCRCache(settings.OCR_CACHE_DIR) if settings.OCR_CACHE_DIR else None
+    ocr_result, tables_with_title = run_pipelined_ocr_and_tables(
+        pdf_path,
+        settings.OCR_API_URL,
+        settings.OCR_SECRET_KEY,
+        max_workers=settings.OCR_MAX_WORKERS,
+        cache=cache,
+        on_stage=on_stage,
+    )
+
+    on_stage('PARSE')
+    return ocr_result, run_parsing_pipeline(ocr_result, tables_with_title=tables_with_title)
+
+
+def fill_report_insights(report_id, student_id):
+    """작성중(DRAFT) 리포트에 성적/종합 분석 결과 채우기"""
+    report = ConsultationReport.objects.filter(pk=report_id, status='DRAFT').first()
+    if report is None:
+        return
+
+    grade_analysis = analyze_grades_with_ai(student_id)
+    comprehensive_analysis = generate_comprehensive_analysis_with_ai(student_id)
+
+    report.ai_insights = {
+        '성적분석': grade_analysis,
+        '종합분석': comprehensive_analysis
+    }
+    report.university_analysis = comprehensive_analysis.get('수시카드', {})
+    report.status = 'COMPLETED'
+    report.save(update_fields=['ai_insights', 'university_analysis', 'status', 'updated_at'])
+
+
+def fail_report(report_id):
+    """분석 실패 → 작성중(DRAFT) 리포트를 실패로 (DRAFT로 남지 않도록)"""
+    if report_id:
+        ConsultationReport.objects.filter(pk=report_id, status='DRAFT').update(
+            status='FAILED',
+            updated_at=timezone.now()
+        )
+
+
+def fail_analysis(analysis_id, document_id, report_id, error):
+    """분석 실패 기록: 분석 / 문서 FAILED, 작성중 리포트도 FAILED"""
+    DocumentAnalysis.objects.filter(pk=analysis_id).update(
+        status='FAILED',
+        error_message=f'{type(error).__name__}: {error}',
+        completed_at=timezone.now(),
+        updated_at=timezone.now()
+    )
+    Document.objects.filter(pk=document_id).update(status='FAILED', updated_at=timezone.now())
+    fail_report(report_id)
+
+
+@shared_task
+def process_document_analysis(analysis_id, report_id=None):
+    """
+    문서 분석 1건 처리
+
+    진행 단계(progress_stage): QUEUED → RASTERIZE → OCR → PARSE → ANALYZE → DONE
+    - OCR_API_URL 미설정 또는 파일이 없으면 OCR 단계 없이 목업 분석
+    - report_id가 있으면 분석 완료 후 리포트까지 작성 (실패 시 리포트도 FAILED)
+    """
+    analysis = DocumentAnalysis.objects.select_related('document').get(pk=analysis_id)
+    document = analysis.document
+
+    analysis.status = 'PROCESSING'
+    analysis.started_at = timezone.now()
+    analysis.save(update_fields=['status', 'started_at', 'updated_at'])
+
+    def on_stage(stage):
+        set_analysis_stage(analysis_id, stage)
+
+    try:
+        ocr_result, parsed_result = {}, {}
+        if document.file and settings.OCR_API_URL:
+            with local_file_path(document.file) as pdf_path:
+                ocr_result, parsed_result = run_ocr_and_parse(pdf_path, on_stage)
+
+        on_stage('ANALYZE')
+        analysis_result = analyze_saenggibu_with_ai(parsed_result)
+
+    except Exception as e:
+        fail_analysis(analysis_id, document.pk, report_id, e)
+        return {'analysis_id': str(analysis_id), 'status': 'FAILED'}
+
+    try:
+        # OCR 원본은 DB가 아닌 스토리지에 (트랜잭션 밖에서 저장)
+        ocr_sha256, ocr_size = save_ocr_result(ocr_result) if ocr_result else ('', 0)
+
+        with transaction.atomic():
+            DocumentAnalysis.objects.filter(pk=analysis_id).update(
+                status='COMPLETED',
+                progress_stage='DONE',
+                ocr_sha256=ocr_sha256,
+                ocr_size=ocr_size,
+                parsed_result=parsed_result,
+                analysis_result=analysis_result,
+                completed_at=timezone.now(),
+                updated_at=timezone.now()
+            )
+            documents = Document.objects.filter(pk=document.pk)
+            documents.update(status='COMPLETED', updated_at=timezone.now())
+            documents.refresh_latest_completed_analysis()
+
+            # 생기부 교과 성적 → Grade / SubjectGrade (새 버전으로 일괄 저장)
+            if parsed_result.get('grade_records'):
+                ingest_grade_records(
+                    analysis.student,
+                    parsed_result['grade_records'],
+                    notes=f'생기부 분석 {analysis_id} 자동 입력'
+                )
+
+    except Exception as e:
+        # 저장 실패(스토리지 / 성적 반영) → 완료 처리는 롤백, 실패로 기록 후 다시 raise
+        fail_analysis(analysis_id, document.pk, report_id, e)
+        raise
+
+    if report_id:
+        try:
+            fill_report_insights(report_id, str(analysis.student_id))
+        except Exception:
+            fail_report(report_id)
+            raise
+
+    return {'analysis_id': str(analysis_id), 'status': 'COMPLETED'}
+
+
+# ======================================================
+# 저장된 OCR 결과 재파싱
+# ======================================================
+
+@shared_task
+def reparse_document_chunk(analysis_ids):
+    """재파싱 묶음 1개 처리 (Celery 워커 프로세스가 병렬 단위)"""
+    new_analyses = reparse_chunk(load_source_analyses(analysis_ids))
+    return {
+        'completed': sum(1 for a in new_analyses if a.status == 'COMPLETED'),
+        'failed': sum(1 for a in new_analyses if a.status == 'FAILED'),
+    }
+
+
+@shared_task
+def reparse_documents_task(document_ids=None, chunk_size=None):
+    """
+    저장된 OCR 결과 일괄 재파싱
+    - 대상 분석 ID만 스트리밍으로 읽어 chunk 단위 서브태스크로 분배
+    """
+    chunk_size = chunk_size or settings.REPARSE_CHUNK_SIZE
+    dispatched = 0
+
+    for chunk in iter_id_chunks(source_analysis_ids(document_ids), chunk_size):
+        reparse_document_chunk.delay([str(analysis_id) for analysis_id in chunk])
+        dispatched += len(chunk)
+
+    return {'dispatched': dispatched}
@@ -0,0 +1,422 @@
+import json
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.accounts.models import User
+from apps.students.models import Student
+from apps.documents.models import Document, DocumentAnalysis
+from apps.documents.reparse import reparse_documents
+from apps.documents.ocr_store import ocr_artifact_name, open_ocr_result, save_ocr_result
+from apps.documents.serializers import DocumentSerializer
+from apps.documents.tasks import process_document_analysis
+from apps.reports.models import ConsultationReport
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ReparseDocumentsTestCase(TestCase):
+    """저장된 OCR 결과 재파싱"""
+
+    def setUp(self):
+        self.student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+        self.document = Document.objects.create(student=self.student, title='생기부')
+        self.analysis = DocumentAnalysis.objects.create(
+            document=self.document,
+            student=self.student,
+            status='COMPLETED',
+            ocr_result={'images': [{'name': 'page_1', 'fields': [], 'tables': []}]},
+            analysis_result={'강점요약': {'첫번째_강점': '탐구력'}},
+        )
+
+    def test_reparse_creates_next_version(self):
+        """재파싱 시 다음 버전으로 새 분석 생성, AI 분석 결과는 유지"""
+        counts = reparse_documents()
+
+        self.assertEqual(counts, {'completed': 1, 'failed': 0})
+        latest = self.document.analyses.order_by('-analysis_version').first()
+        self.assertEqual(latest.analysis_version, 2)
+        self.assertEqual(latest.status, 'COMPLETED')
+        # 이전 행의 ocr_result 컬럼은 스토리지로 옮겨서 참조
+        self.assertEqual(latest.get_ocr_result(), self.analysis.ocr_result)
+        self.assertEqual(latest.ocr_result, {})
+        self.assertTrue(latest.ocr_sha256)
+        self.assertEqual(latest.analysis_result, self.analysis.analysis_result)
+        self.assertIn('grade_records', latest.parsed_result)
+        self.document.refresh_from_db()
+        self.assertEqual(self.document.latest_completed_analysis, latest)
+
+    def test_reparse_uses_latest_ocr_per_document(self):
+        """문서당 가장 최근 OCR 결과 1건만 재파싱"""
+        DocumentAnalysis.objects.create(
+            document=self.document,
+            student=self.student,
+            analysis_version=2,
+            status='COMPLETED',
+            ocr_result={'images': []},
+        )
+        # OCR 결과가 없는 분석은 대상 아님
+        other = Document.objects.create(student=self.student, title='성적표')
+        DocumentAnalysis.objects.create(document=other, student=self.student)
+
+        with CaptureQueriesContext(connection) as queries:
+            counts = reparse_documents(chunk_size=1)
+
+        self.assertEqual(counts['completed'], 1)
+        # 대상 선택 쿼리는 ID만 읽음 (이전 버전의 OCR 결과 컬럼은 읽지 않음)
+        self.assertNotIn('"ocr_result"', queries[0]['sql'].split(' FROM ')[0])
+        self.assertEqual(DocumentAnalysis.next_version(self.document), 4)
+        self.assertEqual(DocumentAnalysis.next_version(other), 2)
+
+    def test_command_with_process_pool(self):
+        call_command('reparse_documents', '--workers', '2', stdout=StringIO())
+
+        self.assertEqual(DocumentAnalysis.next_version(self.document), 3)
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class OcrStoreTestCase(TestCase):
+    """OCR 결과 압축 저장소"""
+
+    OCR_RESULT = {'images': [{'name': 'page_1', 'fields': [{'inferText': '출결상황'}], 'tables': []}]}
+
+    def test_same_content_is_stored_once(self):
+        from django.core.files.storage import default_storage
+
+        sha256, size = save_ocr_result(self.OCR_RESULT)
+        # 키 순서가 달라도 같은 내용이면 같은 해시
+        reordered = {'images': [{'tables': [], 'fields': [{'inferText': '출결상황'}], 'name': 'page_1'}]}
+        self.assertEqual(save_ocr_result(reordered), (sha256, size))
+
+        directory = ocr_artifact_name(sha256).rsplit('/', 1)[0]
+        self.assertEqual(len(default_storage.listdir(directory)[1]), 1)
+
+        with open_ocr_result(sha256) as stream:
+            self.assertEqual(json.load(stream), self.OCR_RESULT)
+
+    def test_offload_command_moves_inline_results(self):
+        student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+        document = Document.objects.create(student=student, title='생기부')
+        analysis = DocumentAnalysis.objects.create(
+            document=document, student=student, ocr_result=self.OCR_RESULT
+        )
+
+        call_command('offload_ocr_results', stdout=StringIO())
+
+        analysis.refresh_from_db()
+        self.assertEqual(analysis.ocr_result, {})
+        self.assertEqual(analysis.ocr_size, len(json.dumps(
+            self.OCR_RESULT, ensure_ascii=False, sort_keys=True, separators=(',', ':')
+        ).encode()))
+        self.assertEqual(analysis.get_ocr_result(), self.OCR_RESULT)
+
+
+class LatestCompletedAnalysisTestCase(TestCase):
+    """문서별 최신 완료 분석 일괄 로드"""
+
+    def setUp(self):
+        self.student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+        for i in range(5):
+            document = Document.objects.create(student=self.student, title=f'생기부 {i}')
+            for version, analysis_status in ((1, 'COMPLETED'), (2, 'COMPLETED'), (3, 'FAILED')):
+                DocumentAnalysis.objects.create(
+                    document=document,
+                    student=self.student,
+                    analysis_version=version,
+                    status=analysis_status,
+                    ocr_result={'images': []},
+                    analysis_result={'version': version},
+                )
+        Document.objects.create(student=self.student, title='분석 없음')
+        Document.objects.refresh_latest_completed_analysis()
+
+    def serialize(self, include_results=False):
+        documents = Document.objects.select_related(
+            'student', 'uploaded_by'
+        ).with_latest_completed_analysis(include_results=include_results).order_by('created_at')
+        return DocumentSerializer(
+            documents, many=True, context={'include_analysis_results': include_results}
+        ).data
+
+    def test_constant_queries_and_slim_by_default(self):
+        # 문서 수와 무관하게 포인터 JOIN 쿼리 1회
+        with self.assertNumQueries(1):
+            data = self.serialize()
+
+        latest = [d['latest_analysis'] for d in data]
+        self.assertEqual([a['analysis_version'] for a in latest[:5]], [2] * 5)
+        self.assertIsNone(latest[5])
+        self.assertNotIn('ocr_result', latest[0])
+
+    def test_include_results(self):
+        with self.assertNumQueries(1):
+            data = self.serialize(include_results=True)
+
+        self.assertEqual(data[0]['latest_analysis']['analysis_result'], {'version': 2})
+
+    def test_pointer_follows_delete_and_status_change(self):
+        """최신 완료 분석을 지우거나 상태를 바꾸면 포인터가 이전 완료 분석으로"""
+        document = Document.objects.get(title='생기부 0')
+        latest = document.latest_completed_analysis
+        self.assertEqual(latest.analysis_version, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            latest.delete()
+        document.refresh_from_db()
+        self.assertEqual(document.latest_completed_analysis.analysis_version, 1)
+
+        previous = document.latest_completed_analysis
+        previous.status = 'FAILED'
+        with self.captureOnCommitCallbacks(execute=True):
+            previous.save()
+        document.refresh_from_db()
+        self.assertIsNone(document.latest_completed_analysis)
+
+
+class HeavyFieldsPolicyTestCase(APITestCase):
+    """분석 API 대용량 JSON 컬럼 정책 (목록 제외, 상세 ?include= / ?fields=)"""
+
+    def setUp(self):
+        user = User.objects.create_user(code='C-0001', username='컨설턴트', password='pass1234')
+        self.client.force_authenticate(user)
+
+        student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+        document = Document.objects.create(student=student, title='생기부')
+        self.analysis = DocumentAnalysis.objects.create(
+            document=document,
+            student=student,
+            status='COMPLETED',
+            ocr_result={'images': [{'name': 'page_1'}]},
+            analysis_result={'강점요약': {}},
+        )
+
+    def test_list_reads_metadata_only(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/v1/documents/analyses/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row = response.data['results'][0]
+        self.assertEqual(row['status'], 'COMPLETED')
+        self.assertNotIn('ocr_result', row)
+        self.assertFalse(any('"ocr_result"' in q['sql'] for q in queries.captured_queries))
+
+    def test_retrieve_include_and_fields(self):
+        url = f'/api/v1/documents/analyses/{self.analysis.id}/'
+
+        response = self.client.get(url)
+        self.assertNotIn('analysis_result', response.data)
+
+        response = self.client.get(url, {'include': 'analysis_result'})
+        self.assertEqual(response.data['analysis_result'], {'강점요약': {}})
+        self.assertNotIn('ocr_result', response.data)
+
+        response = self.client.get(url, {'fields': 'status,analysis_version'})
+        self.assertEqual(set(response.data), {'id', 'status', 'analysis_version'})
+
+
+class DocumentVersioningTestCase(TestCase):
+    """학생/문서 타입별 문서 버전, 문서별 분석 버전"""
+
+    def test_versions_per_group(self):
+        student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+        first = Document.objects.create(student=student, title='생기부 1')
+        second = Document.objects.create(student=student, title='생기부 2')
+        mock_exam = Document.objects.create(student=student, title='모의고사', document_type='모의고사')
+
+        first.refresh_from_db()
+        self.assertEqual((first.version, first.is_latest), (1, False))
+        self.assertEqual((second.version, second.is_latest), (2, True))
+        self.assertEqual((mock_exam.version, mock_exam.is_latest), (1, True))
+
+        versions = [
+            DocumentAnalysis.objects.create(document=second, student=student).analysis_version
+            for _ in range(3)
+        ]
+        self.assertEqual(versions, [1, 2, 3])
+        self.assertEqual(
+            DocumentAnalysis.objects.create(document=first, student=student).analysis_version, 1
+        )
+
+
+class ProcessDocumentAnalysisTestCase(TestCase):
+    """비동기 문서 분석 태스크"""
+
+    def setUp(self):
+        self.student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+        self.document = Document.objects.create(student=self.student, title='생기부', status='PROCESSING')
+        self.analysis = DocumentAnalysis.objects.create(
+            document=self.document,
+            student=self.student,
+            progress_stage='QUEUED',
+        )
+
+    @override_settings(OCR_API_URL='')
+    def test_completes_with_mock_and_fills_report(self):
+        """OCR 미설정 시 목업 분석으로 완료, 작성중 리포트 채움"""
+        report = ConsultationReport.objects.create(
+            student=self.student, report_type='INITIAL', title='리포트'
+        )
+
+        result = process_document_analysis(str(self.analysis.id), str(report.id))
+
+        self.assertEqual(result['status'], 'COMPLETED')
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.status, 'COMPLETED')
+        self.assertEqual(self.analysis.progress_stage, 'DONE')
+        self.assertIsNotNone(self.analysis.started_at)
+        self.assertIsNotNone(self.analysis.completed_at)
+        self.assertIn('강점요약', self.analysis.analysis_result)
+        self.assertIs(self.analysis.analysis_result['mock'], True)
+        self.document.refresh_from_db()
+        self.assertEqual(self.document.status, 'COMPLETED')
+        self.assertEqual(self.document.latest_completed_analysis, self.analysis)
+        report.refresh_from_db()
+        self.assertEqual(report.status, 'COMPLETED')
+        self.assertIn('성적분석', report.ai_insights)
+
+    @override_settings(OCR_API_URL='')
+    def test_failure_keeps_last_stage(self):
+        """분석 실패 시 실패 단계와 에러 메시지 기록, 작성중 리포트도 실패 처리"""
+        report = ConsultationReport.objects.create(
+            student=self.student, report_type='INITIAL', title='리포트'
+        )
+
+        with mock.patch(
+            'apps.documents.tasks.analyze_saenggibu_with_ai',
+            side_effect=RuntimeError('AI 모듈 오류')
+        ):
+            result = process_document_analysis(str(self.analysis.id), str(report.id))
+
+        self.assertEqual(result['status'], 'FAILED')
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.status, 'FAILED')
+        self.assertEqual(self.analysis.progress_stage, 'ANALYZE')
+        self.assertIn('AI 모듈 오류', self.analysis.error_message)
+        self.document.refresh_from_db()
+        self.assertEqual(self.document.status, 'FAILED')
+        self.assertIsNone(self.document.latest_completed_analysis)
+        report.refresh_from_db()
+        self.assertEqual(report.status, 'FAILED')
+        self.assertEqual(report.ai_insights, {})
+
+    @override_settings(OCR_API_URL='http://ocr.example.com')
+    def test_completion_failure_marks_everything_failed(self):
+        """성적 반영 중 오류 → 분석 / 문서 / 리포트 모두 실패"""
+        report = ConsultationReport.objects.create(
+            student=self.student, report_type='INITIAL', title='리포트'
+        )
+        self.document.file = 'documents/record.pdf'
+        self.document.save(update_fields=['file'])
+
+        with mock.patch(
+            'apps.documents.tasks.run_ocr_and_parse',
+            return_value=({}, {'grade_records': [{'subject': '수학'}]})
+        ), mock.patch(
+            'apps.documents.tasks.ingest_grade_records',
+            side_effect=ValueError('잘못된 성적 행')
+        ):
+            with self.assertRaises(ValueError):
+                process_document_analysis(str(self.analysis.id), str(report.id))
+
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.status, 'FAILED')
+        self.assertIn('잘못된 성적 행', self.analysis.error_message)
+        self.document.refresh_from_db()
+        self.assertEqual(self.document.status, 'FAILED')
+        self.assertIsNone(self.document.latest_completed_analysis)
+        report.refresh_from_db()
+        self.assertEqual(report.status, 'FAILED')
+
+    @override_settings(OCR_API_URL='')
+    def test_report_failure_marks_report_failed(self):
+        """리포트 작성 중 오류 → 분석은 완료, 리포트는 실패"""
+        report = ConsultationReport.objects.create(
+            student=self.student, report_type='INITIAL', title='리포트'
+        )
+
+        with mock.patch(
+            'apps.documents.tasks.analyze_grades_with_ai',
+            side_effect=RuntimeError('AI 모듈 오류')
+        ):
+            with self.assertRaises(RuntimeError):
+                process_document_analysis(str(self.analysis.id), str(report.id))
+
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.status, 'COMPLETED')
+        report.refresh_from_db()
+        self.assertEqual(report.status, 'FAILED')
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class RegisterSaenggibuOnestopTestCase(APITestCase):
+    """생기부 등록 원포인트 API - 분석은 커밋 이후 태스크로 실행"""
+
+    def test_returns_202_and_dispatches_after_commit(self):
+        payload = {
+            'name': '홍길동',
+            'major_track': 'SCIENCE',
+            'desired_universities': json.dumps([{'university': '서울대', 'department': '컴공'}]),
+            'file': SimpleUploadedFile('record.pdf', b'%PDF-1.4', content_type='application/pdf'),
+        }
+
+        with mock.patch('apps.students.mvp_views.process_document_analysis') as task:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post('/api/v1/mvp/register-saenggibu/', payload, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        data = response.data['data']
+        task.delay.assert_called_once_with(data['analysis_id'], data['report_id'])
+
+        analysis = DocumentAnalysis.objects.get(pk=data['analysis_id'])
+        self.assertEqual(analysis.status, 'PENDING')
+        self.assertEqual(analysis.progress_stage, 'QUEUED')
+        self.assertTrue(analysis.document.file)
+        self.assertEqual(ConsultationReport.objects.get(pk=data['report_id']).status, 'DRAFT')
+
+
+class LatestAnalysisResponseCacheTestCase(APITestCase):
+    """최신 분석 조회 응답 캐시 (analysis_version / updated_at 키)"""
+
+    def setUp(self):
+        user = User.objects.create_user(code='C-0001', username='컨설턴트', password='pass1234')
+        self.client.force_authenticate(user)
+
+        student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+        self.document = Document.objects.create(student=student, title='생기부')
+        DocumentAnalysis.objects.create(
+            document=self.document,
+            student=student,
+            status='COMPLETED',
+            analysis_result={'강점요약': {'내용': '처음'}},
+        )
+        Document.objects.filter(pk=self.document.pk).refresh_latest_completed_analysis()
+        self.url = f'/api/v1/documents/documents/{self.document.id}/latest-analysis/'
+
+    def test_cached_until_new_version(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.data['data']['생기부_분석']['강점요약']['내용'], '처음')
+
+        # 캐시 적중: 문서 + 분석 메타데이터 조회 1회 (분석 결과 JSON은 읽지 않음)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(self.url).data, first.data)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"analysis_result"', queries[0]['sql'])
+
+        # 재분석 / 재파싱 → 새 분석 버전
+        DocumentAnalysis.objects.create(
+            document=self.document,
+            student=self.document.student,
+            status='COMPLETED',
+            analysis_result={'강점요약': {'내용': '수정'}},
+        )
+        Document.objects.filter(pk=self.document.pk).refresh_latest_completed_analysis()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['data']['analysis_version'], 2)
+        self.assertEqual(response.data['data']['생기부_분석']['강점요약']['내용'], '수정')
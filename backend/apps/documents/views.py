@@ -3,21 +3,31 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db import transaction
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema, extend_schema_view
+from core.cache import cached_response, version_stamp
+from core.mixins import HeavyFieldsViewSetMixin
 from .models import Document, DocumentAnalysis
 from .serializers import (
     DocumentSerializer,
     DocumentListSerializer,
     DocumentUploadSerializer,
-    DocumentAnalysisSerializer
+    DocumentAnalysisSerializer,
+    DocumentAnalysisSummarySerializer
 )
 from apps.reports.ai_module import get_mock_saenggibu_analysis
+from .tasks import process_document_analysis
 
 
 @extend_schema_view(
     list=extend_schema(tags=['Documents'], summary='문서 목록 조회', exclude=True),
-    retrieve=extend_schema(tags=['Documents'], summary='문서 상세 조회', exclude=True),
+    retrieve=extend_schema(
+        tags=['Documents'],
+        summary='문서 상세 조회',
+        description='기본은 최신 분석 요약만 반환, ?include=analysis_results 시 OCR/분석 결과 포함',
+        exclude=True
+    ),
     create=extend_schema(tags=['Documents'], summary='문서 업로드', exclude=True),
     destroy=extend_schema(tags=['Documents'], summary='문서 삭제', exclude=True),
 )
@@ -44,6 +54,30 @@ class DocumentViewSet(viewsets.ModelViewSet):
             return DocumentUploadSerializer
         return DocumentSerializer
 
+    def include_analysis_results(self):
+        """?include=analysis_results 일 때만 최신 분석의 OCR/분석 결과 포함"""
+        if self.request is None:
+            return False
+        include = self.request.query_params.get('include', '')
+        return 'analysis_results' in include.split(',')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            # 최신 완료 분석을 문서 수와 무관하게 쿼리 1회로 로드
+            queryset = queryset.with_latest_completed_analysis(
+                include_results=self.include_analysis_results()
+            )
+        elif self.action == 'get_latest_analysis':
+            # 분석 버전만 먼저 확인 (분석 결과 JSON은 응답 캐시 미스일 때만)
+            queryset = queryset.with_latest_completed_analysis()
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['include_analysis_results'] = self.include_analysis_results()
+        return context
+
     def perform_create(self, serializer):
         """서류 생성 시 업로더 자동 설정"""
         serializer.save(uploaded_by=self.request.user)
@@ -70,20 +104,28 @@ class DocumentViewSet(viewsets.ModelViewSet):
                 'message': '이미 처리 중인 문서입니다.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # DocumentAnalysis 생성
-        analysis = DocumentAnalysis.objects.create(
-            document=document,
-            student=document.student,
-            status='PENDING'
-        )
+        if not document.file:
+            return Response({
+                'success': False,
+                'message': '분석할 파일이 없는 문서입니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            # DocumentAnalysis 생성
+            analysis = DocumentAnalysis.objects.create(
+                document=document,
+                student=document.student,
+                status='PENDING',
+                progress_stage='QUEUED'
+            )
 
-        # 문서 상태 업데이트
-        document.status = 'PROCESSING'
-        document.save()
+            # 문서 상태 업데이트
+            document.status = 'PROCESSING'
+            document.save(update_fields=['status', 'updated_at'])
 
-        # TODO: Celery 태스크 실행
-        # from apps.documents.tasks import process_document_analysis
-        # process_document_analysis.delay(str(analysis.id))
+            # 커밋 이후에 태스크 실행 (워커가 아직 없는 행을 읽지 않도록)
+            analysis_id = str(analysis.id)
+            transaction.on_commit(lambda: process_document_analysis.delay(analysis_id))
 
         return Response({
             'success': True,
@@ -91,7 +133,8 @@ class DocumentViewSet(viewsets.ModelViewSet):
             'data': {
                 'document_id': str(document.id),
                 'analysis_id': str(analysis.id),
-                'status': analysis.status
+                'status': analysis.status,
+                'progress_stage': analysis.progress_stage
             }
         }, status=status.HTTP_202_ACCEPTED)
 
@@ -102,10 +145,10 @@ class DocumentViewSet(viewsets.ModelViewSet):
         exclude=True
     )
     def get_analyses(self, request, pk=None):
-        """문서의 모든 분석 이력 조회"""
+        """문서의 모든 분석 이력 조회 (메타데이터만, 결과는 분석 상세 API에서)"""
         document = self.get_object()
-        analyses = document.analyses.all()
-        serializer = DocumentAnalysisSerializer(analyses, many=True)
+        analyses = document.analyses.defer_heavy()
+        serializer = DocumentAnalysisSummarySerializer(analyses, many=True)
 
         return Response({
             'success': True,
@@ -122,11 +165,10 @@ class DocumentViewSet(viewsets.ModelViewSet):
         """
         문서의 최신 완료된 분석 결과 조회
         - 프론트엔드가 사용할 생기부 분석 화면용 API
+        - 응답은 (분석 id, analysis_version, updated_at) 키로 캐시 → 수정 시 새 버전 / 새 키
         """
         document = self.get_object()
-        latest_analysis = document.analyses.filter(
-            status='COMPLETED'
-        ).order_by('-analysis_version').first()
+        latest_analysis = document.get_latest_completed_analysis()
 
         if not latest_analysis:
             return Response({
@@ -134,15 +176,21 @@ class DocumentViewSet(viewsets.ModelViewSet):
                 'message': '완료된 분석 결과가 없습니다.'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        return Response({
-            'success': True,
-            'data': {
-                'analysis_id': str(latest_analysis.id),
-                'analysis_version': latest_analysis.analysis_version,
-                'completed_at': latest_analysis.completed_at,
-                '생기부_분석': latest_analysis.analysis_result
-            }
-        })
+        return cached_response(
+            [
+                'latest-analysis', latest_analysis.id,
+                latest_analysis.analysis_version, version_stamp(latest_analysis.updated_at)
+            ],
+            lambda: Response({
+                'success': True,
+                'data': {
+                    'analysis_id': str(latest_analysis.id),
+                    'analysis_version': latest_analysis.analysis_version,
+                    'completed_at': latest_analysis.completed_at,
+                    '생기부_분석': latest_analysis.analysis_result
+                }
+            })
+        )
 
     @action(detail=True, methods=['patch'], url_path='update-analysis')
     @extend_schema(
@@ -161,9 +209,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
         - 전체 또는 일부 필드만 수정 가능
         """
         document = self.get_object()
-        latest_analysis = document.analyses.filter(
-            status='COMPLETED'
-        ).order_by('-analysis_version').first()
+        latest_analysis = document.get_latest_completed_analysis()
 
         if not latest_analysis:
             return Response({
@@ -194,14 +240,16 @@ class DocumentViewSet(viewsets.ModelViewSet):
         deep_update(merged_result, updated_data)
 
         # 새 버전으로 저장
-        new_analysis = DocumentAnalysis.objects.create(
-            document=document,
-            student=document.student,
-            status='COMPLETED',
-            analysis_result=merged_result,
-            started_at=latest_analysis.started_at,
-            completed_at=timezone.now()
-        )
+        with transaction.atomic():
+            new_analysis = DocumentAnalysis.objects.create(
+                document=document,
+                student=document.student,
+                status='COMPLETED',
+                analysis_result=merged_result,
+                started_at=latest_analysis.started_at,
+                completed_at=timezone.now()
+            )
+            Document.objects.filter(pk=document.pk).refresh_latest_completed_analysis()
 
         return Response({
             'success': True,
@@ -236,19 +284,21 @@ class DocumentViewSet(viewsets.ModelViewSet):
         # 목업 분석 데이터 생성
         mock_analysis = get_mock_saenggibu_analysis()
 
-        # DocumentAnalysis 생성
-        analysis = DocumentAnalysis.objects.create(
-            document=document,
-            student=document.student,
-            status='COMPLETED',
-            analysis_result=mock_analysis,
-            started_at=timezone.now(),
-            completed_at=timezone.now()
-        )
-
-        # 문서 상태 업데이트
-        document.status = 'COMPLETED'
-        document.save()
+        with transaction.atomic():
+            # DocumentAnalysis 생성
+            analysis = DocumentAnalysis.objects.create(
+                document=document,
+                student=document.student,
+                status='COMPLETED',
+                analysis_result=mock_analysis,
+                started_at=timezone.now(),
+                completed_at=timezone.now()
+            )
+
+            # 문서 상태 업데이트
+            document.status = 'COMPLETED'
+            document.save(update_fields=['status', 'updated_at'])
+            Document.objects.filter(pk=document.pk).refresh_latest_completed_analysis()
 
         return Response({
             'success': True,
@@ -263,11 +313,18 @@ class DocumentViewSet(viewsets.ModelViewSet):
 
 @extend_schema_view(
     list=extend_schema(tags=['Documents'], summary='분석 이력 목록', exclude=True),
-    retrieve=extend_schema(tags=['Documents'], summary='분석 상세 조회', exclude=True),
+    retrieve=extend_schema(
+        tags=['Documents'],
+        summary='분석 상세 조회',
+        description='?include=ocr_result,parsed_result,analysis_result 로 결과 컬럼 포함, ?fields= 로 응답 필드 선택',
+        exclude=True
+    ),
 )
-class DocumentAnalysisViewSet(viewsets.ReadOnlyModelViewSet):
+class DocumentAnalysisViewSet(HeavyFieldsViewSetMixin, viewsets.ReadOnlyModelViewSet):
     """
     문서 분석 이력 ViewSet (읽기 전용)
+
+    - 목록은 메타데이터만 (OCR/파싱/분석 결과 컬럼은 읽지 않음)
     """
     queryset = DocumentAnalysis.objects.select_related(
         'document', 'student'
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Grade, SubjectGrade
+from .models import CohortRanking, Grade, SubjectGrade
 
 
 class SubjectGradeInline(admin.TabularInline):
@@ -53,7 +53,15 @@ class GradeAdmin(admin.ModelAdmin):
 
 @admin.register(SubjectGrade)
 class SubjectGradeAdmin(admin.ModelAdmin):
-    list_display = ['grade', 'subject_name', 'raw_score', 'grade_rank', 'percentile', 'class_rank', 'created_at']
+    list_display = ['grade', 'subject_name', 'subject_area', 'credit', 'raw_score', 'grade_rank', 'percentile', 'class_rank', 'created_at']
     list_filter = ['subject_name', 'created_at']
     search_fields = ['grade__student__name', 'subject_name']
     ordering = ['-created_at']
+
+
+@admin.register(CohortRanking)
+class CohortRankingAdmin(admin.ModelAdmin):
+    list_display = ['university', 'major_type', 'rank', 'student', 'gpa', 'total_credits', 'computed_at']
+    list_filter = ['university', 'major_type']
+    search_fields = ['student__name']
+    ordering = ['university', 'major_type', 'rank']
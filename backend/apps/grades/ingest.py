@@ -0,0 +1,133 @@
+"""
+생기부 파싱 결과 → Grade / SubjectGrade 일괄 저장
+
+parsed_result['grade_records'] (학년 → 학기 → 과목/단위수/석차등급)를
+학기별 Grade 1건 + 과목별 SubjectGrade로 변환해서 bulk_create로 저장한다.
+
+- 행마다 Grade.save()를 거치지 않고 학기 그룹 전체의 버전을 claim_versions로 한 번에 확보
+  (is_latest 해제 + 최대 버전 조회, PostgreSQL에서는 그룹 잠금 후 한 문장)
+- 3년치 생기부 전체가 쿼리 몇 번(잠금, 버전 확보, Grade 삽입, SubjectGrade 삽입)으로 저장됨
+- 진로선택과목 / 체육·예술은 학기 구분과 석차등급이 없어 저장하지 않음
+"""
+import re
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import transaction
+
+from .models import Grade, SubjectGrade
+
+
+SEMESTER_CODES = {code for code, _ in Grade.SEMESTER_CHOICES}
+SUBJECT_NAME_MAX_LENGTH = SubjectGrade._meta.get_field('subject_name').max_length
+SUBJECT_AREA_MAX_LENGTH = SubjectGrade._meta.get_field('subject_area').max_length
+
+
+def semester_code(year_key, term_key):
+    """('1학년', '2학기') → '1-2' (학기 선택지에 없으면 None)"""
+    year = re.match(r'(\d+)학년', year_key)
+    term = re.match(r'(\d+)학기', term_key)
+    if not year or not term:
+        return None
+
+    code = f'{year.group(1)}-{term.group(1)}'
+    return code if code in SEMESTER_CODES else None
+
+
+def valid_rank(rank):
+    """1~9 석차등급만 사용 (OCR 오인식으로 범위 밖 숫자가 들어올 수 있음)"""
+    return rank if isinstance(rank, int) and 1 <= rank <= 9 else None
+
+
+def weighted_rank_average(subjects):
+    """단위수 가중 평균 석차등급 (석차등급/단위수가 모두 있는 과목만)"""
+    total_credit = 0
+    total = 0
+    for subject in subjects:
+        rank = valid_rank(subject.get('석차등급'))
+        credit = subject.get('단위수')
+        if rank is None or not credit:
+            continue
+        total += rank * credit
+        total_credit += credit
+
+    if not total_credit:
+        return None
+    return (Decimal(total) / Decimal(total_credit)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+def group_grade_records(grade_records):
+    """
+    중첩 성적 JSON → {학기 코드: [과목 dict, ...]}
+    - 같은 학기 안에서 과목명이 겹치면 처음 것만 사용 (SubjectGrade unique_together)
+    """
+    semesters = {}
+
+    for year_key, terms in (grade_records or {}).items():
+        for term_key, subjects in terms.items():
+            code = semester_code(year_key, term_key)
+            if code is None or not subjects:
+                continue
+
+            seen = set()
+            rows = semesters.setdefault(code, [])
+            for subject in subjects:
+                name = (subject.get('과목') or '').strip()[:SUBJECT_NAME_MAX_LENGTH]
+                if not name or name in seen:
+                    continue
+                seen.add(name)
+                rows.append({**subject, '과목': name})
+
+    return {code: rows for code, rows in semesters.items() if rows}
+
+
+def ingest_grade_records(student, grade_records, exam_type='OVERALL', notes=''):
+    """
+    파싱된 성적을 학생의 새 Grade 버전으로 저장
+
+    Args:
+        student: Student 인스턴스
+        grade_records: parsed_result['grade_records']
+        exam_type: Grade.exam_type (생기부 교과 성적은 'OVERALL')
+
+    Returns:
+        list[Grade]: 새로 만든 Grade (학기 순)
+    """
+    semesters = group_grade_records(grade_records)
+    if not semesters:
+        return []
+
+    with transaction.atomic():
+        versions = Grade.objects.claim_versions(
+            [(student.pk, code, exam_type) for code in semesters]
+        )
+
+        grades = []
+        subject_grades = []
+        for code in sorted(semesters):
+            subjects = semesters[code]
+            grade = Grade(
+                student=student,
+                semester=code,
+                exam_type=exam_type,
+                gpa=weighted_rank_average(subjects),
+                version=versions[(student.pk, code, exam_type)],
+                is_latest=True,
+                notes=notes,
+            )
+            grades.append(grade)
+
+            for subject in subjects:
+                rank = valid_rank(subject.get('석차등급'))
+                subject_grades.append(SubjectGrade(
+                    grade=grade,
+                    subject_name=subject['과목'],
+                    subject_area=(subject.get('교과') or '')[:SUBJECT_AREA_MAX_LENGTH],
+                    credit=subject.get('단위수'),
+                    grade_rank=Decimal(rank) if rank is not None else None,
+                ))
+
+        # Grade.save()를 거치지 않으므로 버전은 위에서 확보한 번호 사용
+        Grade.objects.bulk_create(grades)
+        SubjectGrade.objects.bulk_create(subject_grades)
+
+    return grades
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.grades.ranking import rebuild_cohort_ranking
+
+
+class Command(BaseCommand):
+    help = 'ACTIVE 학생 전체의 대학/계열별 환산 평균 순위 재계산 (CohortRanking 교체)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('university', help='대학 (예: gachon, 가천대학교)')
+        parser.add_argument(
+            '--major-type', action='append', dest='major_types', default=None,
+            help='계열 (여러 번 지정 가능, 기본: humanities / science / medical)'
+        )
+        parser.add_argument(
+            '--exam-type', default='OVERALL',
+            help='반영할 시험 유형 (기본: OVERALL)'
+        )
+
+    def handle(self, *args, **options):
+        for major_type in options['major_types'] or ['humanities', 'science', 'medical']:
+            try:
+                count = rebuild_cohort_ranking(
+                    options['university'], major_type, exam_type=options['exam_type']
+                )
+            except ValueError as e:
+                raise CommandError(str(e))
+
+            self.stdout.write(self.style.SUCCESS(
+                f"{options['university']} {major_type}: {count}명 순위 저장"
+            ))
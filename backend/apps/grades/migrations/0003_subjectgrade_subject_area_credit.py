@@ -0,0 +1,24 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("grades", "0002_alter_grade_options_alter_grade_unique_together_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="subjectgrade",
+            name="credit",
+            field=models.PositiveSmallIntegerField(
+                blank=True, null=True, verbose_name="단위수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="subjectgrade",
+            name="subject_area",
+            field=models.CharField(blank=True, max_length=50, verbose_name="교과"),
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:30
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("grades", "0003_subjectgrade_subject_area_credit"),
+        ("students", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CohortRanking",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "university",
+                    models.CharField(
+                        help_text="변환 규칙 키", max_length=100, verbose_name="대학"
+                    ),
+                ),
+                ("major_type", models.CharField(max_length=20, verbose_name="계열")),
+                ("rank", models.PositiveIntegerField(verbose_name="순위")),
+                (
+                    "gpa",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=6, verbose_name="환산 평균"
+                    ),
+                ),
+                (
+                    "total_credits",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="학년 반영비율 적용",
+                        max_digits=7,
+                        verbose_name="반영 단위수",
+                    ),
+                ),
+                ("computed_at", models.DateTimeField(verbose_name="계산 시각")),
+                (
+                    "student",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="cohort_rankings",
+                        to="students.student",
+                        verbose_name="학생",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "학생 순위",
+                "verbose_name_plural": "학생 순위",
+                "db_table": "cohort_rankings",
+                "ordering": ["university", "major_type", "rank"],
+                "indexes": [
+                    models.Index(
+                        fields=["university", "major_type", "rank"],
+                        name="cohort_rank_univers_796d0e_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="cohortranking",
+            constraint=models.UniqueConstraint(
+                fields=("university", "major_type", "student"),
+                name="cohort_ranking_unique_student",
+            ),
+        ),
+    ]
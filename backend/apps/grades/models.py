@@ -1,10 +1,11 @@
 import uuid
 from django.db import models
 from decimal import Decimal
+from core.managers import VersionedQuerySet, VersionedModelMixin
 from .utils import convert_9_to_5, convert_5_to_9
 
 
-class Grade(models.Model):
+class Grade(VersionedModelMixin, models.Model):
     """학생 성적 관리"""
     SEMESTER_CHOICES = (
         ('1-1', '1학년 1학기'),
@@ -108,6 +109,13 @@ class Grade(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # 저장 시 자동 버전 관리 (같은 학생/학기/시험의 다음 버전, 이전 버전은 최신 해제)
+    objects = VersionedQuerySet.as_manager()
+
+    VERSION_GROUP = ('student', 'semester', 'exam_type')
+    VERSION_FIELD = 'version'
+    LATEST_FIELD = 'is_latest'
+
     class Meta:
         db_table = 'grades'
         verbose_name = '성적'
@@ -124,30 +132,6 @@ class Grade(models.Model):
     def __str__(self):
         return f"{self.student.name} - {self.get_semester_display()} - {self.get_exam_type_display()}"
 
-    def save(self, *args, **kwargs):
-        """저장 시 자동 버전 관리"""
-        if not self.pk:  # 새로 생성되는 경우
-            # 같은 학생/학기/시험의 기존 성적을 is_latest=False로
-            if self.is_latest:
-                Grade.objects.filter(
-                    student=self.student,
-                    semester=self.semester,
-                    exam_type=self.exam_type,
-                    is_latest=True
-                ).update(is_latest=False)
-
-            # 마지막 버전 번호 +1
-            last_grade = Grade.objects.filter(
-                student=self.student,
-                semester=self.semester,
-                exam_type=self.exam_type
-            ).order_by('-version').first()
-
-            if last_grade:
-                self.version = last_grade.version + 1
-
-        super().save(*args, **kwargs)
-
     @property
     def average_grade(self):
         """전체 평균 등급 계산"""
@@ -248,6 +232,8 @@ class SubjectGrade(models.Model):
         verbose_name='성적'
     )
     subject_name = models.CharField(max_length=50, verbose_name='과목명')
+    subject_area = models.CharField(max_length=50, blank=True, verbose_name='교과')
+    credit = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name='단위수')
 
     # 내신 성적
     raw_score = models.DecimalField(
@@ -300,3 +286,43 @@ class SubjectGrade(models.Model):
 
     def __str__(self):
         return f"{self.grade.student.name} - {self.subject_name}"
+
+
+class CohortRanking(models.Model):
+    """
+    대학/계열별 전체 학생(ACTIVE) 환산 평균 순위 (rebuild_cohort_ranking으로 재계산)
+    - 순위 화면은 (대학, 계열, 순위) 인덱스로 바로 읽음
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    university = models.CharField(max_length=100, verbose_name='대학', help_text='변환 규칙 키')
+    major_type = models.CharField(max_length=20, verbose_name='계열')
+    student = models.ForeignKey(
+        'students.Student',
+        on_delete=models.CASCADE,
+        related_name='cohort_rankings',
+        verbose_name='학생'
+    )
+    rank = models.PositiveIntegerField(verbose_name='순위')
+    gpa = models.DecimalField(max_digits=6, decimal_places=2, verbose_name='환산 평균')
+    total_credits = models.DecimalField(
+        max_digits=7, decimal_places=2, verbose_name='반영 단위수', help_text='학년 반영비율 적용'
+    )
+    computed_at = models.DateTimeField(verbose_name='계산 시각')
+
+    class Meta:
+        db_table = 'cohort_rankings'
+        verbose_name = '학생 순위'
+        verbose_name_plural = '학생 순위'
+        ordering = ['university', 'major_type', 'rank']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['university', 'major_type', 'student'],
+                name='cohort_ranking_unique_student'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['university', 'major_type', 'rank']),
+        ]
+
+    def __str__(self):
+        return f"{self.university} {self.major_type} {self.rank}위 - {self.student_id}"
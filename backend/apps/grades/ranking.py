@@ -0,0 +1,146 @@
+"""
+대학/계열별 전체 학생 환산 평균 순위 (CohortRanking)
+
+- ACTIVE 학생의 최신 과목 성적을 스트리밍 쿼리 1회로 읽음 (학생별 조회 없음)
+- 컴파일된 대학 규칙(get_rule)의 석차등급 → 배점 배열과 학년 반영비율을
+  과목 전체에 한 번에 적용하고 학생별로 합산 (NumPy가 있으면 bincount)
+- 결과는 CohortRanking에 통째로 교체 저장 → 순위 화면은 인덱스 조회 한 번
+"""
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import CohortRanking, SubjectGrade
+from .university_converters import get_rule
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+STREAM_CHUNK_SIZE = 5000
+
+
+def stream_cohort_subjects(exam_type='OVERALL', chunk_size=STREAM_CHUNK_SIZE):
+    """
+    ACTIVE 학생 최신 과목 성적 → (student_id, 학년, 단위수, 석차등급) 스트림
+    - 석차등급이 1~9 정수가 아니거나 단위수가 없는 과목은 제외 (load_transcript와 같은 기준)
+    """
+    rows = SubjectGrade.objects.filter(
+        grade__student__status='ACTIVE',
+        grade__is_latest=True,
+        grade__exam_type=exam_type,
+        credit__gt=0,
+        grade_rank__gte=1,
+        grade_rank__lte=9,
+    ).order_by().values_list(
+        'grade__student_id', 'grade__semester', 'credit', 'grade_rank'
+    ).iterator(chunk_size=chunk_size)
+
+    for student_id, semester, credit, rank in rows:
+        if rank == int(rank):
+            yield student_id, int(semester[0]), credit, int(rank)
+
+
+def score_cohort(rows, rule):
+    """
+    과목 스트림 → {student_id: (환산 평균, 반영 단위수)}
+    - 계산은 CompiledRule.calculate_gpa와 같음 (학년 반영비율 × 단위수 가중 평균)
+    - 반영 단위수가 0인 학생은 제외
+    """
+    year_weights = rule.year_weights
+    gpa_scores = rule.gpa_scores
+
+    if np is None:
+        totals = {}
+        for student_id, year, credit, rank in rows:
+            weight = year_weights.get(year, 1.0)
+            if not weight:
+                continue
+            credit *= weight
+            score, credits = totals.get(student_id, (0, 0))
+            totals[student_id] = (score + gpa_scores[rank] * credit, credits + credit)
+
+        return {
+            student_id: (round(score / credits, 2), credits)
+            for student_id, (score, credits) in totals.items()
+        }
+
+    students = {}
+    index, years, credits, ranks = [], [], [], []
+    for student_id, year, credit, rank in rows:
+        index.append(students.setdefault(student_id, len(students)))
+        years.append(year)
+        credits.append(credit)
+        ranks.append(rank)
+
+    if not students:
+        return {}
+
+    years = np.asarray(years)
+    weight_table = np.array([year_weights.get(year, 1.0) for year in range(years.max() + 1)])
+    weighted_credits = np.asarray(credits, dtype=float) * weight_table[years]
+    scores = np.asarray(gpa_scores, dtype=float)[np.asarray(ranks)] * weighted_credits
+
+    index = np.asarray(index)
+    score_sums = np.bincount(index, weights=scores, minlength=len(students))
+    credit_sums = np.bincount(index, weights=weighted_credits, minlength=len(students))
+
+    return {
+        student_id: (round(score_sums[i] / credit_sums[i], 2), float(credit_sums[i]))
+        for student_id, i in students.items()
+        if credit_sums[i] > 0
+    }
+
+
+def rank_scores(scores, higher_is_better=True):
+    """
+    {student_id: (환산 평균, 반영 단위수)} → [(순위, student_id, 환산 평균, 반영 단위수), ...]
+    - 동점은 같은 순위 (1, 2, 2, 4)
+    """
+    sign = -1 if higher_is_better else 1
+    ordered = sorted(scores.items(), key=lambda item: (sign * item[1][0], str(item[0])))
+
+    ranked = []
+    previous = None
+    for position, (student_id, (gpa, credits)) in enumerate(ordered, start=1):
+        if gpa != previous:
+            rank, previous = position, gpa
+        ranked.append((rank, student_id, gpa, credits))
+    return ranked
+
+
+def rebuild_cohort_ranking(university, major_type, exam_type='OVERALL', chunk_size=STREAM_CHUNK_SIZE):
+    """
+    (대학, 계열) 순위 전체 재계산 후 CohortRanking 교체
+
+    Returns:
+        int: 순위에 들어간 학생 수
+
+    Raises:
+        ValueError: 규칙이 없는 대학 / 계열
+    """
+    rule = get_rule(university, major_type)
+    scores = score_cohort(stream_cohort_subjects(exam_type, chunk_size), rule)
+    computed_at = timezone.now()
+
+    rankings = [
+        CohortRanking(
+            university=rule.university,
+            major_type=major_type,
+            student_id=student_id,
+            rank=rank,
+            gpa=Decimal(str(gpa)),
+            total_credits=Decimal(str(round(credits, 2))),
+            computed_at=computed_at,
+        )
+        for rank, student_id, gpa, credits in rank_scores(scores, rule.higher_is_better)
+    ]
+
+    with transaction.atomic():
+        CohortRanking.objects.filter(university=rule.university, major_type=major_type).delete()
+        CohortRanking.objects.bulk_create(rankings, batch_size=1000)
+
+    return len(rankings)
@@ -9,7 +9,7 @@ class SubjectGradeSerializer(serializers.ModelSerializer):
     class Meta:
         model = SubjectGrade
         fields = [
-            'id', 'grade', 'subject_name', 'raw_score', 'standard_score',
+            'id', 'grade', 'subject_name', 'subject_area', 'credit', 'raw_score', 'standard_score',
             'grade_rank', 'percentile', 'class_rank', 'class_total',
             'grade_rank_in_school', 'grade_total_in_school',
             'created_at', 'updated_at'
@@ -1,9 +1,23 @@
-from django.test import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from rest_framework.test import APITestCase
+from apps.accounts.models import User
+from apps.students.models import Student, StudentDesiredUniversity
+from apps.grades import ranking
+from apps.grades.models import CohortRanking, Grade, SubjectGrade
+from apps.grades.ingest import ingest_grade_records
+from apps.grades import utils as grade_utils
 from apps.grades.utils import (
-    convert_9_to_5, convert_5_to_9,
+    convert_9_to_5, convert_5_to_9, convert_grades,
     calculate_rank_from_grade, calculate_grade_from_rank
 )
-from apps.grades.university_converters import GachonConverter, UniversityConverter
+from apps.grades.university_converters import GachonConverter, UniversityConverter, get_rule
+from apps.schools.models import University, UniversityAdmissionCriteria
 
 
 class GradeConversionTestCase(TestCase):
@@ -31,6 +45,31 @@ class GradeConversionTestCase(TestCase):
         self.assertEqual(calculate_rank_from_grade(1.0, 250, '5'), 25)
 
 
+class ConvertGradesTestCase(TestCase):
+    """등급 일괄 변환 (룩업 테이블)"""
+
+    def test_matches_scalar_conversion(self):
+        grades_9 = [1, 1.5, 2.37, 4.123, 9.0]
+        grades_5 = [1, 2.5, 3.333, 5]
+        self.assertEqual(convert_grades(grades_9), [convert_9_to_5(g) for g in grades_9])
+        self.assertEqual(convert_grades(grades_5, '5', '9'), [convert_5_to_9(g) for g in grades_5])
+        self.assertEqual(convert_grades([3, 4.5], '9', '9'), [3.0, 4.5])
+
+    def test_without_numpy(self):
+        grades_9 = [i / 100 for i in range(100, 901, 7)] + [2.345]
+        expected = convert_grades(grades_9)
+        with patch.object(grade_utils, 'np', None):
+            self.assertEqual(convert_grades(grades_9), expected)
+
+    def test_invalid_grade(self):
+        with self.assertRaises(ValueError):
+            convert_grades([1, 9.5])
+        with self.assertRaises(ValueError):
+            convert_grades([0.5], '5', '9')
+        with self.assertRaises(ValueError):
+            convert_grades([1], '9', '7')
+
+
 class GachonConverterTestCase(TestCase):
     """가천대 등급 변환 테스트"""
 
@@ -143,3 +182,365 @@ class UniversityConverterTestCase(TestCase):
         """가천대 의예과 변환"""
         result = UniversityConverter.convert('gachon', 5, 'medical')
         self.assertEqual(result, 98)
+
+
+class ConversionRuleTestCase(TestCase):
+    """데이터 기반 대학 변환 규칙"""
+
+    def setUp(self):
+        cache.clear()
+        self.university = University.objects.create(name='한국대학교', region='서울')
+        self.criteria = UniversityAdmissionCriteria.objects.create(
+            university=self.university,
+            department='컴퓨터공학과',
+            admission_type='학생부교과',
+            year=2026,
+            criteria={'grade_conversion': {
+                'year_weights': {'1': 0.2, '2': 0.4, '3': 0.4},
+                'tracks': {'science': {'scores': {str(g): 100 - (g - 1) * 5 for g in range(1, 10)}}},
+            }},
+        )
+        self.transcript = [
+            {'grade': 1, 'credit': 4, 'year': 1},
+            {'grade': 3, 'credit': 4, 'year': 2},
+        ]
+
+    def test_rule_from_criteria(self):
+        self.assertEqual(UniversityConverter.convert('한국대학교', 3, 'science', 2026), 90)
+        # (100*0.8 + 90*1.6) / 2.4
+        self.assertEqual(get_rule('한국대학교', 'science').calculate_gpa(self.transcript), 93.33)
+
+        with self.assertRaises(ValueError):
+            UniversityConverter.convert('한국대학교', 3, 'humanities')
+
+    def test_compiled_rule_is_cached_until_criteria_change(self):
+        get_rule('한국대학교', 'science')
+        with self.assertNumQueries(0):
+            get_rule('한국대학교', 'science')
+
+        self.criteria.criteria['grade_conversion']['tracks']['science']['scores']['3'] = 50
+        with self.captureOnCommitCallbacks(execute=True):
+            self.criteria.save()
+        self.assertEqual(UniversityConverter.convert('한국대학교', 3, 'science'), 50)
+
+    def test_score_transcript_against_many_universities(self):
+        scores = UniversityConverter.score_transcript(
+            self.transcript, [('gachon', 'science'), ('gachon', 'medical'), ('한국대학교', 'science')]
+        )
+        self.assertEqual(scores, {
+            ('gachon', 'science'): 99.5,
+            ('gachon', 'medical'): 99,
+            ('한국대학교', 'science'): 93.33,
+        })
+
+
+class IngestGradeRecordsTestCase(TestCase):
+    """생기부 성적 일괄 저장"""
+
+    def setUp(self):
+        self.student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+
+    def make_records(self, ranks):
+        records = {}
+        for year in (1, 2, 3):
+            records[f'{year}학년'] = {
+                '1학기': [
+                    {'교과': '국어', '과목': '국어', '단위수': 4, '석차등급': ranks[0]},
+                    {'교과': '수학', '과목': '수학', '단위수': 4, '석차등급': ranks[1]},
+                    {'교과': '수학', '과목': '수학', '단위수': 4, '석차등급': 9},  # 중복 과목
+                ],
+                '2학기': [
+                    {'교과': '영어', '과목': '영어', '단위수': 2, '석차등급': ranks[2]},
+                    {'교과': '과학', '과목': '물리학Ⅰ', '단위수': 3, '석차등급': None},
+                ],
+                '진로선택과목': [{'교과': '과학', '과목': '물리학Ⅱ', '단위수': 2, '성취도': 'A'}],
+                '체육·예술': [],
+            }
+        return records
+
+    def test_full_record_in_constant_queries(self):
+        """3년치 성적이 학기 수와 무관한 쿼리 수로 저장"""
+        with self.assertNumQueries(6):
+            grades = ingest_grade_records(self.student, self.make_records([1, 3, 2]))
+
+        self.assertEqual([g.semester for g in grades], ['1-1', '1-2', '2-1', '2-2', '3-1', '3-2'])
+        grade = Grade.objects.get(student=self.student, semester='1-1')
+        self.assertEqual((grade.exam_type, grade.version, grade.is_latest), ('OVERALL', 1, True))
+        self.assertEqual(grade.gpa, Decimal('2.00'))
+        self.assertEqual(
+            list(grade.subject_grades.values_list('subject_name', 'credit', 'grade_rank')),
+            [('국어', 4, Decimal('1.00')), ('수학', 4, Decimal('3.00'))]
+        )
+        self.assertEqual(SubjectGrade.objects.filter(grade__student=self.student).count(), 12)
+
+    def test_reingest_creates_next_version(self):
+        """다시 저장하면 학기별로 버전 +1, 이전 버전은 최신 해제"""
+        ingest_grade_records(self.student, self.make_records([1, 3, 2]))
+        Grade.objects.create(student=self.student, semester='1-1', exam_type='MIDTERM')
+        ingest_grade_records(self.student, self.make_records([2, 2, 2]))
+
+        overall = Grade.objects.filter(student=self.student, exam_type='OVERALL')
+        self.assertEqual(overall.count(), 12)
+        self.assertEqual(set(overall.filter(is_latest=True).values_list('version', flat=True)), {2})
+        self.assertEqual(overall.get(semester='1-1', is_latest=True).gpa, Decimal('2.00'))
+        # 다른 시험 유형은 그대로
+        self.assertTrue(Grade.objects.get(exam_type='MIDTERM').is_latest)
+
+
+class GradeVersioningTestCase(TestCase):
+    """성적 저장 시 버전 관리"""
+
+    def setUp(self):
+        self.student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+
+    def test_save_assigns_next_version_and_flips_latest(self):
+        first = Grade.objects.create(student=self.student, semester='2-1', exam_type='FINAL', gpa=2)
+        second = Grade.objects.create(student=self.student, semester='2-1', exam_type='FINAL', gpa=1)
+        other = Grade.objects.create(student=self.student, semester='2-2', exam_type='FINAL')
+
+        first.refresh_from_db()
+        self.assertEqual((first.version, first.is_latest), (1, False))
+        self.assertEqual((second.version, second.is_latest), (2, True))
+        self.assertEqual((other.version, other.is_latest), (1, True))
+
+        # 수정은 버전을 올리지 않음
+        second.gpa = 3
+        second.save()
+        self.assertEqual(Grade.objects.filter(student=self.student, semester='2-1').count(), 2)
+
+
+@skipUnlessDBFeature('test_db_allows_multiple_connections')  # sqlite 메모리 DB는 동시 쓰기 불가
+class GradeVersioningConcurrencyTestCase(TransactionTestCase):
+    """같은 학생/학기/시험을 동시에 저장해도 버전이 겹치지 않음"""
+
+    THREADS = 8
+    SAVES_PER_THREAD = 5
+
+    def test_concurrent_saves_get_unique_versions(self):
+        student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+
+        def save_many(_):
+            try:
+                for _ in range(self.SAVES_PER_THREAD):
+                    Grade.objects.create(student=student, semester='3-1', exam_type='MIDTERM')
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=self.THREADS) as pool:
+            list(pool.map(save_many, range(self.THREADS)))
+
+        total = self.THREADS * self.SAVES_PER_THREAD
+        grades = Grade.objects.filter(student=student)
+        self.assertEqual(
+            sorted(grades.values_list('version', flat=True)), list(range(1, total + 1))
+        )
+        self.assertEqual(list(grades.filter(is_latest=True).values_list('version', flat=True)), [total])
+
+
+class StudentGradeSummaryTestCase(APITestCase):
+    """학생별 성적 요약 (DB 집계)"""
+
+    def setUp(self):
+        user = User.objects.create_user(code='C-0001', username='컨설턴트', password='pass1234')
+        self.client.force_authenticate(user)
+        self.student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+
+        old = Grade.objects.create(student=self.student, semester='1-1', exam_type='OVERALL', gpa=5)
+        SubjectGrade.objects.create(grade=old, subject_name='국어', grade_rank=5)
+        for semester, gpa, ranks in (('1-1', 2, (2, 3)), ('1-2', None, (1, None)), ('2-1', 3, (3, 2))):
+            grade = Grade.objects.create(student=self.student, semester=semester, exam_type='OVERALL', gpa=gpa)
+            SubjectGrade.objects.create(grade=grade, subject_name='국어', grade_rank=ranks[0])
+            SubjectGrade.objects.create(grade=grade, subject_name='수학', grade_rank=ranks[1])
+
+    def test_aggregates_latest_versions_in_db(self):
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                '/api/v1/grades/student_grade_summary/', {'student_id': str(self.student.id)}
+            )
+
+        data = response.data['data']
+        self.assertEqual(len(data['grades']), 3)
+        # gpa 없는 학기는 평균에서 제외, 이전 버전(gpa 5)도 제외
+        self.assertEqual(data['summary'], {'total_records': 3, 'average_gpa': Decimal('2.50')})
+        self.assertEqual(
+            [(row['semester'], row['records'], row['average_gpa']) for row in data['by_semester']],
+            [('1-1', 1, Decimal('2.00')), ('1-2', 1, None), ('2-1', 1, Decimal('3.00'))]
+        )
+        self.assertEqual(
+            [(p['semester'], p['grade_rank']) for p in data['subject_trends']['국어']],
+            [('1-1', Decimal('2.00')), ('1-2', Decimal('1.00')), ('2-1', Decimal('3.00'))]
+        )
+        self.assertEqual(len(data['subject_trends']['수학']), 3)
+
+
+class TranscriptConversionTestCase(APITestCase):
+    """성적표 전체 등급 변환"""
+
+    def setUp(self):
+        user = User.objects.create_user(code='C-0001', username='컨설턴트', password='pass1234')
+        self.client.force_authenticate(user)
+        self.student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+
+        grade = Grade.objects.create(student=self.student, semester='1-1', exam_type='OVERALL')
+        SubjectGrade.objects.create(grade=grade, subject_name='국어', credit=4, grade_rank=2)
+        SubjectGrade.objects.create(grade=grade, subject_name='수학', credit=4, grade_rank=None)
+
+    def test_converts_latest_subjects(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                '/api/v1/grades/transcript-conversion/', {'student_id': str(self.student.id)}
+            )
+
+        subjects = response.data['data']['subjects']
+        self.assertEqual([s['subject_name'] for s in subjects], ['국어', '수학'])
+        self.assertEqual(subjects[0]['converted_grade'], convert_9_to_5(2))
+        self.assertIsNone(subjects[1]['converted_grade'])
+
+    def test_invalid_system(self):
+        response = self.client.get(
+            '/api/v1/grades/transcript-conversion/',
+            {'student_id': str(self.student.id), 'to_system': '7'}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class UniversityScoresTestCase(APITestCase):
+    """지망 대학별 환산 평균 일괄 계산"""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(code='C-0001', username='컨설턴트', password='pass1234')
+        self.client.force_authenticate(user)
+        self.student = Student.objects.create(
+            name='홍길동', student_code='S-0001', grade='3', major_track='SCIENCE',
+            desired_universities_text=[
+                {'university': '가천대학교', 'department': '의예과'},
+                {'university': '없는대학교', 'department': '경영학과'},
+            ]
+        )
+        gachon = University.objects.create(name='가천대학교', region='경기')
+        korea = University.objects.create(name='한국대학교', region='서울')
+        UniversityAdmissionCriteria.objects.create(
+            university=korea, department='컴퓨터공학과', admission_type='학생부교과', year=2026,
+            criteria={'grade_conversion': {
+                'tracks': {'science': {'scores': {str(g): 100 - (g - 1) * 5 for g in range(1, 10)}}},
+            }},
+        )
+        for university, priority in ((gachon, 'FIRST'), (korea, 'SECOND')):
+            StudentDesiredUniversity.objects.create(
+                student=self.student, university=university, department='컴퓨터공학과', priority=priority
+            )
+
+        for semester, rank in (('1-1', 1), ('2-1', 2), ('2-2', 3)):
+            grade = Grade.objects.create(student=self.student, semester=semester, exam_type='OVERALL')
+            SubjectGrade.objects.create(grade=grade, subject_name='수학', credit=4, grade_rank=rank)
+        grade = Grade.objects.create(student=self.student, semester='2-1', exam_type='MIDTERM')
+        SubjectGrade.objects.create(grade=grade, subject_name='수학', credit=4, grade_rank=9)
+
+    def test_scores_desired_universities(self):
+        # 학생, 지망 대학, 성적표, 전형 정보 캐시 token(캐시 비어 있음), DB 규칙(한국대학교 / 없는대학교) 조회
+        with self.assertNumQueries(6):
+            response = self.client.post(
+                '/api/v1/grades/university-scores/', {'student_id': str(self.student.id)}, format='json'
+            )
+
+        data = response.data['data']
+        self.assertEqual(data['subject_count'], 3)
+        results = {(r['university'], r['department']): r for r in data['results']}
+        self.assertEqual(len(results), 4)
+        # 가천대 자연: 1학년 제외, (99.5 + 99.5) / 2
+        self.assertEqual(results[('가천대학교', '컴퓨터공학과')]['gpa'], 99.5)
+        self.assertEqual(results[('가천대학교', '의예과')]['major_type'], 'medical')
+        self.assertEqual(results[('가천대학교', '의예과')]['gpa'], 99.25)
+        self.assertEqual(results[('한국대학교', '컴퓨터공학과')]['gpa'], 95)
+        self.assertIsNone(results[('없는대학교', '경영학과')]['gpa'])
+        self.assertIn('error', results[('없는대학교', '경영학과')])
+
+        # 규칙 조회 결과(없는 대학 포함)는 캐시: 학생, 지망 대학, 성적표만 조회
+        with self.assertNumQueries(3):
+            self.client.post(
+                '/api/v1/grades/university-scores/', {'student_id': str(self.student.id)}, format='json'
+            )
+
+    def test_invalid_student_id(self):
+        response = self.client.post(
+            '/api/v1/grades/university-scores/', {'student_id': 'not-a-uuid'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.data['success'])
+
+    def test_explicit_targets(self):
+        response = self.client.post('/api/v1/grades/university-scores/', {
+            'student_id': str(self.student.id),
+            'targets': [{'university': 'gachon', 'major_type': 'humanities'}],
+        }, format='json')
+
+        self.assertEqual(response.data['data']['results'][0]['gpa'], 1.5)
+
+
+class CohortRankingTestCase(APITestCase):
+    """대학/계열별 전체 학생 순위"""
+
+    def setUp(self):
+        user = User.objects.create_user(code='C-0001', username='컨설턴트', password='pass1234')
+        self.client.force_authenticate(user)
+
+        for code, student_status, ranks in (
+            ('S-0001', 'ACTIVE', (9, 2, 2)),
+            ('S-0002', 'ACTIVE', (1, 1, 8)),
+            ('S-0003', 'ACTIVE', (1, 2, 2)),      # S-0001과 동점 (1학년 제외)
+            ('S-0004', 'INACTIVE', (1, 1, 1)),    # 순위 제외
+            ('S-0005', 'ACTIVE', (3, None, None)),  # 1학년만 → 반영 단위수 0
+        ):
+            student = Student.objects.create(name=code, student_code=code, grade='3', status=student_status)
+            for semester, rank in zip(('1-1', '2-1', '3-1'), ranks):
+                grade = Grade.objects.create(student=student, semester=semester, exam_type='OVERALL')
+                SubjectGrade.objects.create(grade=grade, subject_name='수학', credit=4, grade_rank=rank)
+
+    def ranked(self, major_type):
+        return list(CohortRanking.objects.filter(
+            university='gachon', major_type=major_type
+        ).order_by('rank', 'student__student_code').values_list('student__student_code', 'rank', 'gpa'))
+
+    def test_rebuild_ranking(self):
+        self.assertEqual(ranking.rebuild_cohort_ranking('가천대학교', 'science'), 3)
+        self.assertEqual(ranking.rebuild_cohort_ranking('gachon', 'humanities'), 3)
+
+        # 자연계열 배점은 높을수록, 인문계열 변환등급 순서는 낮을수록 상위
+        self.assertEqual(self.ranked('science'), [
+            ('S-0001', 1, Decimal('99.50')),
+            ('S-0003', 1, Decimal('99.50')),
+            ('S-0002', 3, Decimal('85.00')),
+        ])
+        self.assertEqual(self.ranked('humanities'), [
+            ('S-0001', 1, Decimal('1.00')),
+            ('S-0003', 1, Decimal('1.00')),
+            ('S-0002', 3, Decimal('2.50')),
+        ])
+
+    def test_rebuild_replaces_previous_ranking(self):
+        ranking.rebuild_cohort_ranking('gachon', 'science')
+        Student.objects.filter(student_code='S-0002').update(status='GRADUATED')
+        ranking.rebuild_cohort_ranking('gachon', 'science')
+
+        self.assertEqual([code for code, _, _ in self.ranked('science')], ['S-0001', 'S-0003'])
+
+    def test_scores_without_numpy(self):
+        rule = get_rule('gachon', 'medical')
+        expected = ranking.score_cohort(ranking.stream_cohort_subjects(), rule)
+        with patch.object(ranking, 'np', None):
+            self.assertEqual(ranking.score_cohort(ranking.stream_cohort_subjects(), rule), expected)
+
+    def test_ranking_endpoint(self):
+        ranking.rebuild_cohort_ranking('gachon', 'science')
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                '/api/v1/grades/cohort-ranking/',
+                {'university': '가천대학교', 'major_type': 'science', 'limit': 2}
+            )
+
+        rows = response.data['data']['rankings']
+        self.assertEqual([row['rank'] for row in rows], [1, 1])
+        self.assertEqual({row['student_name'] for row in rows}, {'S-0001', 'S-0003'})
@@ -2,11 +2,19 @@
 대학별 특수 등급 변환 로직
 
 각 대학의 고유한 등급 변환 규칙을 구현
+
+- 대학 규칙은 데이터(학년 반영비율, 석차등급→변환등급, 변환등급/석차등급→배점)로 선언
+  (코드 내장 BUILTIN_RULES 또는 UniversityAdmissionCriteria.criteria['grade_conversion'])
+- 규칙은 (대학, 계열, 연도)별로 한 번 컴파일해서 석차등급 인덱스 배열로 캐시
+- UniversityConverter.score_transcript: 성적표 하나를 여러 대학 규칙으로 한 번에 환산
 """
 
+from functools import lru_cache
 from typing import Dict, List, Optional
 from decimal import Decimal
 
+from core.cache import model_cache_state
+
 
 # ==================== 가천대 변환 ====================
 
@@ -161,31 +169,134 @@ class GachonConverter:
             >>> GachonConverter.calculate_gpa(grades, 'science')
             99.64  # (99.5*3 + 99*4) / 7
         """
+        return get_rule('gachon', major_type).calculate_gpa(grades)
+
+
+# ==================== 데이터 기반 변환 규칙 ====================
+
+# 대학별 규칙 선언
+# - year_weights: 학년별 반영비율 (없는 학년은 1.0, 0이면 제외)
+# - tracks: 계열별 규칙
+#   - grade_map: 석차등급 → 변환등급
+#   - letter_scores: 변환등급 → 배점
+#   - scores: 석차등급 → 배점 (변환등급 없이 바로 배점)
+#   - 배점이 없으면 평균 계산에 변환등급 순서(A=1, B=2, ...)를 사용
+BUILTIN_RULES = {
+    'gachon': {
+        'year_weights': GachonConverter.GRADE_WEIGHTS,
+        'tracks': {
+            'humanities': {'grade_map': GachonConverter.HUMANITIES_GRADE_MAP},
+            'science': {
+                'grade_map': GachonConverter.SCIENCE_GRADE_MAP,
+                'letter_scores': GachonConverter.SCIENCE_SCORE_MAP,
+            },
+            'medical': {'scores': GachonConverter.MEDICAL_SCORE_MAP},
+        },
+    },
+}
+
+# 한글 대학명 → 내장 규칙 키
+UNIVERSITY_ALIASES = {
+    '가천대학교': 'gachon',
+    '가천대': 'gachon',
+}
+
+# criteria JSON 안의 규칙 키
+CRITERIA_RULE_KEY = 'grade_conversion'
+
+VALID_GRADES = range(1, 10)
+
+
+class CompiledRule:
+    """
+    (대학, 계열) 규칙을 석차등급 인덱스 배열로 펼친 것
+
+    - letters[g] / scores[g]: 석차등급 g(1~9)의 변환등급 / 배점 (0번은 비움)
+    - gpa_scores[g]: 평균 계산에 쓰는 값 (배점, 없으면 변환등급 순서)
+    - year_weights: {학년: 반영비율}
+    - higher_is_better: 환산 평균이 클수록 좋은지 (배점) / 작을수록 좋은지 (변환등급 순서)
+    """
+
+    __slots__ = (
+        'university', 'track', 'letters', 'scores', 'gpa_scores', 'year_weights', 'higher_is_better'
+    )
+
+    def __init__(self, university, track, rules):
+        tracks = rules.get('tracks') or {}
+        if track not in tracks:
+            raise ValueError(
+                f"Unsupported major_type for {university}: {track}. "
+                f"Available: {list(tracks)}"
+            )
+        spec = tracks[track]
+
+        grade_map = _int_keys(spec.get('grade_map'))
+        letter_scores = spec.get('letter_scores') or {}
+        direct_scores = _int_keys(spec.get('scores'))
+
+        letters = [grade_map.get(g) for g in range(10)] if grade_map else [None] * 10
+        if direct_scores:
+            scores = [direct_scores.get(g) for g in range(10)]
+        elif letter_scores:
+            scores = [letter_scores.get(letter) for letter in letters]
+        else:
+            scores = [None] * 10
+        letters[0] = scores[0] = None
+
+        # 배점이 없는 계열은 변환등급 순서 (A=1, B=2, ...)
+        order = {letter: i + 1 for i, letter in enumerate(sorted({grade_letter for grade_letter in letters if grade_letter}))}
+        gpa_scores = [
+            score if score is not None else order.get(letter)
+            for letter, score in zip(letters, scores)
+        ]
+
+        missing = [g for g in range(1, 10) if gpa_scores[g] is None]
+        if missing:
+            raise ValueError(f"Incomplete rule for {university} {track}: grades {missing}")
+
+        self.university = university
+        self.track = track
+        self.letters = tuple(letters)
+        self.scores = tuple(scores)
+        self.gpa_scores = tuple(gpa_scores)
+        self.higher_is_better = gpa_scores[1] >= gpa_scores[9]
+        self.year_weights = {
+            year: float(weight) for year, weight in _int_keys(rules.get('year_weights')).items()
+        }
+
+    def convert(self, grade: int):
+        """
+        석차등급 1개 변환 (기존 변환기와 같은 반환 형태)
+        - 변환등급 + 배점: {'converted_grade', 'score'}
+        - 변환등급만: 'A'
+        - 배점만: 100
+        """
+        if grade not in VALID_GRADES:
+            raise ValueError(f"Invalid grade: {grade}. Must be 1-9")
+
+        letter, score = self.letters[int(grade)], self.scores[int(grade)]
+        if letter is not None and score is not None:
+            return {'converted_grade': letter, 'score': score}
+        return letter if letter is not None else score
+
+    def calculate_gpa(self, grades: List[Dict]) -> float:
+        """학년 반영비율 × 단위수 가중 평균 (반영비율 0인 학년은 제외)"""
+        gpa_scores = self.gpa_scores
+        year_weights = self.year_weights
         total_score = 0
         total_credit = 0
 
         for item in grades:
-            grade = item['grade']
-            credit = item['credit']
-            year = item['year']
-
-            # 1학년은 반영 안 함
-            if year == 1:
+            weight = year_weights.get(item['year'], 1.0)
+            if not weight:
                 continue
 
-            # 전형별 점수 계산
-            if major_type == 'humanities':
-                # 인문계열은 변환등급만 (배점 없음)
-                converted = cls.convert_humanities(grade)
-                # 여기서는 단순 평균이므로 등급을 숫자로
-                score = ord(converted) - ord('A') + 1  # A=1, B=2, ...
-            elif major_type == 'science':
-                result = cls.convert_science(grade)
-                score = result['score']
-            else:  # medical
-                score = cls.convert_medical(grade)
-
-            total_score += score * credit
+            grade = item['grade']
+            if grade not in VALID_GRADES:
+                raise ValueError(f"Invalid grade: {grade}")
+
+            credit = item['credit'] * weight
+            total_score += gpa_scores[int(grade)] * credit
             total_credit += credit
 
         if total_credit == 0:
@@ -194,6 +305,81 @@ class GachonConverter:
         return round(total_score / total_credit, 2)
 
 
+def _int_keys(mapping):
+    """JSON에서 읽은 규칙은 키가 문자열 → 정수 키로"""
+    return {int(k): v for k, v in (mapping or {}).items()}
+
+
+def rule_key(university: str) -> str:
+    """대학명 → 규칙 키 (내장 규칙은 영문 키, 그 외는 소문자 대학명)"""
+    return UNIVERSITY_ALIASES.get(university, university.lower())
+
+
+def get_rule(university: str, track: str = 'humanities', year: Optional[int] = None) -> CompiledRule:
+    """
+    (대학, 계열, 연도) → 컴파일된 규칙 (캐시)
+
+    - 코드 내장 규칙(BUILTIN_RULES, 한글 대학명은 UNIVERSITY_ALIASES)에 있으면 사용
+    - 없으면 UniversityAdmissionCriteria.criteria['grade_conversion']
+      (year가 없으면 가장 최근 연도)
+    - 전형 정보 규칙은 UniversityAdmissionCriteria의 공유 캐시 token을 키에 넣어 캐시
+      → 전형 정보가 바뀌면(schools 시그널) 모든 프로세스에서 새 규칙으로 다시 컴파일
+
+    Raises:
+        ValueError: 규칙이 없는 대학 / 계열
+    """
+    key = rule_key(university)
+    if key in BUILTIN_RULES:
+        return _builtin_rule(key, track)
+
+    from apps.schools.models import UniversityAdmissionCriteria
+
+    token = model_cache_state(UniversityAdmissionCriteria)['token']
+    rule = _criteria_rule(university, track, year, token)
+    if rule is None:
+        raise ValueError(
+            f"Unsupported university: {university}. "
+            f"Available: {list(BUILTIN_RULES)}"
+        )
+    return rule
+
+
+@lru_cache(maxsize=64)
+def _builtin_rule(key, track):
+    return CompiledRule(key, track, BUILTIN_RULES[key])
+
+
+@lru_cache(maxsize=1024)
+def _criteria_rule(university, track, year, token):
+    """
+    token은 캐시 키로만 사용 (전형 정보가 바뀌면 새 키)
+    - 규칙이 없는 대학(자유 입력 대학명 등)은 None도 캐시 → 매 요청 DB 조회 반복 없음
+    """
+    rules = _criteria_rules(university, year)
+    if rules is None:
+        return None
+    return CompiledRule(rule_key(university), track, rules)
+
+
+def _criteria_rules(university, year):
+    from apps.schools.models import UniversityAdmissionCriteria
+
+    queryset = UniversityAdmissionCriteria.objects.filter(university__name=university)
+    if year is not None:
+        queryset = queryset.filter(year=year)
+
+    for criteria in queryset.order_by('-year', '-updated_at').values_list('criteria', flat=True):
+        if isinstance(criteria, dict) and criteria.get(CRITERIA_RULE_KEY):
+            return criteria[CRITERIA_RULE_KEY]
+    return None
+
+
+def clear_rule_cache():
+    """현재 프로세스의 컴파일된 규칙 캐시 비우기"""
+    _builtin_rule.cache_clear()
+    _criteria_rule.cache_clear()
+
+
 # ==================== 다른 대학 추가 시 ====================
 
 class SampleUniversityConverter:
@@ -243,7 +429,8 @@ class UniversityConverter:
         cls,
         university_name: str,
         grade: int,
-        major_type: str = 'humanities'
+        major_type: str = 'humanities',
+        year: Optional[int] = None
     ) -> any:
         """
         대학별 등급 변환
@@ -252,18 +439,26 @@ class UniversityConverter:
             university_name: 대학명
             grade: 석차등급
             major_type: 전형 타입
+            year: 전형 연도 (DB 규칙 조회용)
 
         Returns:
             변환 결과
         """
-        converter = cls.get_converter(university_name)
+        return get_rule(university_name, major_type, year).convert(grade)
 
-        if university_name.lower() == 'gachon':
-            if major_type == 'humanities':
-                return converter.convert_humanities(grade)
-            elif major_type == 'science':
-                return converter.convert_science(grade)
-            elif major_type == 'medical':
-                return converter.convert_medical(grade)
+    @classmethod
+    def score_transcript(cls, grades: List[Dict], targets) -> Dict[tuple, float]:
+        """
+        성적표 하나를 여러 대학 규칙으로 환산
 
-        return None
+        Args:
+            grades: [{'grade': 2, 'credit': 3, 'year': 2}, ...]
+            targets: [(대학, 계열) 또는 (대학, 계열, 연도), ...]
+
+        Returns:
+            {target: 환산 평균} (규칙이 없으면 ValueError)
+        """
+        return {
+            target: get_rule(*target).calculate_gpa(grades)
+            for target in targets
+        }
@@ -2,7 +2,17 @@
 등급 변환 유틸리티
 
 9등급제 ↔ 5등급제 상호 변환
+
+- 누적 비율 ↔ 등급은 구간 선형 보간 (구간은 bisect로 탐색)
+- 0.01 등급 단위 입력은 모듈 로드 시 만든 룩업 테이블에서 바로 조회
+- convert_grades: 등급 배열 일괄 변환 (NumPy가 있으면 테이블 인덱싱 한 번)
 """
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # 등급 변환 테이블 (상위 누적 비율 기준)
 GRADE_9_PERCENTILES = {
@@ -26,6 +36,14 @@ GRADE_5_PERCENTILES = {
 }
 
 
+# 등급 순서대로 정렬된 누적 비율 (bisect용)
+GRADE_9_KNOTS = [GRADE_9_PERCENTILES[g] for g in sorted(GRADE_9_PERCENTILES)]
+GRADE_5_KNOTS = [GRADE_5_PERCENTILES[g] for g in sorted(GRADE_5_PERCENTILES)]
+
+# 룩업 테이블 해상도 (0.01 등급)
+TABLE_SCALE = 100
+
+
 def convert_9_to_5(grade_9: float) -> float:
     """
     9등급제 → 5등급제 변환
@@ -39,10 +57,7 @@ def convert_9_to_5(grade_9: float) -> float:
     if not (1.0 <= grade_9 <= 9.0):
         raise ValueError(f"Invalid grade_9: {grade_9}")
 
-    percentile = get_percentile_from_grade_9(grade_9)
-    grade_5 = get_grade_5_from_percentile(percentile)
-
-    return round(grade_5, 2)
+    return _lookup(TABLE_9_TO_5, grade_9, _interpolate_9_to_5)
 
 
 def convert_5_to_9(grade_5: float) -> float:
@@ -50,10 +65,62 @@ def convert_5_to_9(grade_5: float) -> float:
     if not (1.0 <= grade_5 <= 5.0):
         raise ValueError(f"Invalid grade_5: {grade_5}")
 
-    percentile = get_percentile_from_grade_5(grade_5)
-    grade_9 = get_grade_9_from_percentile(percentile)
+    return _lookup(TABLE_5_TO_9, grade_5, _interpolate_5_to_9)
+
+
+def convert_grades(grades, from_system: str = '9', to_system: str = '5') -> list:
+    """
+    등급 배열 일괄 변환 (성적표 전체를 한 번에)
+
+    - 0.01 단위 값은 룩업 테이블, 그 외 값은 convert_9_to_5 / convert_5_to_9와 같은 보간
+    - 범위를 벗어난 값이 있으면 ValueError (단건 변환과 같음)
+
+    Returns:
+        list[float]: 입력 순서대로 변환된 등급
+    """
+    if from_system == to_system:
+        return [float(g) for g in grades]
+
+    if (from_system, to_system) == ('9', '5'):
+        table, interpolate, top = TABLE_9_TO_5, _interpolate_9_to_5, 9.0
+    elif (from_system, to_system) == ('5', '9'):
+        table, interpolate, top = TABLE_5_TO_9, _interpolate_5_to_9, 5.0
+    else:
+        raise ValueError(f"Invalid grade system: {from_system} → {to_system}")
+
+    if np is None:
+        convert = convert_9_to_5 if from_system == '9' else convert_5_to_9
+        return [convert(float(g)) for g in grades]
+
+    values = np.asarray(grades, dtype=float)
+    invalid = (values < 1.0) | (values > top) | np.isnan(values)
+    if invalid.any():
+        raise ValueError(f"Invalid grade_{from_system}: {values[invalid][0]}")
+
+    scaled = np.rint(values * TABLE_SCALE)
+    on_grid = scaled / TABLE_SCALE == values
 
-    return round(grade_9, 2)
+    result = np.empty_like(values)
+    result[on_grid] = np.asarray(table)[scaled[on_grid].astype(int) - TABLE_SCALE]
+    for i in np.flatnonzero(~on_grid):
+        result[i] = round(interpolate(float(values[i])), 2)
+    return result.tolist()
+
+
+def _lookup(table, grade, interpolate):
+    """0.01 단위 값이면 테이블 조회, 아니면 보간"""
+    scaled = round(grade * TABLE_SCALE)
+    if scaled / TABLE_SCALE == grade:
+        return table[scaled - TABLE_SCALE]
+    return round(interpolate(grade), 2)
+
+
+def _interpolate_9_to_5(grade_9):
+    return get_grade_5_from_percentile(get_percentile_from_grade_9(grade_9))
+
+
+def _interpolate_5_to_9(grade_5):
+    return get_grade_9_from_percentile(get_percentile_from_grade_5(grade_5))
 
 
 def get_percentile_from_grade_9(grade_9: float) -> float:
@@ -92,40 +159,35 @@ def get_percentile_from_grade_5(grade_5: float) -> float:
 
 def get_grade_9_from_percentile(percentile: float) -> float:
     """상위 누적 비율 → 9등급제 등급 (역 선형 보간)"""
-    for grade, perc in GRADE_9_PERCENTILES.items():
-        if abs(percentile - perc) < 0.0001:
-            return float(grade)
-
-    for grade in range(1, 9):
-        lower_perc = GRADE_9_PERCENTILES[grade]
-        upper_perc = GRADE_9_PERCENTILES[grade + 1]
-
-        if lower_perc <= percentile <= upper_perc:
-            ratio = (percentile - lower_perc) / (upper_perc - lower_perc)
-            return grade + ratio
-
-    if percentile < GRADE_9_PERCENTILES[1]:
-        return 1.0
-    return 9.0
+    return _grade_from_percentile(percentile, GRADE_9_KNOTS)
 
 
 def get_grade_5_from_percentile(percentile: float) -> float:
     """상위 누적 비율 → 5등급제 등급"""
-    for grade, perc in GRADE_5_PERCENTILES.items():
-        if abs(percentile - perc) < 0.0001:
-            return float(grade)
+    return _grade_from_percentile(percentile, GRADE_5_KNOTS)
 
-    for grade in range(1, 5):
-        lower_perc = GRADE_5_PERCENTILES[grade]
-        upper_perc = GRADE_5_PERCENTILES[grade + 1]
 
-        if lower_perc <= percentile <= upper_perc:
-            ratio = (percentile - lower_perc) / (upper_perc - lower_perc)
-            return grade + ratio
+def _grade_from_percentile(percentile, knots):
+    """
+    누적 비율 → 등급 (knots[i]가 i+1등급의 누적 비율)
+    - 등급 경계와 0.0001 이내면 해당 정수 등급
+    - 그 외에는 이분 탐색으로 찾은 구간에서 선형 보간
+    """
+    i = bisect_left(knots, percentile)
 
-    if percentile < GRADE_5_PERCENTILES[1]:
+    for j in (i - 1, i):
+        if 0 <= j < len(knots) and abs(percentile - knots[j]) < 0.0001:
+            return float(j + 1)
+
+    if i == 0:
         return 1.0
-    return 5.0
+    if i == len(knots):
+        return float(len(knots))
+
+    lower_perc = knots[i - 1]
+    upper_perc = knots[i]
+    ratio = (percentile - lower_perc) / (upper_perc - lower_perc)
+    return i + ratio
 
 
 def calculate_rank_from_grade(grade: float, total_students: int, grade_system: str = '9') -> int:
@@ -149,3 +211,15 @@ def calculate_grade_from_rank(rank: int, total_students: int, grade_system: str
         grade = get_grade_5_from_percentile(percentile)
 
     return round(grade, 2)
+
+
+def _build_table(interpolate, top):
+    """1.00 ~ top 을 0.01 단위로 변환한 테이블 (인덱스 = 등급 * 100 - 100)"""
+    return [
+        round(interpolate(scaled / TABLE_SCALE), 2)
+        for scaled in range(TABLE_SCALE, int(top * TABLE_SCALE) + 1)
+    ]
+
+
+TABLE_9_TO_5 = _build_table(_interpolate_9_to_5, 9)
+TABLE_5_TO_9 = _build_table(_interpolate_5_to_9, 5)
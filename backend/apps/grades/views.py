@@ -1,18 +1,61 @@
+import uuid
+
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.db.models import Avg, Count
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from .models import Grade, SubjectGrade
+from core.cache import cached_response, version_stamp
+from .models import CohortRanking, Grade, SubjectGrade
 from .serializers import (
     GradeSerializer,
     GradeListSerializer,
     GradeCreateSerializer,
     SubjectGradeSerializer
 )
-from .utils import convert_9_to_5, convert_5_to_9
-from .university_converters import GachonConverter, UniversityConverter
+from .utils import convert_9_to_5, convert_5_to_9, convert_grades
+from .university_converters import GachonConverter, UniversityConverter, get_rule, rule_key
+
+
+def round_or_none(value, digits=2):
+    return round(value, digits) if value is not None else None
+
+
+# 의예과/한의예과/약학과 등은 대학별 의약학 계열 규칙 사용
+MEDICAL_DEPARTMENT_KEYWORDS = ('의예', '한의예', '치의예', '약학')
+
+STUDENT_MAJOR_TYPES = {'HUMANITIES': 'humanities', 'SCIENCE': 'science'}
+
+
+def load_transcript(student_id, exam_type='OVERALL'):
+    """
+    최신 과목 성적 → 대학 환산용 성적표 (쿼리 1회)
+
+    Returns:
+        [{'grade': 석차등급, 'credit': 단위수, 'year': 학년}, ...]
+        (석차등급이 1~9 정수가 아니거나 단위수가 없는 과목은 제외)
+    """
+    rows = SubjectGrade.objects.filter(
+        grade__student_id=student_id,
+        grade__is_latest=True,
+        grade__exam_type=exam_type
+    ).values_list('grade__semester', 'credit', 'grade_rank')
+
+    transcript = []
+    for semester, credit, rank in rows:
+        if not credit or rank is None or rank != int(rank) or not 1 <= rank <= 9:
+            continue
+        transcript.append({'grade': int(rank), 'credit': credit, 'year': int(semester[0])})
+    return transcript
+
+
+def target_major_type(department, default):
+    """학과명으로 의약학 계열 판별, 그 외는 기본 계열"""
+    if any(keyword in (department or '') for keyword in MEDICAL_DEPARTMENT_KEYWORDS):
+        return 'medical'
+    return default
 
 
 @extend_schema_view(
@@ -152,7 +195,14 @@ class GradeViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def student_grade_summary(self, request):
-        """학생별 성적 요약"""
+        """
+        학생별 성적 요약 (최신 버전 성적만)
+
+        - summary: 전체 기록 수 / 평균 등급 (gpa가 없는 기록은 평균에서 제외)
+        - by_semester: 학기·시험 유형별 기록 수 / 평균 등급
+        - subject_trends: 과목별 학기 순 등급 추이 (학기별 그래프용)
+        - 집계는 모두 DB에서 (쿼리 4회, 성적 수와 무관)
+        """
         student_id = request.query_params.get('student_id')
         if not student_id:
             return Response({
@@ -160,12 +210,32 @@ class GradeViewSet(viewsets.ModelViewSet):
                 'error': 'student_id parameter is required'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        grades = self.queryset.filter(student_id=student_id)
-        serializer = GradeListSerializer(grades, many=True)
-
-        # 평균 계산
-        total_gpa = sum([g.gpa for g in grades if g.gpa])
-        avg_gpa = total_gpa / len(grades) if grades else 0
+        grades = self.queryset.filter(student_id=student_id, is_latest=True)
+        serializer = GradeListSerializer(
+            grades.select_related('student').order_by('semester', 'exam_type'), many=True
+        )
+
+        totals = grades.aggregate(total_records=Count('id'), average_gpa=Avg('gpa'))
+        by_semester = (
+            grades.order_by('semester', 'exam_type')
+            .values('semester', 'exam_type')
+            .annotate(records=Count('id'), average_gpa=Avg('gpa'))
+        )
+
+        subject_rows = SubjectGrade.objects.filter(
+            grade__student_id=student_id,
+            grade__is_latest=True
+        ).order_by('subject_name', 'grade__semester', 'grade__exam_type').values_list(
+            'subject_name', 'grade__semester', 'grade__exam_type', 'grade_rank', 'raw_score'
+        )
+        subject_trends = {}
+        for subject_name, semester, exam_type, grade_rank, raw_score in subject_rows:
+            subject_trends.setdefault(subject_name, []).append({
+                'semester': semester,
+                'exam_type': exam_type,
+                'grade_rank': grade_rank,
+                'raw_score': raw_score,
+            })
 
         return Response({
             'success': True,
@@ -173,9 +243,74 @@ class GradeViewSet(viewsets.ModelViewSet):
                 'student_id': student_id,
                 'grades': serializer.data,
                 'summary': {
-                    'total_records': grades.count(),
-                    'average_gpa': round(avg_gpa, 2)
-                }
+                    'total_records': totals['total_records'],
+                    'average_gpa': round_or_none(totals['average_gpa'])
+                },
+                'by_semester': [
+                    {**row, 'average_gpa': round_or_none(row['average_gpa'])}
+                    for row in by_semester
+                ],
+                'subject_trends': subject_trends
+            }
+        })
+
+    @extend_schema(exclude=True)
+    @action(detail=False, methods=['get'], url_path='transcript-conversion')
+    def transcript_conversion(self, request):
+        """
+        학생 성적표 전체 등급 변환 (최신 버전 과목 성적)
+
+        GET /api/v1/grades/transcript-conversion/?student_id=xxx&to_system=5
+
+        - 과목 성적은 쿼리 1회로 읽고, 석차등급(9등급제)은 convert_grades로 한 번에 변환
+        - 석차등급이 없거나 1~9 범위 밖이면 converted_grade는 None
+        """
+        student_id = request.query_params.get('student_id')
+        to_system = request.query_params.get('to_system', '5')
+        if not student_id:
+            return Response({
+                'success': False,
+                'error': 'student_id parameter is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if to_system not in ['9', '5']:
+            return Response({
+                'success': False,
+                'error': 'to_system must be either "9" or "5"'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = list(SubjectGrade.objects.filter(
+            grade__student_id=student_id,
+            grade__is_latest=True
+        ).order_by('grade__semester', 'grade__exam_type', 'subject_name').values(
+            'grade__semester', 'grade__exam_type', 'subject_name', 'credit', 'grade_rank'
+        ))
+
+        valid = [
+            i for i, row in enumerate(rows)
+            if row['grade_rank'] is not None and 1 <= row['grade_rank'] <= 9
+        ]
+        converted = dict(zip(valid, convert_grades(
+            [float(rows[i]['grade_rank']) for i in valid], from_system='9', to_system=to_system
+        )))
+
+        return Response({
+            'success': True,
+            'data': {
+                'student_id': student_id,
+                'from_system': '9',
+                'to_system': to_system,
+                'subjects': [
+                    {
+                        'semester': row['grade__semester'],
+                        'exam_type': row['grade__exam_type'],
+                        'subject_name': row['subject_name'],
+                        'credit': row['credit'],
+                        'grade_rank': row['grade_rank'],
+                        'converted_grade': converted.get(i),
+                    }
+                    for i, row in enumerate(rows)
+                ]
             }
         })
 
@@ -188,6 +323,7 @@ class GradeViewSet(viewsets.ModelViewSet):
 
         - AI 모듈의 성적분석 결과를 반환
         - 현재는 해당 학생의 리포트에서 ai_insights.성적분석 부분을 추출
+        - 응답은 (리포트 id, updated_at) 키로 캐시
         """
         student_id = request.query_params.get('student_id')
         if not student_id:
@@ -200,26 +336,40 @@ class GradeViewSet(viewsets.ModelViewSet):
         # 현재는 ConsultationReport의 ai_insights에서 성적분석 부분을 추출
         from apps.reports.models import ConsultationReport
 
+        # 리포트 메타데이터만 먼저 조회 (ai_insights는 응답 캐시 미스일 때만)
         latest_report = ConsultationReport.objects.filter(
             student_id=student_id,
             status__in=['COMPLETED', 'SENT']
-        ).order_by('-created_at').first()
+        ).order_by('-created_at').defer_heavy().first()
 
-        if not latest_report or not latest_report.ai_insights.get('성적분석'):
+        if not latest_report:
             return Response({
                 'success': False,
                 'message': '성적 분석 결과가 없습니다.'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        return Response({
-            'success': True,
-            'data': {
-                'student_id': student_id,
-                'report_id': str(latest_report.id),
-                'created_at': latest_report.created_at,
-                '성적분석': latest_report.ai_insights.get('성적분석', {})
-            }
-        })
+        def build():
+            if not latest_report.ai_insights.get('성적분석'):
+                return Response({
+                    'success': False,
+                    'message': '성적 분석 결과가 없습니다.'
+                }, status=status.HTTP_404_NOT_FOUND)
+
+            return Response({
+                'success': True,
+                'data': {
+                    'student_id': student_id,
+                    'report_id': str(latest_report.id),
+                    'created_at': latest_report.created_at,
+                    '성적분석': latest_report.ai_insights.get('성적분석', {})
+                }
+            })
+
+        # 리포트 수정(updated_at) 시 새 키
+        return cached_response(
+            ['student-grade-analysis', student_id, latest_report.id, version_stamp(latest_report.updated_at)],
+            build
+        )
 
     @action(detail=False, methods=['post'], url_path='convert-for-university')
     def convert_for_university(self, request):
@@ -270,12 +420,7 @@ class GradeViewSet(viewsets.ModelViewSet):
                 'error': 'grade must be a valid integer (1-9)'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        if major_type not in ['humanities', 'science', 'medical']:
-            return Response({
-                'success': False,
-                'error': 'major_type must be one of: humanities, science, medical'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
+        # 계열은 대학 규칙마다 다름 (지원하지 않는 계열은 ValueError → 400)
         try:
             result = UniversityConverter.convert(
                 university,
@@ -392,6 +537,150 @@ class GradeViewSet(viewsets.ModelViewSet):
             }, status=status.HTTP_400_BAD_REQUEST)
 
 
+    @extend_schema(exclude=True)
+    @action(detail=False, methods=['post'], url_path='university-scores')
+    def university_scores(self, request):
+        """
+        학생 성적을 지망 대학별 방식으로 한 번에 환산
+
+        POST /api/v1/grades/university-scores/
+        {
+            "student_id": "...",
+            "major_type": "science",      # 선택 (기본: 학생 계열)
+            "targets": [                   # 선택 (기본: 학생 지망 대학 + 희망 대학 텍스트)
+                {"university": "gachon", "department": "의예과", "year": 2026}
+            ]
+        }
+
+        - 성적표는 한 번만 읽고 대학별로 컴파일된 규칙(캐시)만 바꿔서 계산
+        - 규칙이 없는 대학은 해당 항목에 error를 담고 나머지는 계속 계산
+        """
+        from apps.students.models import Student
+
+        student_id = request.data.get('student_id')
+        targets = request.data.get('targets')
+        if not student_id:
+            return Response({
+                'success': False,
+                'error': 'student_id parameter is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            uuid.UUID(str(student_id))
+        except ValueError:
+            return Response({
+                'success': False,
+                'error': 'student_id must be a valid UUID'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if targets is not None and not isinstance(targets, list):
+            return Response({
+                'success': False,
+                'error': 'targets must be a list'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        student = Student.objects.filter(id=student_id).first()
+        if not student:
+            return Response({
+                'success': False,
+                'error': 'Student not found'
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        major_type = request.data.get('major_type') or STUDENT_MAJOR_TYPES.get(
+            student.major_track, 'humanities'
+        )
+
+        if targets is None:
+            targets = [
+                {
+                    'university': desired.university.name,
+                    'department': desired.department,
+                    'admission_type': desired.admission_type,
+                    'priority': desired.priority,
+                }
+                for desired in student.desired_universities.select_related('university')
+            ]
+            registered = {(t['university'], t['department']) for t in targets}
+            targets += [
+                item for item in student.desired_universities_text
+                if isinstance(item, dict) and item.get('university')
+                and (item['university'], item.get('department', '')) not in registered
+            ]
+
+        transcript = load_transcript(student.id)
+
+        results = []
+        for target in targets:
+            if not isinstance(target, dict) or not target.get('university'):
+                continue
+
+            track = target.get('major_type') or target_major_type(target.get('department'), major_type)
+            result = {**target, 'major_type': track, 'gpa': None}
+            try:
+                result['gpa'] = get_rule(target['university'], track, target.get('year')).calculate_gpa(transcript)
+            except ValueError as e:
+                result['error'] = str(e)
+            results.append(result)
+
+        return Response({
+            'success': True,
+            'data': {
+                'student_id': str(student.id),
+                'subject_count': len(transcript),
+                'results': results
+            }
+        })
+
+    @extend_schema(exclude=True)
+    @action(detail=False, methods=['get'], url_path='cohort-ranking')
+    def cohort_ranking(self, request):
+        """
+        대학/계열별 학생 순위 조회 (rebuild_cohort_ranking으로 미리 계산된 결과)
+
+        GET /api/v1/grades/cohort-ranking/?university=gachon&major_type=science&limit=100
+        """
+        university = request.query_params.get('university')
+        major_type = request.query_params.get('major_type', 'humanities')
+        if not university:
+            return Response({
+                'success': False,
+                'error': 'university parameter is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = int(request.query_params.get('limit', 100))
+        except ValueError:
+            return Response({
+                'success': False,
+                'error': 'limit must be a valid integer'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        rankings = CohortRanking.objects.filter(
+            university=rule_key(university),
+            major_type=major_type
+        ).order_by('rank').values(
+            'rank', 'student_id', 'student__name', 'gpa', 'total_credits', 'computed_at'
+        )[:max(limit, 0)]
+
+        return Response({
+            'success': True,
+            'data': {
+                'university': university,
+                'major_type': major_type,
+                'rankings': [
+                    {
+                        'rank': row['rank'],
+                        'student_id': row['student_id'],
+                        'student_name': row['student__name'],
+                        'gpa': row['gpa'],
+                        'total_credits': row['total_credits'],
+                        'computed_at': row['computed_at'],
+                    }
+                    for row in rankings
+                ]
+            }
+        })
+
 @extend_schema_view(
     list=extend_schema(tags=['Grades'], exclude=True),
     retrieve=extend_schema(tags=['Grades'], exclude=True),
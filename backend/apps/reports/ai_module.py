@@ -466,6 +466,25 @@ def analyze_document_with_ai(pdf_file):
     return get_mock_saenggibu_analysis()
 
 
+def analyze_saenggibu_with_ai(parsed_result: dict):
+    """
+    파싱된 생기부 데이터 분석 (AI 모듈 호출)
+
+    TODO: 실제 AI 모듈 연결
+    - OCR/파싱은 documents.tasks.process_document_analysis에서 처리
+    - 예시: result = ai_module.analyze_saenggibu(parsed_result)
+
+    Args:
+        parsed_result: run_parsing_pipeline 결과 (출결/봉사/성적/세특/행동특성)
+
+    Returns:
+        dict: 생기부_분석 결과 (AI 모듈 output 형식)
+              - 목업 결과는 'mock': True (실제 분석과 구분)
+    """
+    # 현재는 목업 데이터 반환
+    return {**get_mock_saenggibu_analysis(), 'mock': True}
+
+
 def analyze_grades_with_ai(student_id: str):
     """
     학생 성적 분석 (AI 모듈 호출)
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reports", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="consultationreport",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("DRAFT", "작성중"),
+                    ("COMPLETED", "완료"),
+                    ("SENT", "전송됨"),
+                    ("FAILED", "작성 실패"),
+                ],
+                default="DRAFT",
+                max_length=20,
+                verbose_name="상태",
+            ),
+        ),
+    ]
@@ -2,6 +2,8 @@ import uuid
 from django.db import models
 from django.conf import settings
 
+from core.managers import HeavyFieldQuerySet
+
 
 class ConsultationReport(models.Model):
     """컨설팅 리포트"""
@@ -17,8 +19,12 @@ class ConsultationReport(models.Model):
         ('DRAFT', '작성중'),
         ('COMPLETED', '완료'),
         ('SENT', '전송됨'),
+        ('FAILED', '작성 실패'),
     )
 
+    # 목록/요약 응답에서는 읽지 않는 대용량 JSON 컬럼
+    HEAVY_FIELDS = ('ai_insights', 'university_analysis')
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     student = models.ForeignKey(
         'students.Student',
@@ -128,6 +134,8 @@ class ConsultationReport(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = HeavyFieldQuerySet.as_manager()
+
     class Meta:
         db_table = 'consultation_reports'
         verbose_name = '컨설팅 리포트'
@@ -1,10 +1,11 @@
 from rest_framework import serializers
+from core.mixins import HeavyFieldsSerializerMixin
 from .models import ConsultationReport, ConsultationSession
 from apps.students.serializers import StudentListSerializer
 from apps.consultants.serializers import ConsultantListSerializer
 
 
-class ConsultationReportSerializer(serializers.ModelSerializer):
+class ConsultationReportSerializer(HeavyFieldsSerializerMixin, serializers.ModelSerializer):
     """컨설팅 리포트 시리얼라이저"""
     student_detail = StudentListSerializer(source='student', read_only=True)
     consultant_detail = ConsultantListSerializer(source='consultant', read_only=True)
@@ -0,0 +1,62 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from apps.accounts.models import User
+from apps.students.models import Student
+from apps.reports.models import ConsultationReport
+
+
+class AnalysisResponseCacheTestCase(APITestCase):
+    """종합 / 성적 분석 조회 응답 캐시 (리포트 updated_at 키)"""
+
+    def setUp(self):
+        user = User.objects.create_user(code='C-0001', username='컨설턴트', password='pass1234')
+        self.client.force_authenticate(user)
+
+        self.student = Student.objects.create(name='홍길동', student_code='S-0001', grade='3')
+        self.report = ConsultationReport.objects.create(
+            student=self.student, report_type='INITIAL', title='리포트', status='COMPLETED',
+            ai_insights={'종합분석': {'요약': '처음'}, '성적분석': {'추이': '상승'}},
+            university_analysis=[{'university': '한국대학교'}],
+        )
+
+    def assert_cached(self, url, params=None):
+        first = self.client.get(url, params)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url, params).data, first.data)
+
+        # 캐시 적중: 리포트 메타데이터 조회 1회 (AI 결과 컬럼은 읽지 않음)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"ai_insights"', queries[0]['sql'])
+        return first
+
+    def test_comprehensive_analysis(self):
+        url = f'/api/v1/reports/consultation-reports/{self.report.id}/comprehensive-analysis/'
+        response = self.assert_cached(url)
+        self.assertEqual(response.data['data']['종합분석']['수시카드'], [{'university': '한국대학교'}])
+
+        self.client.patch(
+            f'/api/v1/reports/consultation-reports/{self.report.id}/update-comprehensive-analysis/',
+            {'종합분석': {'요약': '수정'}}, format='json'
+        )
+        self.assertEqual(self.client.get(url).data['data']['종합분석']['요약'], '수정')
+
+    def test_student_grade_analysis(self):
+        url = '/api/v1/grades/student-grade-analysis/'
+        params = {'student_id': str(self.student.id)}
+        self.assertEqual(self.assert_cached(url, params).data['data']['성적분석'], {'추이': '상승'})
+
+        self.client.patch(
+            f'/api/v1/reports/consultation-reports/{self.report.id}/update-grade-analysis/',
+            {'성적분석': {'추이': '하락'}}, format='json'
+        )
+        self.assertEqual(self.client.get(url, params).data['data']['성적분석']['추이'], '하락')
+
+    def test_missing_analysis_is_404(self):
+        self.report.ai_insights = {}
+        self.report.save()
+
+        url = f'/api/v1/reports/consultation-reports/{self.report.id}/comprehensive-analysis/'
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.get(url).status_code, 404)
@@ -5,6 +5,8 @@ from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema, extend_schema_view
+from core.cache import cached_response, version_stamp
+from core.mixins import HeavyFieldsViewSetMixin
 from .models import ConsultationReport, ConsultationSession
 from .serializers import (
     ConsultationReportSerializer,
@@ -29,15 +31,21 @@ from .ai_module import (
     destroy=extend_schema(tags=['Reports'], exclude=True),
     send=extend_schema(tags=['Reports'], exclude=True),
 )
-class ConsultationReportViewSet(viewsets.ModelViewSet):
-    """컨설팅 리포트 ViewSet"""
-    queryset = ConsultationReport.objects.all()
+class ConsultationReportViewSet(HeavyFieldsViewSetMixin, viewsets.ModelViewSet):
+    """
+    컨설팅 리포트 ViewSet
+
+    - 목록은 메타데이터만, 상세는 ?include=ai_insights,university_analysis 시 AI 결과 포함
+    """
+    queryset = ConsultationReport.objects.select_related('student', 'consultant').all()
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['student', 'consultant', 'report_type', 'status']
     search_fields = ['title', 'student__name', 'consultant__name']
     ordering_fields = ['created_at', 'updated_at']
     ordering = ['-created_at']
+    # 종합분석 조회는 메타데이터로 응답 캐시 키만 확인하고, 미스일 때만 대용량 컬럼을 읽음
+    heavy_field_list_actions = ('list', 'get_comprehensive_analysis')
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -97,7 +105,7 @@ class ConsultationReportViewSet(viewsets.ModelViewSet):
                 'error': 'student_id parameter is required'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        reports = self.queryset.filter(student_id=student_id)
+        reports = self.queryset.filter(student_id=student_id).defer_heavy()
         serializer = ConsultationReportListSerializer(reports, many=True)
 
         return Response({
@@ -117,27 +125,34 @@ class ConsultationReportViewSet(viewsets.ModelViewSet):
 
         - AI 모듈의 종합분석 결과를 반환
         - university_analysis (수시카드)와 ai_insights.종합분석 통합
+        - 응답은 (리포트 id, updated_at) 키로 캐시 → 컨설턴트 수정 시 새 키
         """
         report = self.get_object()
 
-        if not report.ai_insights.get('종합분석'):
-            return Response({
-                'success': False,
-                'message': '종합 분석 결과가 없습니다.'
-            }, status=status.HTTP_404_NOT_FOUND)
+        def build():
+            report.refresh_from_db(fields=['ai_insights', 'university_analysis'])
+            if not report.ai_insights.get('종합분석'):
+                return Response({
+                    'success': False,
+                    'message': '종합 분석 결과가 없습니다.'
+                }, status=status.HTTP_404_NOT_FOUND)
 
-        return Response({
-            'success': True,
-            'data': {
-                'report_id': str(report.id),
-                'student_id': str(report.student.id),
-                'created_at': report.created_at,
-                '종합분석': {
-                    **report.ai_insights.get('종합분석', {}),
-                    '수시카드': report.university_analysis
+            return Response({
+                'success': True,
+                'data': {
+                    'report_id': str(report.id),
+                    'student_id': str(report.student_id),
+                    'created_at': report.created_at,
+                    '종합분석': {
+                        **report.ai_insights.get('종합분석', {}),
+                        '수시카드': report.university_analysis
+                    }
                 }
-            }
-        })
+            })
+
+        return cached_response(
+            ['comprehensive-analysis', report.id, version_stamp(report.updated_at)], build
+        )
 
     @action(detail=True, methods=['patch'], url_path='update-grade-analysis')
     @extend_schema(
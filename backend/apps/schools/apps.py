@@ -5,3 +5,6 @@ class SchoolsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.schools'
     verbose_name = '학교 마스터'
+
+    def ready(self):
+        from . import signals  # noqa: F401
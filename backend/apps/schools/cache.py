@@ -0,0 +1,34 @@
+"""
+대학 입학 전형 마스터 데이터 read-through 캐시
+
+- 대학별 입학 전형 목록 캐시 (UniversityViewSet.admission_criteria)
+- 무효화는 signals.py (post_save / post_delete → core.cache.touch_model_cache)
+"""
+from django.core.exceptions import ValidationError
+
+from core.cache import cached_for_models
+
+from .models import University, UniversityAdmissionCriteria
+from .serializers import UniversityAdmissionCriteriaSerializer
+
+
+def admission_criteria_data(university_id):
+    """
+    대학의 입학 전형 목록 (UniversityAdmissionCriteriaSerializer data)
+    - 없는 대학(잘못된 id 포함)은 False (캐시에 None은 미스와 구분되지 않음)
+    """
+    def build():
+        try:
+            if not University.objects.filter(pk=university_id).exists():
+                return False
+        except (TypeError, ValueError, ValidationError):
+            return False
+        return [
+            dict(row) for row in UniversityAdmissionCriteriaSerializer(
+                UniversityAdmissionCriteria.objects.filter(university_id=university_id), many=True
+            ).data
+        ]
+
+    return cached_for_models(
+        [University, UniversityAdmissionCriteria], ['university', university_id], build
+    )
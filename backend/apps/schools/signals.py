@@ -0,0 +1,18 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.cache import touch_model_cache
+
+from .models import HighSchool, University, UniversityAdmissionCriteria
+
+
+@receiver([post_save, post_delete], sender=HighSchool)
+@receiver([post_save, post_delete], sender=University)
+@receiver([post_save, post_delete], sender=UniversityAdmissionCriteria)
+def invalidate_master_data_cache(sender, **kwargs):
+    """
+    마스터 데이터 변경 → 해당 모델 캐시(read-through / list 응답 / ETag) 무효화
+    - 커밋 후에 무효화 (트랜잭션 중에 바꾸면 동시 요청이 커밋 전 데이터를 새 token으로 캐시할 수 있음)
+    """
+    transaction.on_commit(lambda: touch_model_cache(sender))
@@ -0,0 +1,88 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from apps.accounts.models import User
+from apps.schools.models import HighSchool, University, UniversityAdmissionCriteria
+from apps.students.models import Student, StudentDesiredUniversity
+
+
+class MasterDataCacheTestCase(APITestCase):
+    """마스터 데이터 캐시 / 조건부 요청"""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(code='C-0001', username='컨설턴트', password='pass1234')
+        self.client.force_authenticate(user)
+
+        self.university = University.objects.create(name='한국대학교', region='서울', ranking=1)
+        self.criteria = UniversityAdmissionCriteria.objects.create(
+            university=self.university, department='컴퓨터공학과',
+            admission_type='학생부교과', year=2026, criteria={'min_gpa': 2.0}
+        )
+
+    def test_list_etag_and_not_modified(self):
+        url = '/api/v1/schools/universities/'
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+
+        # 캐시 적중: DB 조회 없음
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).data, response.data)
+        with self.assertNumQueries(0):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], etag)
+
+        # 쿼리가 다르면 ETag도 다름
+        self.assertNotEqual(self.client.get(url, {'region': '서울'})['ETag'], etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            University.objects.create(name='두번째대학교', region='부산', ranking=2)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 2)
+
+    def test_admission_criteria_cached_until_change(self):
+        url = f'/api/v1/schools/universities/{self.university.id}/admission_criteria/'
+        self.assertEqual(self.client.get(url).data['data'][0]['criteria'], {'min_gpa': 2.0})
+
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        self.criteria.criteria = {'min_gpa': 1.5}
+        with self.captureOnCommitCallbacks(execute=True):
+            self.criteria.save()
+        self.assertEqual(self.client.get(url).data['data'][0]['criteria'], {'min_gpa': 1.5})
+
+        # 커밋 전에는 무효화하지 않음
+        with self.captureOnCommitCallbacks() as callbacks:
+            UniversityAdmissionCriteria.objects.filter(pk=self.criteria.pk).first().save()
+            with self.assertNumQueries(0):
+                self.client.get(url)
+        self.assertEqual(len(callbacks), 1)
+
+        missing = '/api/v1/schools/universities/00000000-0000-0000-0000-000000000000/admission_criteria/'
+        self.assertEqual(self.client.get(missing).status_code, 404)
+        self.assertEqual(self.client.get('/api/v1/schools/universities/invalid/admission_criteria/').status_code, 404)
+
+    def test_student_details_joined_in_one_query(self):
+        school = HighSchool.objects.create(name='한국고등학교', region='서울')
+        student = Student.objects.create(
+            name='홍길동', student_code='S-0001', grade='3', high_school=school
+        )
+        StudentDesiredUniversity.objects.create(
+            student=student, university=self.university, department='컴퓨터공학과', priority='FIRST'
+        )
+
+        url = f'/api/v1/students/{student.id}/'
+        # 학생(고교 / 컨설턴트 join) + 지망 대학(대학 join)
+        with self.assertNumQueries(2):
+            data = self.client.get(url).data
+        self.assertEqual(data['high_school_detail']['name'], '한국고등학교')
+        self.assertEqual(data['desired_universities'][0]['university_detail']['name'], '한국대학교')
+
+        school.name = '새이름고등학교'
+        with self.captureOnCommitCallbacks(execute=True):
+            school.save()
+        self.assertEqual(self.client.get(url).data['high_school_detail']['name'], '새이름고등학교')
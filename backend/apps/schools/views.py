@@ -4,6 +4,9 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view
+from core.mixins import CachedListViewSetMixin
+from django.http import Http404
+from .cache import admission_criteria_data
 from .models import HighSchool, University, UniversityAdmissionCriteria
 from .serializers import (
     HighSchoolSerializer, HighSchoolListSerializer,
@@ -20,7 +23,7 @@ from .serializers import (
     partial_update=extend_schema(tags=['Schools'], exclude=True),
     destroy=extend_schema(tags=['Schools'], exclude=True),
 )
-class HighSchoolViewSet(viewsets.ModelViewSet):
+class HighSchoolViewSet(CachedListViewSetMixin, viewsets.ModelViewSet):
     """고등학교 ViewSet"""
     queryset = HighSchool.objects.all()
     permission_classes = [IsAuthenticated]
@@ -45,7 +48,7 @@ class HighSchoolViewSet(viewsets.ModelViewSet):
     destroy=extend_schema(tags=['Schools'], exclude=True),
     admission_criteria=extend_schema(tags=['Schools'], exclude=True),
 )
-class UniversityViewSet(viewsets.ModelViewSet):
+class UniversityViewSet(CachedListViewSetMixin, viewsets.ModelViewSet):
     """대학 ViewSet"""
     queryset = University.objects.all()
     permission_classes = [IsAuthenticated]
@@ -62,13 +65,14 @@ class UniversityViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['get'])
     def admission_criteria(self, request, pk=None):
-        """특정 대학의 입학 기준 조회"""
-        university = self.get_object()
-        criteria = university.admission_criteria.all()
-        serializer = UniversityAdmissionCriteriaSerializer(criteria, many=True)
+        """특정 대학의 입학 기준 조회 (캐시)"""
+        data = admission_criteria_data(pk)
+        if data is False:
+            raise Http404
+
         return Response({
             'success': True,
-            'data': serializer.data
+            'data': data
         })
 
 
@@ -80,7 +84,7 @@ class UniversityViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(tags=['Schools'], exclude=True),
     destroy=extend_schema(tags=['Schools'], exclude=True),
 )
-class UniversityAdmissionCriteriaViewSet(viewsets.ModelViewSet):
+class UniversityAdmissionCriteriaViewSet(CachedListViewSetMixin, viewsets.ModelViewSet):
     """대학 입학 기준 ViewSet"""
     queryset = UniversityAdmissionCriteria.objects.all()
     serializer_class = UniversityAdmissionCriteriaSerializer
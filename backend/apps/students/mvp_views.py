@@ -4,6 +4,8 @@ MVP 전용 원포인트 API
 1차 MVP를 위한 통합 엔드포인트
 - 생기부 등록부터 분석까지 한 번에 처리
 """
+import uuid
+
 from rest_framework import status
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser, FormParser
@@ -16,11 +18,28 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes,
 from apps.students.models import Student
 from apps.documents.models import Document, DocumentAnalysis
 from apps.reports.models import ConsultationReport
-from apps.reports.ai_module import (
-    analyze_document_with_ai,
-    get_mock_grade_analysis,
-    get_mock_comprehensive_analysis
-)
+from apps.documents.tasks import process_document_analysis
+
+
+def generate_student_code():
+    """동시에 여러 건이 등록되어도 겹치지 않는 학생 코드 (STU-시각-난수)"""
+    return f"STU-{timezone.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6].upper()}"
+
+
+def spool_upload(file):
+    """업로드 파일을 Document.file 경로 규칙대로 스토리지에 저장 → 저장된 이름"""
+    field = Document._meta.get_field('file')
+    return field.storage.save(field.generate_filename(None, file.name), file)
+
+
+def discard_registration(student, stored_name):
+    """
+    보상 처리: 등록 도중 실패 시 이미 커밋된 행과 저장된 파일 삭제
+    - 학생 삭제 시 문서/분석/리포트는 CASCADE로 함께 삭제
+    """
+    if student is not None:
+        Student.objects.filter(pk=student.pk).delete()
+    Document._meta.get_field('file').storage.delete(stored_name)
 
 
 # MVP 등록용 Serializer
@@ -52,7 +71,7 @@ class RegisterSaenggibuSerializer(serializers.Serializer):
         required=False,
         write_only=True,
         default=True,
-        help_text='목업 데이터 사용 여부 (기본값: true, AI 모듈 연결 시 false)'
+        help_text='(하위 호환용, 미사용) 실제 OCR 여부는 서버의 OCR_API_URL 설정으로 결정'
     )
 
 
@@ -64,10 +83,10 @@ class RegisterSaenggibuSerializer(serializers.Serializer):
 
     **처리 과정:**
     1. 학생 정보 생성 (이름, 계열, 희망 대학/학과)
-    2. 생기부 PDF 업로드
-    3. AI 분석 실행 (목업 또는 실제 AI 모듈)
-    4. 리포트 생성
-    5. 분석 결과 ID 반환
+    2. 생기부 PDF 업로드 (트랜잭션 밖에서 스토리지에 먼저 저장)
+    3. 분석 대기 행 + 작성중 리포트 생성 후 즉시 202 반환
+    4. Celery 태스크가 OCR → 파싱 → AI 분석 → 리포트 작성 수행
+       (progress_stage: QUEUED → RASTERIZE → OCR → PARSE → ANALYZE → DONE)
 
     **반환값:**
     - student_id: 생성된 학생 ID
@@ -76,6 +95,7 @@ class RegisterSaenggibuSerializer(serializers.Serializer):
     - report_id: 종합 리포트 ID
 
     **다음 단계:**
+    - GET /api/v1/documents/analyses/{analysis_id}/ → 분석 진행 상황 (status, progress_stage)
     - GET /api/v1/documents/{document_id}/latest-analysis/ → 생기부 분석 조회
     - GET /api/v1/grades/student-grade-analysis/?student_id={student_id} → 성적 분석 조회
     - GET /api/v1/reports/{report_id}/comprehensive-analysis/ → 종합 분석 조회
@@ -86,14 +106,17 @@ class RegisterSaenggibuSerializer(serializers.Serializer):
             'Success Response',
             value={
                 "success": True,
-                "message": "생기부 등록 및 분석이 완료되었습니다.",
+                "message": "생기부 등록이 완료되었습니다. 분석은 백그라운드에서 진행됩니다.",
                 "data": {
                     "student_id": "uuid",
                     "student_name": "홍길동",
                     "document_id": "uuid",
                     "analysis_id": "uuid",
                     "report_id": "uuid",
+                    "status": "PENDING",
+                    "progress_stage": "QUEUED",
                     "next_steps": {
+                        "분석_진행상황": "/api/v1/documents/analyses/{analysis_id}/",
                         "생기부_분석": "/api/v1/documents/{document_id}/latest-analysis/",
                         "성적_분석": "/api/v1/grades/student-grade-analysis/?student_id={student_id}",
                         "종합_분석": "/api/v1/reports/{report_id}/comprehensive-analysis/"
@@ -109,14 +132,13 @@ def register_saenggibu_onestop(request):
     """
     생기부 등록 원포인트 API (MVP용)
 
-    학생 생성 → 생기부 업로드 → AI 분석 → 리포트 생성을 한 번에 처리
+    학생 생성 → 생기부 업로드 → 분석 태스크 등록까지 처리하고 202 반환
     """
     # 1. 입력 검증
     name = request.data.get('name')
     major_track = request.data.get('major_track')
     desired_universities_str = request.data.get('desired_universities')
     file = request.FILES.get('file')
-    use_mock = request.data.get('use_mock', 'true').lower() == 'true'
 
     if not all([name, major_track, desired_universities_str, file]):
         return Response({
@@ -151,97 +173,87 @@ def register_saenggibu_onestop(request):
             'error': f'Invalid desired_universities format: {str(e)}'
         }, status=status.HTTP_400_BAD_REQUEST)
 
-    # 2. 트랜잭션으로 처리
+    # 2. PDF를 먼저 스토리지에 저장 (트랜잭션 밖 - 업로드 시간 동안 DB 연결/락 점유 안 함)
+    try:
+        stored_name = spool_upload(file)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': f'파일 저장 중 오류가 발생했습니다: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    # 3. 짧은 트랜잭션으로 행 생성 → 분석 태스크 등록
+    # 중간에 실패하면 보상 처리로 생성된 행과 저장된 파일 삭제
+    student = None
     try:
         with transaction.atomic():
-            # 2-1. 학생 생성
-            student_code = f"STU-{timezone.now().strftime('%Y%m%d%H%M%S')}"
+            # 3-1. 학생 + 생기부 문서 생성
             student = Student.objects.create(
                 name=name,
-                student_code=student_code,
+                student_code=generate_student_code(),
                 major_track=major_track,
                 desired_universities_text=desired_universities,
                 grade='3',  # 기본값 (추후 입력 받을 수 있음)
                 status='ACTIVE'
             )
-
-            # 2-2. 생기부 문서 메타데이터 생성 (S3 연결 전까지는 파일 저장 안 함)
-            # PDF 파일은 AI 모듈로만 전달하고, 메타데이터만 DB에 저장
             document = Document.objects.create(
                 student=student,
                 document_type='생기부',
                 title=f"{name} 생활기록부",
-                # file=None  # S3 연결 전까지는 파일 저장하지 않음
+                file=stored_name,
                 file_size=file.size,
                 mime_type=file.content_type,
                 status='PROCESSING'
             )
 
-            # 2-3. AI 분석 실행 (PDF 파일을 AI 모듈로 전달)
-            # PDF 파일을 메모리에서 AI 모듈로 직접 전달 (OCR + 분석)
-            # use_mock과 관계없이 항상 PDF 파일을 전달 (AI 모듈에서 처리 여부 결정)
-            saenggibu_analysis = analyze_document_with_ai(file)
-
-            # DocumentAnalysis 생성
+        with transaction.atomic():
+            # 3-2. 분석 대기 행 + 작성중 리포트 생성
+            # (진행 상황은 progress_stage로 조회, 리포트는 분석 완료 시 태스크가 채움)
             analysis = DocumentAnalysis.objects.create(
                 document=document,
                 student=student,
-                status='COMPLETED',
-                analysis_result=saenggibu_analysis,
-                started_at=timezone.now(),
-                completed_at=timezone.now()
+                status='PENDING',
+                progress_stage='QUEUED'
             )
-
-            # 문서 상태 업데이트
-            document.status = 'COMPLETED'
-            document.save()
-
-            # 2-4. 리포트 생성 (성적 분석 + 종합 분석)
-            if use_mock:
-                grade_analysis = get_mock_grade_analysis()
-                comprehensive_analysis = get_mock_comprehensive_analysis()
-            else:
-                # TODO: 실제 AI 모듈 호출
-                grade_analysis = get_mock_grade_analysis()
-                comprehensive_analysis = get_mock_comprehensive_analysis()
-
             report = ConsultationReport.objects.create(
                 student=student,
                 report_type='INITIAL',
                 title=f"{name} 초기 상담 리포트",
                 summary=f"{name} 학생의 생기부 분석 및 종합 컨설팅 리포트",
                 content="AI 분석을 통한 종합 리포트",
-                ai_insights={
-                    '성적분석': grade_analysis,
-                    '종합분석': comprehensive_analysis
-                },
-                university_analysis=comprehensive_analysis.get('수시카드', {}),
-                status='COMPLETED'
+                status='DRAFT'
             )
 
-            # 3. 응답 생성
-            return Response({
-                'success': True,
-                'message': '생기부 등록 및 분석이 완료되었습니다.',
-                'data': {
-                    'student_id': str(student.id),
-                    'student_name': student.name,
-                    'student_code': student.student_code,
-                    'major_track': student.major_track,
-                    'desired_universities': student.desired_universities_text,
-                    'document_id': str(document.id),
-                    'analysis_id': str(analysis.id),
-                    'report_id': str(report.id),
-                    'next_steps': {
-                        '생기부_분석': f'/api/v1/documents/{document.id}/latest-analysis/',
-                        '성적_분석': f'/api/v1/grades/student-grade-analysis/?student_id={student.id}',
-                        '종합_분석': f'/api/v1/reports/{report.id}/comprehensive-analysis/'
-                    }
-                }
-            }, status=status.HTTP_201_CREATED)
+        # 3-3. 분석 태스크 실행 (OCR → 파싱 → AI 분석 → 리포트, 열린 트랜잭션 없음)
+        process_document_analysis.delay(str(analysis.id), str(report.id))
 
     except Exception as e:
+        discard_registration(student, stored_name)
         return Response({
             'success': False,
             'error': f'처리 중 오류가 발생했습니다: {str(e)}'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    # 4. 응답 생성
+    return Response({
+        'success': True,
+        'message': '생기부 등록이 완료되었습니다. 분석은 백그라운드에서 진행됩니다.',
+        'data': {
+            'student_id': str(student.id),
+            'student_name': student.name,
+            'student_code': student.student_code,
+            'major_track': student.major_track,
+            'desired_universities': student.desired_universities_text,
+            'document_id': str(document.id),
+            'analysis_id': str(analysis.id),
+            'report_id': str(report.id),
+            'status': analysis.status,
+            'progress_stage': analysis.progress_stage,
+            'next_steps': {
+                '분석_진행상황': f'/api/v1/documents/analyses/{analysis.id}/',
+                '생기부_분석': f'/api/v1/documents/{document.id}/latest-analysis/',
+                '성적_분석': f'/api/v1/grades/student-grade-analysis/?student_id={student.id}',
+                '종합_분석': f'/api/v1/reports/{report.id}/comprehensive-analysis/'
+            }
+        }
+    }, status=status.HTTP_202_ACCEPTED)
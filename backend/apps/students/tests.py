@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.students import mvp_views
+from apps.students.models import Student
+from apps.documents.models import Document
+
+
+REGISTER_URL = '/api/v1/mvp/register-saenggibu/'
+
+
+def registration_payload(name='홍길동'):
+    return {
+        'name': name,
+        'major_track': 'SCIENCE',
+        'desired_universities': json.dumps([{'university': '서울대', 'department': '컴공'}]),
+        'file': SimpleUploadedFile('record.pdf', b'%PDF-1.4', content_type='application/pdf'),
+    }
+
+
+def stored_files(root):
+    return [os.path.join(d, f) for d, _, files in os.walk(root) for f in files]
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class RegisterSaenggibuCompensationTestCase(TestCase):
+    """원포인트 등록 실패 시 보상 처리"""
+
+    def test_dispatch_failure_removes_rows_and_file(self):
+        from django.conf import settings
+
+        with mock.patch.object(mvp_views, 'process_document_analysis') as task:
+            task.delay.side_effect = ConnectionError('broker unavailable')
+            response = APIClient().post(REGISTER_URL, registration_payload(), format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertFalse(Student.objects.exists())
+        self.assertFalse(Document.objects.exists())
+        self.assertEqual(stored_files(settings.MEDIA_ROOT), [])
+
+    def test_student_codes_do_not_collide(self):
+        """같은 초에 등록해도 학생 코드가 겹치지 않음"""
+        codes = {mvp_views.generate_student_code() for _ in range(100)}
+        self.assertEqual(len(codes), 100)
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class RegisterSaenggibuTransactionTestCase(TransactionTestCase):
+    """
+    느린 단계(파일 저장, 태스크 등록)는 열린 트랜잭션 밖에서 실행
+    - TestCase는 테스트 전체가 트랜잭션이라 TransactionTestCase 사용
+    """
+
+    def test_slow_steps_run_outside_transaction(self):
+        original_spool = mvp_views.spool_upload
+        in_atomic_block = {}
+
+        def spool(file):
+            in_atomic_block['spool_upload'] = connection.in_atomic_block
+            return original_spool(file)
+
+        def delay(*args):
+            in_atomic_block['delay'] = connection.in_atomic_block
+
+        with mock.patch.object(mvp_views, 'spool_upload', spool), \
+                mock.patch.object(mvp_views, 'process_document_analysis') as task:
+            task.delay.side_effect = delay
+            response = APIClient().post(REGISTER_URL, registration_payload(), format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(in_atomic_block, {'spool_upload': False, 'delay': False})
+
+    def test_dispatch_failure_discards_committed_rows(self):
+        from django.conf import settings
+
+        with mock.patch.object(
+            mvp_views, 'discard_registration', wraps=mvp_views.discard_registration
+        ) as discard, mock.patch.object(mvp_views, 'process_document_analysis') as task:
+            task.delay.side_effect = ConnectionError('broker unavailable')
+            response = APIClient().post(REGISTER_URL, registration_payload(), format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        discard.assert_called_once()
+        # 커밋된 학생 / 문서 행과 저장된 파일 모두 삭제
+        self.assertFalse(Student.objects.exists())
+        self.assertFalse(Document.objects.exists())
+        self.assertEqual(stored_files(settings.MEDIA_ROOT), [])
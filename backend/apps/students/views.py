@@ -2,6 +2,7 @@ from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from .models import Student, StudentDesiredUniversity
@@ -27,7 +28,9 @@ from .serializers import (
 )
 class StudentViewSet(viewsets.ModelViewSet):
     """학생 ViewSet"""
-    queryset = Student.objects.all()
+    queryset = Student.objects.select_related('high_school', 'consultant').prefetch_related(
+        Prefetch('desired_universities', queryset=StudentDesiredUniversity.objects.select_related('university'))
+    )
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['high_school', 'grade', 'consultant', 'status']
@@ -46,7 +49,7 @@ class StudentViewSet(viewsets.ModelViewSet):
     def desired_universities(self, request, pk=None):
         """학생의 지망 대학 목록"""
         student = self.get_object()
-        desired = student.desired_universities.all()
+        desired = student.desired_universities.select_related('university')
         serializer = StudentDesiredUniversitySerializer(desired, many=True)
 
         return Response({
@@ -111,7 +114,7 @@ class StudentViewSet(viewsets.ModelViewSet):
 )
 class StudentDesiredUniversityViewSet(viewsets.ModelViewSet):
     """학생 지망 대학 ViewSet"""
-    queryset = StudentDesiredUniversity.objects.all()
+    queryset = StudentDesiredUniversity.objects.select_related('university')
     serializer_class = StudentDesiredUniversitySerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
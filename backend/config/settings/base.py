@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 from datetime import timedelta
 import environ
@@ -10,6 +11,11 @@ env = environ.Env(DEBUG=(bool, False))
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 environ.Env.read_env(os.path.join(BASE_DIR, '.env'))
 
+# AI 모듈 (ai_module/ai) import 경로
+AI_MODULE_DIR = BASE_DIR / 'ai_module'
+if str(AI_MODULE_DIR) not in sys.path:
+    sys.path.append(str(AI_MODULE_DIR))
+
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = env('SECRET_KEY')
 
@@ -161,6 +167,40 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+# Cache - REDIS_URL이 있으면 Redis (gunicorn 워커 간 공유), 없으면 프로세스 로컬 메모리
+REDIS_URL = env('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'about-consulting',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'about-consulting',
+        }
+    }
+
+# 마스터 데이터(대학 / 고교 / 입학 전형) 캐시 유지 시간 - 변경 시 시그널로 무효화
+MASTER_DATA_CACHE_TIMEOUT = env.int('MASTER_DATA_CACHE_TIMEOUT', default=60 * 60 * 24)
+
+# 분석 결과 조회 API 응답 캐시 유지 시간 - 키에 분석 버전 / 수정 시각이 들어가 수정 시 자동 무효화
+ANALYSIS_RESPONSE_CACHE_TIMEOUT = env.int('ANALYSIS_RESPONSE_CACHE_TIMEOUT', default=60 * 60)
+
+# 저장된 OCR 결과 재파싱 (reparse_documents)
+REPARSE_CHUNK_SIZE = env.int('REPARSE_CHUNK_SIZE', default=200)
+
+# 생기부 OCR (CLOVA OCR) - 미설정 시 분석 태스크는 목업 결과 사용
+OCR_API_URL = env('OCR_API_URL', default='')
+OCR_SECRET_KEY = env('OCR_SECRET_KEY', default='')
+OCR_MAX_WORKERS = env.int('OCR_MAX_WORKERS', default=4)
+OCR_CACHE_DIR = env('OCR_CACHE_DIR', default='')
+
 # AWS S3 Settings
 USE_S3 = env.bool('USE_S3', default=False)
 
@@ -0,0 +1,87 @@
+"""
+응답 / 조회 결과 캐시
+
+[모델 단위 무효화] 마스터 데이터처럼 거의 바뀌지 않는 테이블용
+
+- 모델마다 상태 {'token', 'modified'}를 캐시에 둠
+  - token: 캐시 키에 포함 → 행이 바뀌면(touch_model_cache) 새 token으로 이전 키가 모두 무효
+  - modified: 마지막 변경 시각 (Last-Modified 응답 헤더)
+- 상태가 캐시에 없으면(최초 / 캐시 비움) DB의 최대 updated_at으로 새로 만듦
+- 행 변경 시 touch_model_cache는 post_save / post_delete 시그널에서 호출
+
+[버전 키 응답 캐시] 분석 결과처럼 큰 JSON을 반복 조회하는 API용
+- 키에 analysis_version / updated_at 등 버전 정보를 넣음 → 수정되면 새 키 (따로 지울 필요 없음)
+- 버전 정보는 대용량 컬럼을 제외한 가벼운 조회로 얻고, 캐시 미스일 때만 대용량 컬럼을 읽음
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils import timezone
+from rest_framework.response import Response
+
+
+def model_cache_label(model):
+    return f'model-cache:{model._meta.label_lower}'
+
+
+def model_cache_state(model):
+    """모델의 캐시 상태 {'token', 'modified'}"""
+    key = model_cache_label(model)
+    state = cache.get(key)
+    if state is None:
+        modified = model._default_manager.aggregate(modified=Max('updated_at'))['modified']
+        cache.add(key, {'token': uuid.uuid4().hex, 'modified': modified or timezone.now()}, None)
+        state = cache.get(key) or {'token': uuid.uuid4().hex, 'modified': timezone.now()}
+    return state
+
+
+def touch_model_cache(model):
+    """모델 행 변경 → 새 token (이전 키 전체 무효화)"""
+    cache.set(
+        model_cache_label(model),
+        {'token': uuid.uuid4().hex, 'modified': timezone.now()},
+        None
+    )
+
+
+def model_cache_key(models, *parts):
+    """모델들의 현재 token이 들어간 캐시 키"""
+    tokens = ':'.join(model_cache_state(model)['token'] for model in models)
+    return ':'.join(['model-cache', tokens, *map(str, parts)])
+
+
+def cached_for_models(models, parts, build, timeout=None):
+    """
+    read-through 캐시: 모델들의 token + parts 키로 조회, 없으면 build() 결과 저장
+    - build()는 pickle 가능한 값(시리얼라이저 data 등)을 반환해야 함
+    """
+    key = model_cache_key(models, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        cache.set(key, value, settings.MASTER_DATA_CACHE_TIMEOUT if timeout is None else timeout)
+    return value
+
+
+def version_stamp(value):
+    """updated_at 등 → 캐시 키용 문자열 (마이크로초까지)"""
+    return str(int(value.timestamp() * 1_000_000)) if value is not None else '-'
+
+
+def cached_response(key_parts, build, timeout=None):
+    """
+    버전 키 응답 캐시
+    - key_parts: 버전 정보가 들어간 키 조각 (예: ['latest-analysis', analysis.id, version, stamp])
+    - build(): 캐시 미스일 때 Response 생성 (data / status만 캐시)
+    """
+    key = ':'.join(['response', *map(str, key_parts)])
+    cached = cache.get(key)
+    if cached is None:
+        response = build()
+        cached = (response.data, response.status_code)
+        cache.set(key, cached, settings.ANALYSIS_RESPONSE_CACHE_TIMEOUT if timeout is None else timeout)
+
+    data, status_code = cached
+    return Response(data, status=status_code)
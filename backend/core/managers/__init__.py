@@ -0,0 +1,4 @@
+from .heavy_fields import HeavyFieldQuerySet
+from .versioned import VersionedQuerySet, VersionedModelMixin, claim_versions
+
+__all__ = ['HeavyFieldQuerySet', 'VersionedQuerySet', 'VersionedModelMixin', 'claim_versions']
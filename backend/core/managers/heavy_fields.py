@@ -0,0 +1,16 @@
+from django.db import models
+
+
+class HeavyFieldQuerySet(models.QuerySet):
+    """
+    대용량 컬럼(model.HEAVY_FIELDS) 지연 로딩
+
+    - defer_heavy(): HEAVY_FIELDS를 defer (include에 있는 컬럼만 읽음)
+    - 모델 기본 매니저 자체는 전체 컬럼을 읽음
+      (태스크/워커는 항상 결과 컬럼이 필요하고, 기본 매니저가 defer하면
+       역참조 매니저 접근마다 행 단위 추가 쿼리가 생김)
+    """
+
+    def defer_heavy(self, include=()):
+        heavy = [name for name in self.model.HEAVY_FIELDS if name not in include]
+        return self.defer(*heavy) if heavy else self
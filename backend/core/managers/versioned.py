@@ -0,0 +1,125 @@
+import hashlib
+
+from django.db import connections, models, router, transaction
+from django.db.models import Max, Q
+from django.db.models.sql import UpdateQuery
+from django.db.transaction import TransactionManagementError
+
+
+def version_lock_key(model, group):
+    """그룹 → PostgreSQL advisory lock 키 (signed 64bit)"""
+    digest = hashlib.blake2b(
+        f'{model._meta.db_table}:{group!r}'.encode(), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def normalize_version_group(model, group):
+    """그룹 값 튜플을 필드 타입으로 정규화 (문자열 UUID → UUID 등)"""
+    fields = [model._meta.get_field(name) for name in model.VERSION_GROUP]
+    return tuple(field.to_python(value) for field, value in zip(fields, group))
+
+
+def claim_versions(model, groups, flip_latest=True, using=None):
+    """
+    그룹별 다음 버전 번호 확보
+
+    - PostgreSQL: 그룹별 advisory lock(트랜잭션 범위)을 잡은 뒤
+      이전 버전 최신 해제(UPDATE)와 최대 버전 조회를 CTE 한 문장으로 실행
+      → 같은 그룹을 동시에 저장해도 락 순서대로 번호가 매겨짐
+    - 그 외 DB(SQLite 등)는 쓰기가 직렬화되므로 락 없이 UPDATE / 조회 두 문장
+    - 락은 커밋까지 유지되므로 반드시 행을 저장하는 트랜잭션 안에서 호출
+
+    Returns:
+        {그룹 값 튜플: 다음 버전}
+    """
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    if not connection.in_atomic_block:
+        raise TransactionManagementError('claim_versions는 트랜잭션 안에서 호출해야 합니다.')
+
+    groups = {normalize_version_group(model, group) for group in groups}
+    if not groups:
+        return {}
+
+    attnames = [model._meta.get_field(name).attname for name in model.VERSION_GROUP]
+    condition = Q()
+    for group in groups:
+        condition |= Q(**dict(zip(attnames, group)))
+
+    queryset = model._base_manager.using(using).filter(condition)
+    last_versions = (
+        queryset.order_by()
+        .values(*attnames)
+        .annotate(last_version=Max(model.VERSION_FIELD))
+        .values_list(*attnames, 'last_version')
+    )
+    latest_field = model.LATEST_FIELD if flip_latest else None
+
+    if connection.vendor == 'postgresql':
+        # 여러 그룹은 키 순서대로 잠가서 교착 방지
+        keys = sorted(version_lock_key(model, group) for group in groups)
+        select_sql, select_params = last_versions.query.get_compiler(using).as_sql()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_advisory_xact_lock(k) FROM unnest(%s::bigint[]) AS k', [keys]
+            )
+
+            if latest_field:
+                update = queryset.filter(**{latest_field: True}).query.chain(UpdateQuery)
+                update.add_update_values({latest_field: False})
+                update_sql, update_params = update.get_compiler(using).as_sql()
+                cursor.execute(
+                    f'WITH flipped AS ({update_sql}) {select_sql}',
+                    (*update_params, *select_params)
+                )
+            else:
+                cursor.execute(select_sql, select_params)
+            rows = cursor.fetchall()
+    else:
+        if latest_field:
+            queryset.filter(**{latest_field: True}).update(**{latest_field: False})
+        rows = list(last_versions)
+
+    found = {normalize_version_group(model, row[:-1]): row[-1] for row in rows}
+    return {group: (found.get(group) or 0) + 1 for group in groups}
+
+
+def version_group_of(obj):
+    return tuple(
+        getattr(obj, obj._meta.get_field(name).attname) for name in obj.VERSION_GROUP
+    )
+
+
+class VersionedQuerySet(models.QuerySet):
+    """
+    그룹별 버전 관리 (새 행 = 그룹 최대 버전 + 1, 이전 버전은 최신 해제)
+
+    모델에 선언:
+    - VERSION_GROUP: 버전을 매기는 그룹 필드 (예: ('student', 'semester', 'exam_type'))
+    - VERSION_FIELD: 버전 번호 필드
+    - LATEST_FIELD: 최신 여부 필드 (없으면 None)
+
+    bulk_create처럼 save()를 거치지 않는 경로는 claim_versions로 번호를 받아서 사용
+    """
+
+    def claim_versions(self, groups, flip_latest=True):
+        return claim_versions(self.model, groups, flip_latest=flip_latest, using=self.db)
+
+
+class VersionedModelMixin:
+    """새 행 save() 시 그룹의 다음 버전 번호를 매김 (VersionedQuerySet 참고)"""
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        latest = getattr(self, self.LATEST_FIELD) if self.LATEST_FIELD else False
+
+        with transaction.atomic(using=using):
+            group = version_group_of(self)
+            versions = claim_versions(type(self), [group], flip_latest=latest, using=using)
+            setattr(self, self.VERSION_FIELD, versions[normalize_version_group(type(self), group)])
+            super().save(*args, **kwargs)
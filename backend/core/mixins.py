@@ -0,0 +1,111 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+from core.cache import model_cache_state
+
+
+def parse_field_list(value):
+    """'a,b , c' → ('a', 'b', 'c')"""
+    return tuple(name.strip() for name in (value or '').split(',') if name.strip())
+
+
+class HeavyFieldsViewSetMixin:
+    """
+    대용량 JSON 컬럼(model.HEAVY_FIELDS) 응답 정책
+
+    - list: 항상 제외 (메타데이터만)
+    - retrieve 등 heavy_field_detail_actions: ?include=a,b 로 요청한 컬럼만 포함
+    - ?fields=a,b 로 응답 필드 선택 (id는 항상 포함)
+    - 그 외 액션(수정 등)은 정책을 적용하지 않음
+    """
+    heavy_field_list_actions = ('list',)
+    heavy_field_detail_actions = ('retrieve',)
+
+    def uses_heavy_field_policy(self):
+        return self.action in self.heavy_field_list_actions + self.heavy_field_detail_actions
+
+    def included_heavy_fields(self):
+        if self.request is None or self.action not in self.heavy_field_detail_actions:
+            return ()
+        include = parse_field_list(self.request.query_params.get('include'))
+        return tuple(name for name in self.queryset.model.HEAVY_FIELDS if name in include)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.uses_heavy_field_policy():
+            queryset = queryset.defer_heavy(include=self.included_heavy_fields())
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.uses_heavy_field_policy() and self.request is not None:
+            context['include_heavy'] = self.included_heavy_fields()
+            context['fields'] = parse_field_list(self.request.query_params.get('fields'))
+        return context
+
+
+class HeavyFieldsSerializerMixin:
+    """
+    HeavyFieldsViewSetMixin이 넘긴 context에 따라 응답 필드 제거
+    - context에 include_heavy가 없으면(직접 생성한 경우) 기존과 동일
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        include_heavy = self.context.get('include_heavy')
+        if include_heavy is not None:
+            for name in self.Meta.model.HEAVY_FIELDS:
+                if name not in include_heavy:
+                    fields.pop(name, None)
+
+        requested = self.context.get('fields')
+        if requested:
+            fields = {
+                name: field for name, field in fields.items()
+                if name in requested or name == 'id'
+            }
+
+        return fields
+
+
+class CachedListViewSetMixin:
+    """
+    list 응답 캐시 + 조건부 요청 (마스터 데이터용, core.cache 참고)
+
+    - ETag: list_cache_models의 token + 요청 경로(쿼리 포함)
+    - Last-Modified: list_cache_models 중 가장 최근 변경 시각
+    - If-None-Match / If-Modified-Since가 맞으면 304, 아니면 캐시된 list 결과 (없으면 계산 후 저장)
+    - 행이 바뀌면 시그널에서 touch_model_cache → token이 바뀌어 ETag / 캐시 키가 함께 무효
+    """
+    list_cache_models = None
+
+    def get_list_cache_models(self):
+        return self.list_cache_models or (self.queryset.model,)
+
+    def list(self, request, *args, **kwargs):
+        states = [model_cache_state(model) for model in self.get_list_cache_models()]
+        tokens = ':'.join(state['token'] for state in states)
+        path_hash = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        etag = quote_etag(f'{tokens}:{path_hash}')
+        last_modified = int(max(state['modified'] for state in states).timestamp())
+
+        headers = {'ETag': etag, 'Last-Modified': http_date(last_modified)}
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            for name, value in headers.items():
+                not_modified[name] = value
+            return not_modified
+
+        key = f'list-cache:{self.basename}:{tokens}:{path_hash}'
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, settings.MASTER_DATA_CACHE_TIMEOUT)
+
+        return Response(data, headers=headers)